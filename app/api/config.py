@@ -185,6 +185,8 @@ async def update_config(
             
             # Invalidate Cache
             cache.delete(f"profile:{current_user['id']}")
+            if updates.active_strategy is not None:
+                bot_manager.invalidate_user_strategy(current_user["id"])
             
             # If the bot is running for this user, it might need restart (handled by BotManager/Runner logic on next cycle or restart)
             if updates.auto_execute_signals is not None:
@@ -2,8 +2,9 @@
 # Broadcasts events to all connected clients AND registered handlers
 
 import asyncio
+import json
 import logging
-from typing import Set, Dict, Callable, List
+from typing import Set, Dict, Callable, List, Optional
 from fastapi import WebSocket, WebSocketDisconnect
 from app.core.serializers import ensure_json_serializable
 
@@ -62,35 +63,58 @@ class EventManager:
         1. All connected WebSocket clients
         2. All registered event handlers for this event type
         """
-        event_type = message.get("type")
+        await self.broadcast_batch([message])
+    
+    async def broadcast_batch(self, messages: List[Dict]):
+        """
+        Broadcast several related events in one pass.
+
+        Handlers and clients still receive every event individually and in
+        order (one WebSocket frame per event); each event is JSON-encoded
+        once and the frame is shared by every client it targets.
+        """
+        if not messages:
+            return
         
         # Call registered event handlers first (like Telegram)
-        if event_type and event_type in self.event_handlers:
-            handler_tasks = []
-            for handler in self.event_handlers[event_type]:
-                handler_tasks.append(self._call_handler(handler, message))
-            
-            if handler_tasks:
-                await asyncio.gather(*handler_tasks, return_exceptions=True)
+        handler_tasks = []
+        for event in messages:
+            for handler in self.event_handlers.get(event.get("type"), []):
+                handler_tasks.append(self._call_handler(handler, event))
+        if handler_tasks:
+            await asyncio.gather(*handler_tasks, return_exceptions=True)
         
         # Then broadcast to WebSocket clients
-        if self.active_connections:
-            ws_tasks = []
-            target_account = message.get("account_id")
-            
-            # Iterate over a copy to avoid "dictionary changed size during iteration"
-            for connection, user_id in list(self.active_connections.items()):
-                # Only send to authenticated users
-                if user_id is None:
-                    continue
-                # Filter: If message has account_id, only send to matching user
-                if target_account and user_id != target_account:
+        if not self.active_connections:
+            return
+        
+        ws_tasks = []
+        # Event index -> encoded frame (None if the event failed to encode)
+        encoded_frames: Dict[int, Optional[str]] = {}
+        # Iterate over a copy to avoid "dictionary changed size during iteration"
+        for connection, user_id in list(self.active_connections.items()):
+            # Only send to authenticated users
+            if user_id is None:
+                continue
+            texts = []
+            for index, event in enumerate(messages):
+                # Filter: If an event has account_id, only send it to the matching user
+                if event.get("account_id") and event.get("account_id") != user_id:
                     continue
-                    
-                ws_tasks.append(self._send_message(connection, message))
-            
-            if ws_tasks:
-                await asyncio.gather(*ws_tasks, return_exceptions=True)
+                if index not in encoded_frames:
+                    try:
+                        encoded_frames[index] = self._encode(event)
+                    except (TypeError, ValueError) as e:
+                        logger.error(f"Error encoding WebSocket message: {type(e).__name__}: {e}")
+                        encoded_frames[index] = None
+                text = encoded_frames[index]
+                if text is not None:
+                    texts.append(text)
+            if texts:
+                ws_tasks.append(self._send_texts(connection, texts))
+        
+        if ws_tasks:
+            await asyncio.gather(*ws_tasks, return_exceptions=True)
     
     async def _call_handler(self, handler: Callable, event: Dict):
         """Call an event handler safely"""
@@ -103,12 +127,32 @@ class EventManager:
         except Exception as e:
             logger.error(f"Error in event handler: {e}", exc_info=True)
     
+    @staticmethod
+    def _encode(message: Dict) -> str:
+        """JSON-encode a frame the way WebSocket.send_json does"""
+        # Serialize message to handle datetime and other non-JSON types
+        return json.dumps(ensure_json_serializable(message), separators=(",", ":"), ensure_ascii=False)
+    
     async def _send_message(self, websocket: WebSocket, message: Dict):
         """Send message to a single WebSocket client safely"""
         try:
-            # Serialize message to handle datetime and other non-JSON types
-            serialized_message = ensure_json_serializable(message)
-            await websocket.send_json(serialized_message)
+            text = self._encode(message)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Error encoding WebSocket message: {type(e).__name__}: {e}")
+            return
+        await self._send_text(websocket, text)
+    
+    async def _send_texts(self, websocket: WebSocket, texts: List[str]):
+        """Send frames to one client in order, stopping if it disconnects"""
+        for text in texts:
+            if websocket not in self.active_connections:
+                return
+            await self._send_text(websocket, text)
+    
+    async def _send_text(self, websocket: WebSocket, text: str):
+        """Send an already-encoded frame to a single WebSocket client safely"""
+        try:
+            await websocket.send_text(text)
         except (WebSocketDisconnect, RuntimeError) as e:
             # Client disconnected or socket closed
             # Remove silently or with debug log to avoid cluttering error logs
@@ -2,7 +2,7 @@ from typing import Dict, Optional, List
 from app.bot.runner import BotRunner, BotStatus
 import logging
 import asyncio
-from datetime import datetime
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -20,9 +20,12 @@ class BotManager:
         self.max_concurrent_bots = max_concurrent_bots
         # Rise/Fall tasks: user_id -> asyncio.Task
         self._rf_tasks: Dict[str, asyncio.Task] = {}
-        # Rise/Fall metadata for status reporting
-        self._rf_start_times: Dict[str, datetime] = {}
+        # Rise/Fall metadata for status reporting (start times are time.monotonic())
+        self._rf_start_times: Dict[str, float] = {}
         self._rf_stakes: Dict[str, float] = {}
+        # Profile strategy cache: user_id -> (strategy_name, expires_at monotonic)
+        self._strategy_cache: Dict[str, tuple] = {}
+        self._strategy_cache_ttl = 60.0
         
     def _get_user_lock(self, user_id: str) -> asyncio.Lock:
         """Get or create a lock for a specific user (for concurrent start protection)"""
@@ -36,7 +39,7 @@ class BotManager:
         If strategy/risk_manager are provided, updates existing bot or creates new one.
         """
         if user_id not in self._bots:
-            logger.info(f"Initializing new bot instance for user {user_id}")
+            logger.info("Initializing new bot instance for user %s", user_id)
             self._bots[user_id] = BotRunner(
                 account_id=user_id,
                 strategy=strategy,
@@ -45,7 +48,7 @@ class BotManager:
         else:
             # Update strategy and risk_manager if provided (for strategy switching)
             if strategy is not None:
-                logger.info(f"Updating strategy for existing bot instance: {user_id}")
+                logger.info("Updating strategy for existing bot instance: %s", user_id)
                 self._bots[user_id].strategy = strategy
                 if hasattr(strategy, "get_strategy_name"):
                     try:
@@ -55,7 +58,7 @@ class BotManager:
                 if hasattr(self._bots[user_id], "_sync_strategy_scope"):
                     self._bots[user_id]._sync_strategy_scope()
             if risk_manager is not None:
-                logger.info(f"Updating risk manager for existing bot instance: {user_id}")
+                logger.info("Updating risk manager for existing bot instance: %s", user_id)
                 self._bots[user_id].risk_manager = risk_manager
             
         return self._bots[user_id]
@@ -86,8 +89,13 @@ class BotManager:
                 )
                 
                 if current_strategy != requested_strategy:
-                    logger.info(f"Strategy switch detected for {user_id}: {current_strategy} -> {requested_strategy}")
-                    logger.info(f"Stopping old bot to restart with new strategy...")
+                    logger.info(
+                        "Strategy switch detected for %s: %s -> %s",
+                        user_id,
+                        current_strategy,
+                        requested_strategy,
+                    )
+                    logger.info("Stopping old bot to restart with new strategy...")
                     await self._bots[user_id].stop_bot()
                     del self._bots[user_id]
                     
@@ -98,15 +106,17 @@ class BotManager:
                     # then either sees stale entry or no entry, and launches second rf_run()
                     # while first is still alive and trading.
                     # ─────────────────────────────────────────────────────────────────────
-                    if user_id in self._rf_tasks and not self._rf_tasks[user_id].done():
+                    orphaned_task = self._rf_tasks.get(user_id)
+                    if orphaned_task is not None and not orphaned_task.done():
                         logger.warning(
-                            f"[BotManager] Cancelling orphaned RF task during strategy switch for {user_id}"
+                            "[BotManager] Cancelling orphaned RF task during strategy switch for %s",
+                            user_id,
                         )
                         from risefallbot import rf_bot
                         rf_bot.stop(user_id)
-                        self._rf_tasks[user_id].cancel()
+                        orphaned_task.cancel()
                         try:
-                            await self._rf_tasks[user_id]
+                            await orphaned_task
                         except asyncio.CancelledError:
                             pass
                     self._rf_tasks.pop(user_id, None)
@@ -160,10 +170,17 @@ class BotManager:
             )
             if resolved_strategy != active_strategy:
                 logger.warning(
-                    f"Requested strategy '{active_strategy}' resolved to '{resolved_strategy}' for {user_id}"
+                    "Requested strategy '%s' resolved to '%s' for %s",
+                    active_strategy,
+                    resolved_strategy,
+                    user_id,
                 )
-            logger.info(f"✅ Loaded strategy for {user_id}: {resolved_strategy}")
-            logger.info(f"📋 Strategy class: {strategy_class.__name__}, Risk Manager: {risk_manager_class.__name__}")
+            logger.info("✅ Loaded strategy for %s: %s", user_id, resolved_strategy)
+            logger.info(
+                "📋 Strategy class: %s, Risk Manager: %s",
+                strategy_class.__name__,
+                risk_manager_class.__name__,
+            )
             
             # Create or get bot with injected instances
             bot = self.get_bot(user_id, strategy=strategy_instance, risk_manager=risk_manager_instance)
@@ -218,8 +235,8 @@ class BotManager:
             # Compute uptime from tracked start time
             uptime = None
             start_time = self._rf_start_times.get(user_id)
-            if start_time and is_running:
-                uptime = int((datetime.now() - start_time).total_seconds())
+            if start_time is not None and is_running:
+                uptime = int(time.monotonic() - start_time)
             
             stake = self._rf_stakes.get(user_id, 0)
             
@@ -272,15 +289,14 @@ class BotManager:
                     to_remove.append(user_id)
             
             for user_id in to_remove:
-                logger.info(f"Cleaning up inactive bot instance for user {user_id}")
+                logger.info("Cleaning up inactive bot instance for user %s", user_id)
                 del self._bots[user_id]
             
             if to_remove:
-                logger.info(f"Cleaned up {len(to_remove)} inactive bot instances")
+                logger.info("Cleaned up %s inactive bot instances", len(to_remove))
                 # Clean up user locks too
                 for user_id in to_remove:
-                    if user_id in self._user_locks:
-                        del self._user_locks[user_id]
+                    self._user_locks.pop(user_id, None)
         
         # ─────────────────────────────────────────────────────────────────────
         # FIX 3: Clean up completed RF tasks
@@ -290,10 +306,10 @@ class BotManager:
         # ─────────────────────────────────────────────────────────────────────
         rf_to_remove = [uid for uid, task in self._rf_tasks.items() if task.done()]
         for user_id in rf_to_remove:
-            del self._rf_tasks[user_id]
+            self._rf_tasks.pop(user_id, None)
             self._rf_start_times.pop(user_id, None)
             self._rf_stakes.pop(user_id, None)
-            logger.info(f"[BotManager] Cleaned up completed RF task for {user_id}")
+            logger.info("[BotManager] Cleaned up completed RF task for %s", user_id)
     
     async def _get_user_strategy(self, user_id: str) -> str:
         """
@@ -305,6 +321,13 @@ class BotManager:
         Returns:
             Strategy name (defaults to 'Conservative' if not set)
         """
+        cached = self._strategy_cache.get(user_id)
+        if cached is not None:
+            strategy, expires_at = cached
+            if time.monotonic() < expires_at:
+                return strategy
+            self._strategy_cache.pop(user_id, None)
+
         try:
             from app.core.supabase import supabase
             
@@ -314,17 +337,27 @@ class BotManager:
                 .single() \
                 .execute()
             
+            strategy = 'Conservative'
             if result.data:
                 from strategy_registry import normalize_strategy_name
-                return normalize_strategy_name(
+                strategy = normalize_strategy_name(
                     result.data.get('active_strategy', 'Conservative')
                 )
             
-            return 'Conservative'
+            # Only successful lookups are cached; failures fall through to retry
+            self._strategy_cache[user_id] = (
+                strategy,
+                time.monotonic() + self._strategy_cache_ttl,
+            )
+            return strategy
         
         except Exception as e:
-            logger.warning(f"Failed to load user strategy for {user_id}: {e}")
+            logger.warning("Failed to load user strategy for %s: %s", user_id, e)
             return 'Conservative'
+
+    def invalidate_user_strategy(self, user_id: str) -> None:
+        """Drop the cached profile strategy for a user (call after profile updates)"""
+        self._strategy_cache.pop(user_id, None)
     
     
     # ------------------------------------------------------------------ #
@@ -335,8 +368,10 @@ class BotManager:
         """Launch rf_bot.run() as a managed asyncio task for this user."""
         import os
         logger.info(
-            f"[BotManager] _start_risefall_bot called | "
-            f"pid={os.getpid()} manager_id={id(self)} user={user_id}"
+            "[BotManager] _start_risefall_bot called | pid=%s manager_id=%s user=%s",
+            os.getpid(),
+            id(self),
+            user_id,
         )
 
         # ─────────────────────────────────────────────────────────────────────
@@ -347,14 +382,18 @@ class BotManager:
         # This prevents cancelling mid-lifecycle which was the root cause
         # of unrecorded trades.
         # ─────────────────────────────────────────────────────────────────────
-        if user_id in self._rf_tasks:
-            existing_task = self._rf_tasks[user_id]
+        # Keep the entry registered until the old task has exited so status
+        # checks and concurrent starts still see it as running.
+        existing_task = self._rf_tasks.get(user_id)
+        if existing_task is not None:
             if not existing_task.done():
                 from risefallbot import rf_bot, rf_config
                 timeout = getattr(rf_config, "RF_GRACEFUL_SHUTDOWN_TIMEOUT", 15)
                 logger.warning(
-                    f"[BotManager] ⚠️ RF task already exists for {user_id} — "
-                    f"requesting graceful stop (timeout={timeout}s)"
+                    "[BotManager] ⚠️ RF task already exists for %s — "
+                    "requesting graceful stop (timeout=%ss)",
+                    user_id,
+                    timeout,
                 )
                 rf_bot.stop(user_id)  # signal this user's loop to stop
 
@@ -362,13 +401,14 @@ class BotManager:
                 try:
                     await asyncio.wait_for(asyncio.shield(existing_task), timeout=timeout)
                     logger.info(
-                        f"[BotManager] ✅ Old RF task exited gracefully for {user_id}"
+                        "[BotManager] ✅ Old RF task exited gracefully for %s", user_id
                     )
                 except asyncio.TimeoutError:
                     # Lifecycle didn't finish in time — hard-cancel
                     logger.warning(
-                        f"[BotManager] ⏱️ Graceful wait timed out for {user_id} — "
-                        f"hard-cancelling (in-flight trade will get emergency DB record)"
+                        "[BotManager] ⏱️ Graceful wait timed out for %s — "
+                        "hard-cancelling (in-flight trade will get emergency DB record)",
+                        user_id,
                     )
                     existing_task.cancel()
                     try:
@@ -376,9 +416,9 @@ class BotManager:
                     except asyncio.CancelledError:
                         pass
                     logger.info(
-                        f"[BotManager] ✅ Old RF task hard-cancelled for {user_id}"
+                        "[BotManager] ✅ Old RF task hard-cancelled for %s", user_id
                     )
-            del self._rf_tasks[user_id]
+            self._forget_rf_task(user_id, existing_task)
 
         # ─────────────────────────────────────────────────────────────────────
         # CROSS-PROCESS LOCK: Attempt to reserve a session in Supabase
@@ -388,8 +428,9 @@ class BotManager:
         from risefallbot.rf_bot import _acquire_session_lock
         if not await _acquire_session_lock(user_id):
             logger.error(
-                f"[BotManager] ⛔ Cannot start RF bot for {user_id} — "
-                f"DB session lock denied (another process holds it)"
+                "[BotManager] ⛔ Cannot start RF bot for %s — "
+                "DB session lock denied (another process holds it)",
+                user_id,
             )
             return {
                 "success": False,
@@ -403,12 +444,15 @@ class BotManager:
 
         task = asyncio.create_task(rf_run(stake=stake, api_token=api_token, user_id=user_id))
         self._rf_tasks[user_id] = task
-        self._rf_start_times[user_id] = datetime.now()
+        self._rf_start_times[user_id] = time.monotonic()
         self._rf_stakes[user_id] = stake or 0
 
         logger.info(
-            f"✅ Rise/Fall bot started for user {user_id} | "
-            f"stake=${stake} pid={os.getpid()} manager_id={id(self)}"
+            "✅ Rise/Fall bot started for user %s | stake=$%s pid=%s manager_id=%s",
+            user_id,
+            stake,
+            os.getpid(),
+            id(self),
         )
 
         # Broadcast start event
@@ -427,6 +471,11 @@ class BotManager:
             "status": "running"
         }
 
+    def _forget_rf_task(self, user_id: str, task: asyncio.Task):
+        """Drop user_id's RF task entry unless a newer task has replaced it."""
+        if self._rf_tasks.get(user_id) is task:
+            del self._rf_tasks[user_id]
+
     async def _stop_risefall_bot(self, user_id: str) -> dict:
         """Stop the Rise/Fall asyncio task for this user."""
         task = self._rf_tasks.get(user_id)
@@ -447,10 +496,10 @@ class BotManager:
 
         try:
             await asyncio.wait_for(asyncio.shield(task), timeout=timeout)
-            logger.info(f"[BotManager] ✅ RF task exited gracefully for {user_id}")
+            logger.info("[BotManager] ✅ RF task exited gracefully for %s", user_id)
         except asyncio.TimeoutError:
             logger.warning(
-                f"[BotManager] ⏱️ Graceful stop timed out for {user_id} — hard-cancelling"
+                "[BotManager] ⏱️ Graceful stop timed out for %s — hard-cancelling", user_id
             )
             task.cancel()
             try:
@@ -458,7 +507,7 @@ class BotManager:
             except asyncio.CancelledError:
                 pass
 
-        del self._rf_tasks[user_id]
+        self._forget_rf_task(user_id, task)
         self._rf_start_times.pop(user_id, None)
         self._rf_stakes.pop(user_id, None)
 
@@ -466,7 +515,7 @@ class BotManager:
         from risefallbot.rf_bot import _release_session_lock
         await _release_session_lock(user_id)
 
-        logger.info(f"🛑 Rise/Fall bot stopped for user {user_id}")
+        logger.info("🛑 Rise/Fall bot stopped for user %s", user_id)
 
         # Broadcast stop event
         await event_manager.broadcast({
@@ -486,19 +535,19 @@ class BotManager:
         """
         Stop all running bots (e.g. on server shutdown)
         """
-        logger.info(f"Stopping all {len(self._bots)} active bots...")
+        logger.info("Stopping all %s active bots...", len(self._bots))
         tasks = []
         for user_id, bot in self._bots.items():
             if bot.is_running:
                 tasks.append(bot.stop_bot())
         
         # Also stop Rise/Fall tasks
-        for user_id, task in list(self._rf_tasks.items()):
+        for user_id in list(self._rf_tasks):
+            task = self._rf_tasks.pop(user_id)
             if not task.done():
                 from risefallbot import rf_bot
                 rf_bot.stop(user_id)
                 task.cancel()
-            del self._rf_tasks[user_id]
         
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
@@ -9,10 +9,13 @@ Manages the lifecycle of the trading bot with multi-asset support
 """
 
 import asyncio
+import json
 import logging
 import re
-from datetime import datetime
-from typing import Optional, Dict, List, Set
+import time
+from collections import Counter, deque
+from datetime import datetime, timezone
+from typing import Optional, Counter as CounterType, Deque, Dict, List, Set
 from enum import Enum
 
 # Import existing bot modules
@@ -25,28 +28,91 @@ from app.bot.events import event_manager
 from app.bot.telegram_bridge import telegram_bridge
 from app.core.context import user_id_var, bot_type_var
 from app.services.trades_service import UserTradesService
-from functools import wraps
+from functools import lru_cache, wraps
 
 
+_KNOWN_BOT_TYPES = frozenset({"scalping", "conservative", "risefall"})
+
+
+@lru_cache(maxsize=16)
 def _strategy_to_bot_type(strategy_name: Optional[str]) -> str:
     value = (strategy_name or "").strip().lower()
-    if value == "scalping":
-        return "scalping"
-    if value == "conservative":
-        return "conservative"
-    if value == "risefall":
-        return "risefall"
-    return "system"
+    return value if value in _KNOWN_BOT_TYPES else "system"
+
+
+@lru_cache(maxsize=None)
+def _default_strategy_cls():
+    """Resolve the default strategy class once (imported lazily to avoid cycles)."""
+    from conservative_strategy import ConservativeStrategy
+
+    return ConservativeStrategy
+
+
+@lru_cache(maxsize=None)
+def _default_risk_manager_cls(scalping: bool):
+    """Resolve the default risk manager class for a multiplier strategy once."""
+    if scalping:
+        from scalping_risk_manager import ScalpingRiskManager
+
+        return ScalpingRiskManager
+    from conservative_risk_manager import ConservativeRiskManager
+
+    return ConservativeRiskManager
+
+
+_STEP_TS_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Monotonic "never happened" marker for log-throttle timestamps
+_NEVER = float("-inf")
+
+# How long stop_bot waits after re-cancelling a bot task before abandoning it
+_FORCED_CANCEL_TIMEOUT = 5.0
+
+
+@lru_cache(maxsize=32)
+def _decision_label(decision: str) -> str:
+    """Human-readable fallback message for a decision code (e.g. no_trade)."""
+    return decision.replace("_", " ")
+
+
+def _has_event_audience(event_type: str) -> bool:
+    """True when a WebSocket client or a registered handler would receive event_type."""
+    return bool(event_manager.active_connections) or bool(event_manager.event_handlers.get(event_type))
+
+
+# [epoch second, ISO string] of the last _now_iso() result
+_now_iso_cache: list = [None, ""]
+
+
+def _now_iso() -> str:
+    """UTC wall-clock timestamp (second resolution) for broadcast payloads.
+
+    The string is rebuilt at most once per second; events emitted within
+    the same second share it.
+    """
+    second = int(time.time())
+    if second != _now_iso_cache[0]:
+        _now_iso_cache[1] = datetime.fromtimestamp(second, timezone.utc).isoformat()
+        _now_iso_cache[0] = second
+    return _now_iso_cache[1]
 
 
 def with_user_context(func):
     @wraps(func)
     async def wrapper(self, *args, **kwargs):
+        bot_type = _strategy_to_bot_type(self._get_strategy_name())
+        # Already in this runner's context (e.g. _run_bot, whose task copied
+        # start_bot's context): nothing to set or reset.
+        if (
+            (not self.account_id or user_id_var.get() == self.account_id)
+            and bot_type_var.get() == bot_type
+        ):
+            return await func(self, *args, **kwargs)
         user_token = None
         bot_token = None
         if self.account_id:
             user_token = user_id_var.set(self.account_id)
-        bot_token = bot_type_var.set(_strategy_to_bot_type(self._get_strategy_name()))
+        bot_token = bot_type_var.set(bot_type)
         try:
             return await func(self, *args, **kwargs)
         finally:
@@ -60,6 +126,20 @@ from utils import setup_logger
 
 logger = setup_logger()
 
+# Level name -> bound logger method, for _cycle_step dispatch.
+_LEVEL_FNS = {
+    "debug": logger.debug,
+    "info": logger.info,
+    "warning": logger.warning,
+    "error": logger.error,
+}
+_LEVEL_NOS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+}
+
 class BotStatus(str, Enum):
     """Bot status enumeration"""
     STOPPED = "stopped"
@@ -76,6 +156,14 @@ class BotRunner:
     - First qualifying signal locks the system
     - Monitors active trades across all assets
     """
+
+    # Invariant fields of every bot_decision event
+    _DECISION_BASE = {"type": "bot_decision", "bot": "multiplier"}
+    # Full Top-Down requirement; the tuple keeps display order for messages
+    _REQUIRED_TIMEFRAMES = ('1m', '5m', '1h', '4h', '1d', '1w')
+    _REQUIRED_TF_SET = frozenset(_REQUIRED_TIMEFRAMES)
+    # last_status_log key suffix for per-contract broker-status-miss throttling
+    _STATUS_MISS_SUFFIX = ":status_miss"
     
     def __init__(self, api_token: Optional[str] = None, account_id: Optional[str] = None,
                  strategy = None, risk_manager = None):
@@ -93,6 +181,9 @@ class BotRunner:
         self.task: Optional[asyncio.Task] = None
         self.status = BotStatus.STOPPED
         self.start_time: Optional[datetime] = None
+        # Formatted once per start for get_status; uptime uses the monotonic clock
+        self._start_time_iso: Optional[str] = None
+        self._start_monotonic: Optional[float] = None
         self.error_message: Optional[str] = None
         
         # Identity
@@ -106,11 +197,17 @@ class BotRunner:
         self.data_fetcher: Optional[DataFetcher] = None
         self.trade_engine: Optional[TradeEngine] = None
         
+        # (strategy object, resolved name); see _get_strategy_name
+        self._strategy_name_cache: tuple = (None, None)
+        # (strategy object, {timeframe: "data_<tf>"}); see _get_strategy_kwarg_names
+        self._strategy_kwarg_names_cache: tuple = (None, None)
+        # (strategy name, symbol) -> "[Strategy][SYMBOL]" tag for step lines
+        self._log_prefix_cache: Dict[tuple, str] = {}
+
         # Strategy and risk manager injection (NEW)
         if strategy is None:
             # Default to conservative strategy
-            from conservative_strategy import ConservativeStrategy
-            self.strategy = ConservativeStrategy()
+            self.strategy = _default_strategy_cls()()
         else:
             self.strategy = strategy
         
@@ -137,20 +234,29 @@ class BotRunner:
         
         # Scanning statistics
         self.scan_count = 0
-        self.signals_by_symbol: Dict[str, int] = {symbol: 0 for symbol in self.symbols}
-        self.errors_by_symbol: Dict[str, int] = {symbol: 0 for symbol in self.symbols}
+        self.signals_by_symbol: CounterType[str] = Counter(dict.fromkeys(self.symbols, 0))
+        self.errors_by_symbol: CounterType[str] = Counter(dict.fromkeys(self.symbols, 0))
         self.scalping_total_symbol_checks: int = 0
         self.scalping_signals_generated: int = 0
         self.scalping_gate_counters: Dict[str, int] = {}
         
         # Logging control
-        self.last_status_log: Dict[str, Dict] = {} # {symbol: {'msg': str, 'time': datetime}}
+        self.last_status_log: Dict[str, Dict] = {} # {symbol: {'msg': str, 'time': monotonic float}}
         # Per-contract active monitoring progress logs.
         self._active_progress_key_prefix = "active:"
-        # Structured decision event throttling cache
-        self._decision_log_state: Dict[str, Dict] = {}
+        # Structured decision event throttling cache: key -> (fingerprint, monotonic ts)
+        self._decision_log_state: Dict[str, tuple] = {}
+        self._decision_state_max: int = 512
+        # Throttled-event counts per key, reported on the next emitted event
+        self._decision_suppressed: Dict[str, int] = {}
+        self._decision_state_ttl: float = 600.0
         # Periodic DB-to-runtime recovery for persisted open trades.
-        self._last_active_trade_recovery_at: datetime = datetime.min
+        self._last_active_trade_recovery_at: float = _NEVER  # monotonic
+        # Active-trade progress log cadence (bound once; read every monitor tick).
+        self._progress_log_interval: int = max(
+            int(getattr(config, "ACTIVE_TRADE_PROGRESS_LOG_INTERVAL_SECONDS", 15)),
+            1,
+        )
         # Track consecutive broker-status misses per contract for fallback reconciliation.
         self._active_status_miss_counts: Dict[str, int] = {}
         # Protect trade execution path when symbol scans run concurrently.
@@ -159,6 +265,48 @@ class BotRunner:
         self._cycle_claim_mutex: asyncio.Lock = asyncio.Lock()
         self._cycle_signal_claimed: bool = False
         self._cycle_winner_symbol: Optional[str] = None
+        # Negative-result cache: symbols whose data feed keeps missing
+        # timeframes are parked until a monotonic deadline.
+        self._missing_tf_strikes: Dict[str, int] = {}
+        self._symbol_skip_until: Dict[str, float] = {}
+        self._missing_tf_strike_limit: int = 3
+        self._symbol_park_seconds: float = 300.0
+        # Cap concurrent per-symbol scans so a wide symbol list cannot flood
+        # the data-fetcher socket with simultaneous candle requests.
+        self._scan_semaphore: asyncio.BoundedSemaphore = asyncio.BoundedSemaphore(
+            max(int(getattr(config, "MAX_SCAN_CONCURRENCY", 4)), 1)
+        )
+        # Startup handshake: _run_bot signals readiness or early failure.
+        self._ready_event: asyncio.Event = asyncio.Event()
+        self._error_event: asyncio.Event = asyncio.Event()
+        # Set by stop_bot; idle waits in the main loop return on it immediately.
+        self._stop_event: asyncio.Event = asyncio.Event()
+        # Memoized statistics for get_status polling: (monotonic ts, stats)
+        self._stats_cache: tuple = (0.0, None)
+        self._stats_cache_ttl: float = 1.0
+        # Fingerprint of the last statistics payload sent to WebSocket clients
+        self._last_stats_fingerprint: Optional[str] = None
+        # Outstanding fire-and-forget Telegram notifications
+        self._notify_tasks: Set[asyncio.Task] = set()
+        # Outstanding background trade saves (see _persist_in_background)
+        self._persist_tasks: Set[asyncio.Task] = set()
+        # Outstanding bot_decision broadcasts, capped so a stalled client sheds events
+        self._decision_tasks: Set[asyncio.Task] = set()
+        self._decision_backlog_max: int = 256
+        # Telegram error coalescing per category key: the first error is sent
+        # at once, repeats within _error_alert_window are summarized in one
+        # follow-up alert. key -> {"sent_at", "pending", "last", "timer"}
+        self._error_alert_window: float = 30.0
+        self._error_alerts: Dict[str, Dict] = {}
+        # Telegram circuit breaker: after _notify_failure_limit timeouts/errors
+        # within _notify_failure_window seconds, drop notifications until
+        # _notify_down_until (monotonic) instead of queueing more stuck sends.
+        self._notify_timeout: float = 2.0
+        self._notify_failure_limit: int = 3
+        self._notify_failure_window: float = 60.0
+        self._notify_failures: Deque[float] = deque(maxlen=self._notify_failure_limit)
+        self._notify_down_until: float = 0.0
+        self._notify_expired: Set[asyncio.Task] = set()
         
         # Telegram bridge
         self.telegram_bridge = telegram_bridge
@@ -166,15 +314,43 @@ class BotRunner:
         # Sync per-strategy market scope on init.
         self._sync_strategy_scope()
 
+    @property
+    def status(self) -> BotStatus:
+        return self._status
+
+    @status.setter
+    def status(self, value: BotStatus) -> None:
+        # Keep the serialized form alongside the enum for status payloads.
+        self._status = value
+        self._status_str = value.value
+
     def _get_strategy_name(self) -> str:
         """Resolve strategy name safely for structured decision events."""
+        strategy = self.strategy
+        cached_for, cached_name = self._strategy_name_cache
+        if cached_name is not None and cached_for is strategy:
+            return cached_name
         try:
-            if self.strategy and hasattr(self.strategy, "get_strategy_name"):
-                return self.strategy.get_strategy_name()
+            if strategy and hasattr(strategy, "get_strategy_name"):
+                name = strategy.get_strategy_name()
+                # Keyed on the strategy object so direct reassignment
+                # (e.g. BotManager.get_bot) cannot serve a stale name.
+                self._strategy_name_cache = (strategy, name)
+                return name
         except Exception:
             pass
         return getattr(self, "active_strategy", "Unknown") or "Unknown"
 
+    def _log_prefix(self, symbol: str) -> str:
+        """Cached "[Strategy][SYMBOL]" tag for eagerly built log lines."""
+        name = self._get_strategy_name()
+        key = (name, symbol)
+        prefix = self._log_prefix_cache.get(key)
+        if prefix is None:
+            prefix = f"[{name}][{symbol}]"
+            self._log_prefix_cache[key] = prefix
+        return prefix
+
     def _is_scalping_strategy(self) -> bool:
         """Return True when active strategy is scalping."""
         return (self._get_strategy_name() or "").strip().lower() == "scalping"
@@ -307,8 +483,20 @@ class BotRunner:
             "scalping_gate_counters": dict(self.scalping_gate_counters),
         }
 
+    def _get_strategy_kwarg_names(self) -> Dict[str, str]:
+        """Map each required timeframe to its analyze() keyword, once per strategy object"""
+        strategy = self.strategy
+        cached_for, names = self._strategy_kwarg_names_cache
+        if names is None or cached_for is not strategy:
+            names = {tf: f"data_{tf}" for tf in strategy.get_required_timeframes()}
+            self._strategy_kwarg_names_cache = (strategy, names)
+        return names
+
     def _sync_strategy_scope(self) -> None:
         """Bind runner symbol universe/config to currently injected strategy."""
+        self._strategy_name_cache = (None, None)
+        self._strategy_kwarg_names_cache = (None, None)
+        self._log_prefix_cache.clear()
         if self.strategy and hasattr(self.strategy, "get_symbols"):
             try:
                 self.symbols = list(self.strategy.get_symbols())
@@ -325,22 +513,18 @@ class BotRunner:
         else:
             self.asset_config = dict(config.ASSET_CONFIG)
 
-        # Keep symbol counters aligned with active symbol universe.
-        self.signals_by_symbol = {symbol: self.signals_by_symbol.get(symbol, 0) for symbol in self.symbols}
-        self.errors_by_symbol = {symbol: self.errors_by_symbol.get(symbol, 0) for symbol in self.symbols}
+        # Keep symbol counters aligned with active symbol universe; skip the
+        # rebuild when the universe is unchanged (repeat syncs on restart).
+        if list(self.signals_by_symbol) != self.symbols:
+            self.signals_by_symbol = Counter({symbol: self.signals_by_symbol.get(symbol, 0) for symbol in self.symbols})
+        if list(self.errors_by_symbol) != self.symbols:
+            self.errors_by_symbol = Counter({symbol: self.errors_by_symbol.get(symbol, 0) for symbol in self.symbols})
 
     def _init_risk_manager_for_strategy(self):
         """Instantiate default risk manager matching the active strategy."""
         strategy_name = (self._get_strategy_name() or "Conservative").strip().lower()
-        if strategy_name == "scalping":
-            from scalping_risk_manager import ScalpingRiskManager
-
-            return ScalpingRiskManager(user_id=self.account_id)
-
         # Multiplier default remains conservative.
-        from conservative_risk_manager import ConservativeRiskManager
-
-        return ConservativeRiskManager(user_id=self.account_id)
+        return _default_risk_manager_cls(strategy_name == "scalping")(user_id=self.account_id)
 
     @staticmethod
     def _parse_trade_datetime(value: Optional[object]) -> Optional[datetime]:
@@ -672,11 +856,8 @@ class BotRunner:
         if not self.account_id or not self.risk_manager:
             return 0
 
-        now = datetime.now()
-        if (
-            self._last_active_trade_recovery_at != datetime.min
-            and (now - self._last_active_trade_recovery_at).total_seconds() < max(min_interval_seconds, 1)
-        ):
+        now = time.monotonic()
+        if now - self._last_active_trade_recovery_at < max(min_interval_seconds, 1):
             return 0
         self._last_active_trade_recovery_at = now
 
@@ -810,24 +991,26 @@ class BotRunner:
                         pnl,
                     )
                     try:
-                        result_for_notify = dict(reconciled)
-                        result_for_notify.setdefault("contract_id", contract_id)
-                        result_for_notify.setdefault("symbol", persisted_trade.get("symbol"))
-                        result_for_notify.setdefault("user_id", self.account_id)
-                        result_for_notify.setdefault("strategy_type", self._get_strategy_name())
-                        result_for_notify.setdefault(
-                            "execution_reason",
-                            (
+                        # Defaults first, so keys already on the trade win
+                        result_for_notify = {
+                            "contract_id": contract_id,
+                            "symbol": persisted_trade.get("symbol"),
+                            "user_id": self.account_id,
+                            "strategy_type": self._get_strategy_name(),
+                            "execution_reason": (
                                 persisted_trade.get("execution_reason")
                                 or "Trade tracking restored after restart; broker reported contract already closed"
                             ),
-                        )
-                        await self.telegram_bridge.notify_trade_closed(
+                            **reconciled,
+                        }
+                        # Background send: startup reconciliation must not wait
+                        # on Telegram between contracts
+                        self._notify(self.telegram_bridge.notify_trade_closed(
                             result_for_notify,
                             pnl,
                             normalized_status,
                             strategy_type=self._get_strategy_name(),
-                        )
+                        ))
                     except Exception as notify_error:
                         logger.warning(
                             "[%s][SYSTEM] Failed to send startup-close Telegram notification for %s: %s",
@@ -854,34 +1037,42 @@ class BotRunner:
         step: int,
         total_steps: int,
         message: str,
+        *args,
         emoji: str = "\u2139\ufe0f",
         level: str = "info",
     ) -> None:
-        """Rise/Fall-style lifecycle log line for multiplier strategies."""
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        strategy = self._get_strategy_name()
-        line = f"[{strategy}][{symbol}] STEP {step}/{total_steps} | {ts} | {emoji} {message}"
-        getattr(logger, level)(line)
+        """Rise/Fall-style lifecycle log line for multiplier strategies.
+
+        ``args`` are %-interpolated into ``message`` only when the level is enabled.
+        """
+        if not logger.isEnabledFor(_LEVEL_NOS.get(level, logging.INFO)):
+            return
+        if args:
+            message = message % args
+        ts = time.strftime(_STEP_TS_FORMAT)
+        line = f"{self._log_prefix(symbol)} STEP {step}/{total_steps} | {ts} | {emoji} {message}"
+        _LEVEL_FNS.get(level, _LEVEL_FNS["info"])(line)
 
     def _should_emit_decision(
         self, key: str, fingerprint: str, min_interval_seconds: int = 20
     ) -> bool:
         """Throttle repeated decision events for cleaner frontend timelines."""
-        now = datetime.now()
+        now = time.monotonic()
         last = self._decision_log_state.get(key)
-        if not last:
-            self._decision_log_state[key] = {"fingerprint": fingerprint, "time": now}
-            return True
-
-        last_fingerprint = last.get("fingerprint")
-        last_time = last.get("time", datetime.min)
-        elapsed = (now - last_time).total_seconds()
-
-        if fingerprint != last_fingerprint or elapsed >= min_interval_seconds:
-            self._decision_log_state[key] = {"fingerprint": fingerprint, "time": now}
-            return True
+        if last is not None:
+            last_fingerprint, last_time = last
+            # Throttled path is read-only.
+            if fingerprint == last_fingerprint and now - last_time < min_interval_seconds:
+                return False
 
-        return False
+        if last is None and len(self._decision_log_state) >= self._decision_state_max:
+            # New key on a full table: drop entries past any throttle window.
+            horizon = now - self._decision_state_ttl
+            self._decision_log_state = {
+                k: v for k, v in self._decision_log_state.items() if v[1] >= horizon
+            }
+        self._decision_log_state[key] = (fingerprint, now)
+        return True
 
     async def _broadcast_decision(
         self,
@@ -897,33 +1088,58 @@ class BotRunner:
         """
         Broadcast structured bot decision events for frontend consumption.
         """
-        fingerprint = f"{phase}|{decision}|{reason or ''}"
-        if throttle_key and not self._should_emit_decision(
-            throttle_key, fingerprint, min_interval_seconds=min_interval_seconds
-        ):
+        # Nobody listening (no UI open): skip throttling and payload building
+        if not _has_event_audience("bot_decision"):
             return
+        suppressed = 0
+        if throttle_key:
+            fingerprint = f"{phase}|{decision}|{reason or ''}"
+            if not self._should_emit_decision(
+                throttle_key, fingerprint, min_interval_seconds=min_interval_seconds
+            ):
+                self._decision_suppressed[throttle_key] = self._decision_suppressed.get(throttle_key, 0) + 1
+                return
+            suppressed = self._decision_suppressed.pop(throttle_key, 0)
 
         payload = {
-            "type": "bot_decision",
-            "bot": "multiplier",
+            **self._DECISION_BASE,
             "strategy": self._get_strategy_name(),
             "symbol": symbol,
             "phase": phase,
             "decision": decision,
             "severity": severity,
-            "message": reason or decision.replace("_", " "),
-            "timestamp": datetime.now().isoformat(),
+            "message": reason or _decision_label(decision),
+            "timestamp": _now_iso(),
             "account_id": self.account_id,
+            # Optional keys are spliced in so the dict is built in one pass
+            **({"reason": reason} if reason else {}),
+            **({"details": details} if details else {}),
+            **({"suppressed_count": suppressed} if suppressed else {}),
         }
-        if reason:
-            payload["reason"] = reason
-        if details:
-            payload["details"] = details
+        if suppressed:
+            logger.debug(
+                "[%s][%s] %s repeat decision events suppressed for %s",
+                self._get_strategy_name(),
+                symbol,
+                suppressed,
+                throttle_key,
+            )
+
+        # Sent in the background so a slow WebSocket consumer cannot hold up
+        # the scan that produced the decision; shed load past the backlog cap.
+        if len(self._decision_tasks) >= self._decision_backlog_max:
+            logger.debug("Decision event dropped: %s broadcasts pending", len(self._decision_tasks))
+            return
+        task = asyncio.create_task(self._send_decision(payload))
+        self._decision_tasks.add(task)
+        task.add_done_callback(self._decision_tasks.discard)
 
+    @staticmethod
+    async def _send_decision(payload: Dict) -> None:
         try:
             await event_manager.broadcast(payload)
         except Exception as e:
-            logger.debug(f"Decision event broadcast skipped due to error: {e}")
+            logger.debug("Decision event broadcast skipped due to error: %s", e)
     
     @with_user_context
     async def start_bot(
@@ -941,7 +1157,7 @@ class BotRunner:
             return {
                 "success": False,
                 "message": "Bot is already running",
-                "status": self.status.value
+                "status": self._status_str
             }
         
         # Update token if provided
@@ -967,7 +1183,7 @@ class BotRunner:
             return {
                 "success": False,
                 "message": "Start failed: Stake amount not configured. Please set your stake in Settings.",
-                "status": self.status.value
+                "status": self._status_str
             }
             
         current_stake = self.user_stake
@@ -983,8 +1199,8 @@ class BotRunner:
                 f"Startup requested for {self.account_id or 'default user'}",
                 emoji="\U0001F680",
             )
-            logger.info(f"[{self._get_strategy_name()}][SYSTEM] \U0001F4DA Symbols: {', '.join(self.symbols)}")
-            logger.info(f"[{self._get_strategy_name()}][SYSTEM] \U0001F4B5 Stake: ${current_stake}")
+            logger.info("[%s][SYSTEM] \U0001F4DA Symbols: %s", self._get_strategy_name(), ', '.join(self.symbols))
+            logger.info("[%s][SYSTEM] \U0001F4B5 Stake: $%s", self._get_strategy_name(), current_stake)
             logger.info(
                 "[%s][SYSTEM] %s",
                 self._get_strategy_name(),
@@ -994,59 +1210,64 @@ class BotRunner:
             self.error_message = None
             self.state.update_status("starting")
             
-            # Load historical trades from DB
+            # Load historical trades from DB (blocking Supabase call, kept off the loop)
             try:
-                history = UserTradesService.get_user_trades(self.account_id, limit=100)
+                history = await asyncio.to_thread(UserTradesService.get_user_trades, self.account_id, limit=100)
                 if history:
                     # Update state with history 
                     # Note: We need to adapt the format slightly if needed, but BotState expects dicts
                     # We might want to populate stats based on this history too
                     self.state.trade_history = history
-                    logger.info(f"[{self._get_strategy_name()}][SYSTEM] \U0001F5C2\ufe0f Loaded {len(history)} historical trades")
+                    logger.info("[%s][SYSTEM] \U0001F5C2\ufe0f Loaded %s historical trades", self._get_strategy_name(), len(history))
             except Exception as e:
-                logger.warning(f"[{self._get_strategy_name()}][SYSTEM] \u26A0\ufe0f Failed to load history: {e}")
+                logger.warning("[%s][SYSTEM] \u26A0\ufe0f Failed to load history: %s", self._get_strategy_name(), e)
 
             # Create bot task
+            self._ready_event.clear()
+            self._error_event.clear()
+            self._stop_event.clear()
             self.task = asyncio.create_task(self._run_bot())
             
             # Wait for bot to fully initialize (network handshakes can exceed 10s).
             max_wait = max(int(getattr(config, "BOT_STARTUP_TIMEOUT_SECONDS", 25)), 5)
-            for _ in range(max_wait):
-                await asyncio.sleep(1)
-                
-                if self.is_running:
-                    self._cycle_step("SYSTEM", 6, 6, "Bot started successfully", emoji="\u2705")
-                    await event_manager.broadcast({
-                        "type": "bot_status",
-                        "status": "running",
-                        "message": f"Multi-asset bot started - scanning {len(self.symbols)} symbols",
-                        "symbols": self.symbols,
-                        "account_id": self.account_id
-                    })
-                    
-                    return {
-                        "success": True,
-                        "message": f"Bot started - scanning {len(self.symbols)} symbols",
-                        "status": self.status.value,
-                        "symbols": self.symbols
-                    }
-                
-                if self.status == BotStatus.ERROR:
-                    error_msg = self.error_message or "Bot initialization failed"
-                    raise Exception(error_msg)
+            ready_wait = asyncio.create_task(self._ready_event.wait())
+            error_wait = asyncio.create_task(self._error_event.wait())
+            try:
+                await asyncio.wait(
+                    {ready_wait, error_wait, self.task},
+                    timeout=max_wait,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            finally:
+                ready_wait.cancel()
+                error_wait.cancel()
+            
+            if self.is_running:
+                self._cycle_step("SYSTEM", 6, 6, "Bot started successfully", emoji="\u2705")
+                # bot_status "running" is broadcast once by _run_bot (with balance)
+                return {
+                    "success": True,
+                    "message": f"Bot started - scanning {len(self.symbols)} symbols",
+                    "status": self._status_str,
+                    "symbols": self.symbols
+                }
+            
+            if self.status == BotStatus.ERROR:
+                error_msg = self.error_message or "Bot initialization failed"
+                raise Exception(error_msg)
 
-                if self.task and self.task.done():
-                    task_error = None
-                    try:
-                        task_error = self.task.exception()
-                    except asyncio.CancelledError:
-                        task_error = asyncio.CancelledError()
+            if self.task and self.task.done():
+                task_error = None
+                try:
+                    task_error = self.task.exception()
+                except asyncio.CancelledError:
+                    task_error = asyncio.CancelledError()
 
-                    if task_error:
-                        raise Exception(f"Bot startup task failed: {task_error}")
+                if task_error:
+                    raise Exception(f"Bot startup task failed: {task_error}")
+
+                raise Exception(self.error_message or "Bot startup task exited before running")
 
-                    raise Exception(self.error_message or "Bot startup task exited before running")
-            
             raise Exception(f"Bot startup timeout ({max_wait}s)")
                 
         except Exception as e:
@@ -1065,7 +1286,7 @@ class BotRunner:
             return {
                 "success": False,
                 "message": f"Failed to start bot: {e}",
-                "status": self.status.value
+                "status": self._status_str
             }
     
     @with_user_context
@@ -1078,7 +1299,7 @@ class BotRunner:
             return {
                 "success": False,
                 "message": "Bot is not running",
-                "status": self.status.value
+                "status": self._status_str
             }
         
         try:
@@ -1086,53 +1307,86 @@ class BotRunner:
             self.status = BotStatus.STOPPING
             self.state.update_status("stopping")
             
-            # Cancel the bot task
+            # Cancel the bot task with a tiered deadline so a hung cleanup
+            # (e.g. a stuck notification) cannot block the caller forever.
+            self._stop_event.set()
             if self.task:
                 self.task.cancel()
+                grace = max(float(getattr(config, "BOT_SHUTDOWN_GRACE_SECONDS", 10)), 0.0)
                 try:
-                    await self.task
+                    await asyncio.wait_for(asyncio.shield(self.task), timeout=grace)
                 except asyncio.CancelledError:
-                    pass
+                    # The bot task ending cancelled is the expected outcome;
+                    # anything else means stop_bot itself was cancelled.
+                    if not self.task.done():
+                        raise
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        "[%s][SYSTEM] Bot task did not stop within %.1fs, re-cancelling",
+                        self._get_strategy_name(),
+                        grace,
+                    )
+                    self.task.cancel()
+                    # asyncio.wait never awaits the task's cancellation, so a
+                    # task that swallows CancelledError cannot hang shutdown.
+                    done, _ = await asyncio.wait({self.task}, timeout=_FORCED_CANCEL_TIMEOUT)
+                    if self.task not in done:
+                        logger.error(
+                            "[%s][SYSTEM] Bot task still running after forced cancel, abandoning it",
+                            self._get_strategy_name(),
+                        )
             
-            # Disconnect bot components
-            if self.data_fetcher:
-                await self.data_fetcher.disconnect()
-            if self.trade_engine:
-                await self.trade_engine.disconnect()
+            # Disconnect bot components concurrently, bounded by a deadline
+            disconnects = [
+                component.disconnect()
+                for component in (self.data_fetcher, self.trade_engine)
+                if component
+            ]
+            if disconnects:
+                try:
+                    await asyncio.wait_for(
+                        asyncio.gather(*disconnects, return_exceptions=True),
+                        timeout=5,
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        "[%s][SYSTEM] Component disconnect timed out",
+                        self._get_strategy_name(),
+                    )
             
             self.is_running = False
             self.status = BotStatus.STOPPED
             self.task = None
             self.start_time = None
-            
-            self.task = None
-            self.start_time = None
+            self._start_time_iso = None
+            self._start_monotonic = None
             
             self.state.update_status("stopped")
             self._cycle_step("SYSTEM", 3, 3, "Bot stopped successfully", emoji="\u2705")
             
-            # Notify Telegram with stats
-            try:
-                stats = self.state.get_statistics()
-                stats['scan_summary'] = {
-                    'total_scans': self.scan_count,
-                    'signals_by_symbol': self.signals_by_symbol
-                }
-                await self.telegram_bridge.notify_bot_stopped(stats)
-            except:
-                pass
+            # Let in-flight trade notifications land before the stop summary
+            await self._flush_notifications()
             
-            await event_manager.broadcast({
-                "type": "bot_status",
-                "status": "stopped",
-                "message": "Multi-asset bot stopped successfully",
-                "account_id": self.account_id
-            })
+            # Notify Telegram with stats and WebSocket clients concurrently
+            stats = self.state.get_statistics()
+            stats['scan_summary'] = {
+                'total_scans': self.scan_count,
+                'signals_by_symbol': self.signals_by_symbol
+            }
+            await self._send_concurrently(
+                self.telegram_bridge.notify_bot_stopped(stats),
+                event_manager.broadcast({
+                    "type": "bot_status",
+                    "status": "stopped",
+                    "message": "Multi-asset bot stopped successfully",
+                    "account_id": self.account_id
+                }),
+            )
             
             return {
                 "success": True,
                 "message": "Bot stopped successfully",
-                "status": self.status.value
+                "status": self._status_str
             }
             
         except Exception as e:
@@ -1140,7 +1394,7 @@ class BotRunner:
             return {
                 "success": False,
                 "message": f"Error stopping bot: {e}",
-                "status": self.status.value
+                "status": self._status_str
             }
     
     async def restart_bot(self) -> dict:
@@ -1148,22 +1402,22 @@ class BotRunner:
         Restart the trading bot
         Returns status dict
         """
-        logger.info(f"[{self._get_strategy_name()}][SYSTEM] \u267B\ufe0f Restart requested")
+        logger.info("[%s][SYSTEM] \u267B\ufe0f Restart requested", self._get_strategy_name())
         
         if self.is_running:
             stop_result = await self.stop_bot()
             if not stop_result["success"]:
                 return stop_result
-            
-            await asyncio.sleep(3)
+            # stop_bot returns only after the task is awaited and components
+            # are disconnected, so no settle delay is needed here.
         
         return await self.start_bot()
     
     def get_status(self) -> dict:
         """Get current bot status with multi-asset info"""
         uptime = None
-        if self.start_time:
-            uptime = int((datetime.now() - self.start_time).total_seconds())
+        if self._start_monotonic is not None:
+            uptime = int(time.monotonic() - self._start_monotonic)
         
         # Get active trade info from risk manager
         active_trade_info = None
@@ -1174,23 +1428,22 @@ class BotRunner:
             # For now, let's call it and assume I fix it to use active_trades[0]
             active_trade_info = self.risk_manager.get_active_trade_info()
         
+        strategy_name = self._get_strategy_name()
+        active_trades = self.state.active_trades
         return {
-            "status": self.status.value,
+            "status": self._status_str,
             "is_running": self.is_running,
-            "active_strategy": self._get_strategy_name(),
+            "active_strategy": strategy_name,
             "uptime_seconds": uptime,
-            "start_time": self.start_time.isoformat() if self.start_time else None,
-            "error_message": self.error_message,
+            "start_time": self._start_time_iso,
             "error_message": self.error_message,
             "balance": self.state.balance,
-            "active_trades": self.state.active_trades,
-            "active_trades_count": len(self.state.active_trades),
-            "active_trades": self.state.active_trades,
-            "active_trades_count": len(self.state.active_trades),
-            "statistics": self.state.get_statistics(),
+            "active_trades": active_trades,
+            "active_trades_count": len(active_trades),
+            "statistics": self._get_cached_statistics(),
             "config": {
                 "stake": self.user_stake if self.user_stake else config.FIXED_STAKE,
-                "strategy": self._get_strategy_name(),
+                "strategy": strategy_name,
                 "auto_execute_signals": self.auto_execute_signals,
             },
             "multi_asset": {
@@ -1203,12 +1456,216 @@ class BotRunner:
             }
         }
     
+    def _notify(self, coro) -> None:
+        """
+        Run a best-effort Telegram notification in the background so the
+        trading loop never waits on Telegram network I/O.
+
+        While the circuit breaker is open the notification is dropped
+        without being scheduled.
+        """
+        if time.monotonic() < self._notify_down_until:
+            coro.close()
+            return
+        task = asyncio.create_task(coro)
+        self._notify_tasks.add(task)
+        timer = asyncio.get_running_loop().call_later(self._notify_timeout, self._expire_notify, task)
+        task.add_done_callback(lambda _task: timer.cancel())
+        task.add_done_callback(self._on_notify_done)
+    
+    def _expire_notify(self, task: asyncio.Task) -> None:
+        """Timer callback: cancel a notification stuck past _notify_timeout"""
+        if task.done():
+            return
+        self._notify_expired.add(task)
+        task.cancel()
+    
+    def _record_notify_failure(self) -> None:
+        """Note a failed notification; open the circuit breaker on repeated failures"""
+        now = time.monotonic()
+        self._notify_failures.append(now)
+        if (
+            len(self._notify_failures) >= self._notify_failure_limit
+            and now - self._notify_failures[0] <= self._notify_failure_window
+        ):
+            self._notify_failures.clear()
+            self._notify_down_until = now + self._notify_failure_window
+            logger.warning(
+                "[%s][SYSTEM] Telegram failing repeatedly, pausing notifications for %.0fs",
+                self._get_strategy_name(),
+                self._notify_failure_window,
+            )
+    
+    def _on_notify_done(self, task: asyncio.Task) -> None:
+        self._notify_tasks.discard(task)
+        if task in self._notify_expired:
+            self._notify_expired.discard(task)
+            self._record_notify_failure()
+            logger.warning(
+                "[%s][SYSTEM] Telegram notification timed out after %.0fs",
+                self._get_strategy_name(),
+                self._notify_timeout,
+            )
+            return
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self._record_notify_failure()
+            logger.warning(
+                "[%s][SYSTEM] Telegram notification failed: %s",
+                self._get_strategy_name(),
+                error,
+            )
+            return
+        self._notify_failures.clear()
+    
+    def _notify_error(self, key: str, message: str) -> None:
+        """
+        Send a Telegram error alert, coalescing repeats of the same category.
+
+        The first error for a key goes out immediately; further errors within
+        _error_alert_window are counted and sent as one summary when the
+        window closes.
+        """
+        now = time.monotonic()
+        alert = self._error_alerts.get(key)
+        if alert is None or (not alert["pending"] and now - alert["sent_at"] >= self._error_alert_window):
+            self._error_alerts[key] = {"sent_at": now, "pending": 0, "last": message, "timer": None}
+            self._send_error_alert(message)
+            return
+        alert["pending"] += 1
+        alert["last"] = message
+        if alert["timer"] is None:
+            delay = max(alert["sent_at"] + self._error_alert_window - now, 0.0)
+            alert["timer"] = asyncio.get_running_loop().call_later(delay, self._flush_error_alert, key)
+    
+    def _flush_error_alert(self, key: str) -> None:
+        """Send the coalesced summary for key, if any errors are pending"""
+        alert = self._error_alerts.get(key)
+        if not alert or not alert["pending"]:
+            return
+        if alert["timer"] is not None:
+            alert["timer"].cancel()
+        count = alert["pending"]
+        message = alert["last"]
+        if count > 1:
+            message = f"{message} (repeated {count}x in the last {self._error_alert_window:.0f}s)"
+        alert.update(sent_at=time.monotonic(), pending=0, timer=None)
+        self._send_error_alert(message)
+    
+    def _send_error_alert(self, message: str) -> None:
+        """Hand one error alert to the background Telegram notifier"""
+        try:
+            self._notify(self.telegram_bridge.notify_error(message))
+        except Exception as notify_error:
+            logger.debug("Telegram notification failed: %s", notify_error)
+    
+    async def _restore_open_positions(self, strategy_name: str) -> None:
+        """Startup: detect broker positions, then reconcile persisted open trades"""
+        try:
+            has_existing = await self.risk_manager.check_for_existing_positions(self.trade_engine)
+            if has_existing:
+                logger.warning("[%s][SYSTEM] \U0001F512 Existing position detected on startup", strategy_name)
+        except Exception as e:
+            logger.warning("[%s][SYSTEM] \u26A0\ufe0f Existing-position check failed: %s", strategy_name, e)
+
+        # Reconcile persisted open trades so restart resumes monitoring
+        # and stale DB rows are closed when broker already settled them.
+        try:
+            await self._reconcile_active_trades_on_startup()
+        except Exception as e:
+            logger.warning("[%s][SYSTEM] \u26A0\ufe0f Active-trade reconciliation failed: %s", strategy_name, e)
+
+    async def _fetch_initial_balance(self, strategy_name: str):
+        """Startup: fetch and record the account balance (0.0 on failure)"""
+        try:
+            balance = await self.data_fetcher.get_balance()
+            if balance:
+                self.state.update_balance(balance)
+                logger.info("[%s][SYSTEM] \U0001F4B0 Initial balance: $%.2f", strategy_name, balance)
+            return balance
+        except Exception as e:
+            logger.warning("[%s][SYSTEM] \u26A0\ufe0f Initial balance fetch failed: %s", strategy_name, e)
+            return 0.0
+
+    async def _send_concurrently(self, *sends) -> None:
+        """Await independent Telegram/WebSocket sends together; log failures."""
+        results = await asyncio.gather(*sends, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.debug("Notification send failed: %s", result)
+
+    async def _flush_notifications(self, timeout: float = 5.0) -> None:
+        """Wait (bounded) for outstanding background trade saves and notifications"""
+        # Saves first: a failed save queues its own Telegram alert
+        if self._persist_tasks:
+            await asyncio.wait(set(self._persist_tasks), timeout=timeout)
+        for key in list(self._error_alerts):
+            self._flush_error_alert(key)
+        if self._notify_tasks:
+            await asyncio.wait(set(self._notify_tasks), timeout=timeout)
+        if self._decision_tasks:
+            await asyncio.wait(set(self._decision_tasks), timeout=timeout)
+    
+    def _persist_in_background(self, symbol: str, contract_id, status: str, result: Dict) -> None:
+        """Save a closed trade without holding up the scan that executed it"""
+        task = asyncio.create_task(self._persist_trade_result(symbol, contract_id, status, result))
+        self._persist_tasks.add(task)
+        task.add_done_callback(self._persist_tasks.discard)
+
+    async def _persist_trade_result(self, symbol: str, contract_id, status: str, result: Dict) -> None:
+        """Save a closed trade to Supabase off the event loop; alert Telegram on failure"""
+        try:
+            saved = await asyncio.to_thread(UserTradesService.save_trade, self.account_id, result)
+            if saved:
+                logger.info("[%s][%s] \U0001F9FE Trade persisted to DB: %s", self._get_strategy_name(), symbol, contract_id)
+                return
+            logger.error(
+                "[%s][%s] \u274C DB persistence failed for contract %s (no data returned)",
+                self._get_strategy_name(),
+                symbol,
+                contract_id,
+            )
+            alert = f"Trade executed but DB save failed: {symbol} {status}"
+        except Exception as e:
+            logger.error(
+                "[%s][%s] \u274C DB save exception for contract %s: %s",
+                self._get_strategy_name(),
+                symbol,
+                contract_id,
+                e,
+                exc_info=True,
+            )
+            alert = f"Trade executed but DB error: {symbol} - {str(e)}"
+        # Notify via Telegram
+        self._notify_error(f"{symbol}:db", alert)
+    
+    @staticmethod
+    def _stats_fingerprint(stats: Dict) -> Optional[str]:
+        """Stable fingerprint of a (possibly nested) statistics dict"""
+        try:
+            return json.dumps(stats, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None
+    
+    def _get_cached_statistics(self) -> Dict:
+        """Return state statistics, reusing the last copy for up to _stats_cache_ttl"""
+        cached_at, stats = self._stats_cache
+        now = time.monotonic()
+        if stats is None or now - cached_at >= self._stats_cache_ttl:
+            stats = self.state.get_statistics()
+            self._stats_cache = (now, stats)
+        return stats
+    
     @with_user_context
     async def _run_bot(self):
         """
         Main bot loop - Multi-asset parallel scanner
         Continuously scans all symbols looking for first qualifying signal
         """
+        # Strategy is fixed for the life of this loop; resolve its log tag once.
+        strategy_name = self._get_strategy_name()
         try:
             self._cycle_step("SYSTEM", 1, 6, "Main loop starting", emoji="\U0001F504")
             
@@ -1220,17 +1677,23 @@ class BotRunner:
                  logger.error(error_msg)
                  raise ValueError(error_msg)
             
+            # Bind loop-invariant settings once instead of per cycle
+            app_id = config.DERIV_APP_ID
+            active_monitor_interval = max(
+                int(getattr(config, "ACTIVE_TRADE_MONITOR_INTERVAL_SECONDS", 1)), 1
+            )
+            
             # Initialize bot components
             try:
                 self.data_fetcher = DataFetcher(
                     token_to_use,
-                    config.DERIV_APP_ID
+                    app_id
                 )
                 
                 self.trade_engine = TradeEngine(
                     token_to_use,
-                    config.DERIV_APP_ID,
-                    risk_mode=(self._get_strategy_name() or "Conservative").strip().upper(),
+                    app_id,
+                    risk_mode=(strategy_name or "Conservative").strip().upper(),
                 )
                 
                 # Only initialize risk_manager if not already injected
@@ -1247,7 +1710,7 @@ class BotRunner:
                         self.risk_manager.update_risk_settings(self.user_stake)
                     if hasattr(self.risk_manager, 'stake'):
                         self.risk_manager.stake = self.user_stake
-                    logger.info(f"[{self._get_strategy_name()}][SYSTEM] \U0001F6E1\ufe0f Risk limits updated for stake: ${self.user_stake}")
+                    logger.info("[%s][SYSTEM] \U0001F6E1\ufe0f Risk limits updated for stake: $%s", strategy_name, self.user_stake)
                 
                 self._cycle_step("SYSTEM", 2, 6, "Components initialized", emoji="\U0001F9E9")
             except Exception as e:
@@ -1258,15 +1721,20 @@ class BotRunner:
             
             # Connect to Deriv API
             try:
-                self._cycle_step("SYSTEM", 3, 6, "Connecting DataFetcher", emoji="\U0001F50C")
-                data_connected = await self.data_fetcher.connect()
+                self._cycle_step("SYSTEM", 3, 6, "Connecting DataFetcher and TradeEngine", emoji="\U0001F50C")
+                # Independent handshakes to Deriv API - run them concurrently
+                data_connected, trade_connected = await asyncio.gather(
+                    self.data_fetcher.connect(),
+                    self.trade_engine.connect(),
+                    return_exceptions=True,
+                )
+                if isinstance(data_connected, Exception):
+                    raise Exception(f"DataFetcher failed to connect: {data_connected}")
                 if not data_connected:
                     reason = self.data_fetcher.last_error or "Unknown connection error"
                     raise Exception(f"DataFetcher failed to connect: {reason}")
                 
-                self._cycle_step("SYSTEM", 4, 6, "Connecting TradeEngine", emoji="\U0001F50C")
-                trade_connected = await self.trade_engine.connect()
-                if not trade_connected:
+                if isinstance(trade_connected, Exception) or not trade_connected:
                     raise Exception("TradeEngine failed to connect (check logs for details)")
                 
                 self._cycle_step("SYSTEM", 4, 6, "Connected to Deriv API", emoji="\u2705")
@@ -1276,68 +1744,51 @@ class BotRunner:
                 self._cycle_step("SYSTEM", 4, 6, self.error_message, emoji="\u274C", level="error")
                 return
             
-            # Check for existing positions on startup
-            try:
-                has_existing = await self.risk_manager.check_for_existing_positions(self.trade_engine)
-                if has_existing:
-                    logger.warning(f"[{self._get_strategy_name()}][SYSTEM] \U0001F512 Existing position detected on startup")
-            except Exception as e:
-                logger.warning(f"[{self._get_strategy_name()}][SYSTEM] \u26A0\ufe0f Existing-position check failed: {e}")
-
-            # Reconcile persisted open trades so restart resumes monitoring
-            # and stale DB rows are closed when broker already settled them.
-            try:
-                await self._reconcile_active_trades_on_startup()
-            except Exception as e:
-                logger.warning(f"[{self._get_strategy_name()}][SYSTEM] \u26A0\ufe0f Active-trade reconciliation failed: {e}")
-            
-            # Get initial balance
-            try:
-                balance = await self.data_fetcher.get_balance()
-                if balance:
-                    self.state.update_balance(balance)
-                    logger.info(f"[{self._get_strategy_name()}][SYSTEM] \U0001F4B0 Initial balance: ${balance:.2f}")
-            except Exception as e:
-                logger.warning(f"[{self._get_strategy_name()}][SYSTEM] \u26A0\ufe0f Initial balance fetch failed: {e}")
-                balance = 0.0
+            # Position restore (TradeEngine) and balance fetch (DataFetcher)
+            # use separate connections - run them concurrently
+            balance, _ = await asyncio.gather(
+                self._fetch_initial_balance(strategy_name),
+                self._restore_open_positions(strategy_name),
+            )
             
             # Mark as running
             self.is_running = True
             self.status = BotStatus.RUNNING
             self.start_time = datetime.now()
+            self._start_time_iso = self.start_time.isoformat()
+            self._start_monotonic = time.monotonic()
             self.error_message = None
             self.state.update_status("running")
+            self._ready_event.set()
             
             self._cycle_step("SYSTEM", 5, 6, "Bot is now running", emoji="\u2705")
-            logger.info(f"[{self._get_strategy_name()}][SYSTEM] \U0001F50E Scanning {len(self.symbols)} symbols per cycle")
+            logger.info("[%s][SYSTEM] \U0001F50E Scanning %s symbols per cycle", strategy_name, len(self.symbols))
             
-            # Notify Telegram
-            try:
-                await self.telegram_bridge.notify_bot_started(
+            # Notify Telegram and WebSockets concurrently
+            await self._send_concurrently(
+                self.telegram_bridge.notify_bot_started(
                     balance or 0.0,
                     self.user_stake,
-                    self._get_strategy_name(),
-                )
-            except Exception as e:
-                logger.warning(f"[{self._get_strategy_name()}][SYSTEM] \u26A0\ufe0f Telegram notification failed: {e}")
-            
-            # Broadcast to WebSockets
-            await event_manager.broadcast({
-                "type": "bot_status",
-                "status": "running",
-                "account_id": self.account_id,
-                "message": f"Multi-asset bot started - scanning {len(self.symbols)} symbols",
-                "balance": balance,
-                "symbols": self.symbols
-            })
+                    strategy_name,
+                ),
+                event_manager.broadcast({
+                    "type": "bot_status",
+                    "status": "running",
+                    "account_id": self.account_id,
+                    "message": f"Multi-asset bot started - scanning {len(self.symbols)} symbols",
+                    "balance": balance,
+                    "symbols": self.symbols
+                }),
+            )
             
             # Broadcast initial statistics
             initial_stats = self.state.get_statistics()
+            self._last_stats_fingerprint = self._stats_fingerprint(initial_stats)
             await event_manager.broadcast({
                 "type": "statistics",
                 "stats": initial_stats,
-                "strategy": self._get_strategy_name(),
-                "timestamp": datetime.now().isoformat(),
+                "strategy": strategy_name,
+                "timestamp": _now_iso(),
                 "account_id": self.account_id
             })
             
@@ -1345,6 +1796,7 @@ class BotRunner:
             while self.is_running:
                 try:
                     self.scan_count += 1
+                    cycle_started = time.monotonic()
                     
                     # Execute multi-asset scan cycle
                     await self._multi_asset_scan_cycle()
@@ -1352,64 +1804,75 @@ class BotRunner:
                     # Determine wait time based on risk manager state
                     cooldown = self.risk_manager.get_cooldown_remaining()
                     
+                    # Cycle interval is measured from cycle start, so time spent
+                    # scanning counts toward it. Cooldown is a remaining duration
+                    # read after the cycle and is honoured in full.
+                    elapsed = time.monotonic() - cycle_started
+                    
                     # If actively monitoring a trade, check more frequently
                     if self.risk_manager.active_trades:
                         # Do NOT reuse entry cooldown here; active-trade protection
                         # (e.g., breakeven trailing exits) must run on a fixed fast cadence.
-                        wait_time = max(int(getattr(config, "ACTIVE_TRADE_MONITOR_INTERVAL_SECONDS", 1)), 1)
-                        logger.debug(f"[{self._get_strategy_name()}][SYSTEM] \u23F1\ufe0f Active trade monitor in {wait_time}s")
+                        sleep_for = max(active_monitor_interval - elapsed, 0.0)
+                        logger.debug("[%s][SYSTEM] \u23F1\ufe0f Active trade monitor in %.1fs", strategy_name, sleep_for)
                     else:
-                        wait_time = max(cooldown, 30)  # Standard 30s cycle when scanning
-                        logger.debug(f"[{self._get_strategy_name()}][SYSTEM] \u23F1\ufe0f Next scan in {wait_time}s")
+                        # Standard 30s cycle when scanning
+                        sleep_for = max(cooldown, 30 - elapsed, 0.0)
+                        logger.debug("[%s][SYSTEM] \u23F1\ufe0f Next scan in %.1fs", strategy_name, sleep_for)
                     
-                    # Sleep with cancellation check
-                    for _ in range(int(wait_time)):
-                        if not self.is_running:
-                            break
-                        await asyncio.sleep(1)
+                    # Single wait that returns as soon as a stop is requested.
+                    if await self._wait_for_stop(sleep_for):
+                        break
                     
                 except asyncio.CancelledError:
-                    logger.info(f"[{self._get_strategy_name()}][SYSTEM] \U0001F6D1 Bot loop cancelled")
+                    logger.info("[%s][SYSTEM] \U0001F6D1 Bot loop cancelled", strategy_name)
                     break
                 except Exception as e:
-                    logger.error(f"[{self._get_strategy_name()}][SYSTEM] \u274C Scan cycle error: {e}")
+                    logger.error("[%s][SYSTEM] \u274C Scan cycle error: %s", strategy_name, e)
                     
-                    try:
-                        await self.telegram_bridge.notify_error(str(e))
-                    except:
-                        pass
+                    self._notify_error("system:scan_cycle", str(e))
                     
                     await event_manager.broadcast({
                         "type": "error",
                         "message": str(e),
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": _now_iso(),
                         "account_id": self.account_id
                     })
-                    await asyncio.sleep(30)
+                    if await self._wait_for_stop(30):
+                        break
             
         except asyncio.CancelledError:
-            logger.info(f"[{self._get_strategy_name()}][SYSTEM] \U0001F6D1 Bot task cancelled")
+            logger.info("[%s][SYSTEM] \U0001F6D1 Bot task cancelled", strategy_name)
         except Exception as e:
-            logger.error(f"Fatal error in bot: {e}")
+            logger.error("Fatal error in bot: %s", e)
             self.status = BotStatus.ERROR
             self.error_message = str(e)
             self.state.update_status("error", error=str(e))
             
-            try:
-                await self.telegram_bridge.notify_error(f"Fatal error: {e}")
-            except:
-                pass
-            
-            await event_manager.broadcast({
-                "type": "error",
-                "message": f"Fatal error: {e}",
-                "timestamp": datetime.now().isoformat(),
-                "account_id": self.account_id
-            })
+            await self._send_concurrently(
+                self.telegram_bridge.notify_error(f"Fatal error: {e}"),
+                event_manager.broadcast({
+                    "type": "error",
+                    "message": f"Fatal error: {e}",
+                    "timestamp": _now_iso(),
+                    "account_id": self.account_id
+                }),
+            )
         finally:
             self.is_running = False
+            # Any exit before readiness (error returns, fatal errors) unblocks start_bot.
+            if not self._ready_event.is_set():
+                self._error_event.set()
             self._cycle_step("SYSTEM", 6, 6, "Main loop exited", emoji="\U0001F3C1")
     
+    async def _wait_for_stop(self, timeout: float) -> bool:
+        """Idle for up to ``timeout`` seconds; True if a stop was requested."""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
     async def _multi_asset_scan_cycle(self):
         """
         CRITICAL: Multi-Asset Parallel Scanner
@@ -1428,14 +1891,13 @@ class BotRunner:
         # Step 1: Check global permission
         self._cycle_signal_claimed = False
         self._cycle_winner_symbol = None
-        can_trade_global, reason = self.risk_manager.can_trade()
         
         # If we have an active trade, monitor it instead of scanning
         if self.risk_manager.active_trades:
-            now = datetime.now()
+            now = time.monotonic()
             monitor_log_key = "system:active_trade_monitor_mode"
-            last_marker = self.last_status_log.get(monitor_log_key, {"time": datetime.min})
-            if (now - last_marker.get("time", datetime.min)).total_seconds() >= 15:
+            last_marker = self.last_status_log.get(monitor_log_key, {"time": _NEVER})
+            if now - last_marker.get("time", _NEVER) >= 15:
                 logger.info(
                     "[%s][SYSTEM] Active trade(s) detected (%s) - monitoring exits while new entries remain gated",
                     self._get_strategy_name(),
@@ -1456,8 +1918,11 @@ class BotRunner:
             await self._monitor_active_trade()
             return
         
+        # Gate checked before any market data is fetched; skipped entirely
+        # while monitoring since entries are blocked then anyway.
+        can_trade_global, reason = self.risk_manager.can_trade()
         if not can_trade_global:
-            logger.info(f"[{self._get_strategy_name()}][SYSTEM] \u23F8\ufe0f Global trading paused: {reason}")
+            logger.info("[%s][SYSTEM] \u23F8\ufe0f Global trading paused: %s", self._get_strategy_name(), reason)
             await self._broadcast_decision(
                 symbol="SYSTEM",
                 phase="risk",
@@ -1471,54 +1936,122 @@ class BotRunner:
         
         # Step 2: Parallel symbol scanning
         logger.info(
-            f"[{self._get_strategy_name()}][SYSTEM] \U0001F50E CYCLE #{self.scan_count} | "
-            f"Checking {len(self.symbols)} symbols"
+            "[%s][SYSTEM] \U0001F50E CYCLE #%s | Checking %s symbols",
+            self._get_strategy_name(),
+            self.scan_count,
+            len(self.symbols),
         )
-        logger.info(f"[{self._get_strategy_name()}][SYSTEM] \U0001F50D Scanning symbols for entry signals")
+        logger.info("[%s][SYSTEM] \U0001F50D Scanning symbols for entry signals", self._get_strategy_name())
+
+        # Symbols the risk gate turned away mid-cycle; logged once after the scan
+        gate_blocked: List[str] = []
 
         async def _analyze_symbol_safe(symbol: str) -> bool:
-            # Check if we can still trade (might have changed during loop)
+            async with self._scan_semaphore:
+                return await _analyze_symbol_bounded(symbol)
+
+        async def _analyze_symbol_bounded(symbol: str) -> bool:
+            # Another symbol claimed the cycle while this one was queued.
+            if self._cycle_claimed_by_other(symbol):
+                return False
+
+            if self._is_symbol_parked(symbol):
+                return False
+
+            # Check if we can still trade (might have changed while queued)
             can_trade_now, _ = self.risk_manager.can_trade(symbol)
             if not can_trade_now:
-                logger.debug(
-                    f"[{self._get_strategy_name()}][{symbol}] \u26D4 Global state changed, skipping symbol"
-                )
+                gate_blocked.append(symbol)
                 return False
 
             try:
                 return await self._analyze_symbol(symbol)
             except Exception as e:
                 logger.error(
-                    f"[{self._get_strategy_name()}][{symbol}] \u274C Symbol analysis failed: "
-                    f"{type(e).__name__}: {e}",
+                    "[%s][%s] \u274C Symbol analysis failed: %s: %s",
+                    self._get_strategy_name(),
+                    symbol,
+                    type(e).__name__,
+                    e,
                     exc_info=True,
                 )
-                self.errors_by_symbol[symbol] = self.errors_by_symbol.get(symbol, 0) + 1
+                self.errors_by_symbol[symbol] += 1
 
                 if self.errors_by_symbol[symbol] >= 5:
-                    try:
-                        await self.telegram_bridge.notify_error(
-                            f"Multiple errors for {symbol}: {e}"
-                        )
-                    except Exception:
-                        pass
+                    self._notify_error(f"{symbol}:analysis", f"Multiple errors for {symbol}: {e}")
                 return False
 
         tasks = [asyncio.create_task(_analyze_symbol_safe(symbol)) for symbol in self.symbols]
+        winner = None
         if tasks:
+            # Losing symbols stop cooperatively via _cycle_claimed_by_other;
+            # they are never cancelled mid-fetch (see _analyze_symbol).
             results = await asyncio.gather(*tasks)
-            winners = [symbol for symbol, ok in zip(self.symbols, results) if ok]
-            if winners:
-                winner = winners[0]
-                logger.info(
-                    f"[{self._get_strategy_name()}][{winner}] \U0001F3C1 First qualifying signal won this cycle"
-                )
-                logger.info(
-                    f"[{self._get_strategy_name()}][SYSTEM] \U0001F512 Other symbols blocked until closure"
-                )
+            winner = next((symbol for symbol, ok in zip(self.symbols, results) if ok), None)
+
+        if gate_blocked:
+            logger.debug(
+                "[%s][SYSTEM] \u26D4 Global state changed, skipped %s symbols: %s",
+                self._get_strategy_name(),
+                len(gate_blocked),
+                gate_blocked,
+            )
+
+        if winner is not None:
+            logger.info(
+                "[%s][%s] \U0001F3C1 First qualifying signal won this cycle",
+                self._get_strategy_name(),
+                winner,
+            )
+            logger.info(
+                "[%s][SYSTEM] \U0001F512 Other symbols blocked until closure",
+                self._get_strategy_name(),
+            )
         
-        logger.debug(f"[{self._get_strategy_name()}][SYSTEM] \u2705 Scan cycle complete")
+        logger.debug("[%s][SYSTEM] \u2705 Scan cycle complete", self._get_strategy_name())
     
+    def _is_symbol_parked(self, symbol: str) -> bool:
+        """
+        Skip symbols that cannot produce a trade this cycle: no multiplier in
+        the active asset config, or parked after repeated missing timeframes.
+        """
+        if not self.asset_config.get(symbol, {}).get('multiplier'):
+            return True
+        until = self._symbol_skip_until.get(symbol)
+        if until is None:
+            return False
+        if time.monotonic() < until:
+            return True
+        del self._symbol_skip_until[symbol]
+        return False
+
+    def _record_missing_timeframes(self, symbol: str) -> None:
+        """Park a symbol after repeated incomplete timeframe fetches."""
+        strikes = self._missing_tf_strikes.get(symbol, 0) + 1
+        self._missing_tf_strikes[symbol] = strikes
+        if strikes >= self._missing_tf_strike_limit:
+            self._missing_tf_strikes.pop(symbol, None)
+            self._symbol_skip_until[symbol] = time.monotonic() + self._symbol_park_seconds
+            logger.warning(
+                "[%s][%s] Timeframes missing %s times in a row, skipping symbol for %.0fs",
+                self._get_strategy_name(),
+                symbol,
+                strikes,
+                self._symbol_park_seconds,
+            )
+
+    def _cycle_claimed_by_other(self, symbol: str) -> bool:
+        """True when a different symbol already won this scan cycle."""
+        if self._cycle_signal_claimed and self._cycle_winner_symbol != symbol:
+            logger.debug(
+                "[%s][%s] Cycle already claimed by %s, skipping analysis",
+                self._get_strategy_name(),
+                symbol,
+                self._cycle_winner_symbol,
+            )
+            return True
+        return False
+
     async def _analyze_symbol(self, symbol: str) -> bool:
         """
         Analyze single symbol for entry signal
@@ -1530,7 +2063,10 @@ class BotRunner:
         Returns:
             True if trade executed, False if no signal
         """
-        self._cycle_step(symbol, 1, 6, "Fetching multi-timeframe data", emoji="\U0001F4E5")
+        cycle_step = self._cycle_step
+        broadcast_decision = self._broadcast_decision
+        
+        cycle_step(symbol, 1, 6, "Fetching multi-timeframe data", emoji="\U0001F4E5")
         
         # Fetch multi-timeframe data for this symbol
         # Fetch multi-timeframe data for this symbol
@@ -1538,10 +2074,11 @@ class BotRunner:
             market_data = await self.data_fetcher.fetch_all_timeframes(symbol)
             
             # Validate we have all required timeframes
-            required_timeframes = ['1m', '5m', '1h', '4h', '1d', '1w']  # Full Top-Down requirement
-            if not all(tf in market_data for tf in required_timeframes):
-                missing_tfs = [tf for tf in required_timeframes if tf not in market_data]
-                self._cycle_step(
+            missing = self._REQUIRED_TF_SET - market_data.keys()
+            if missing:
+                missing_tfs = [tf for tf in self._REQUIRED_TIMEFRAMES if tf in missing]
+                self._record_missing_timeframes(symbol)
+                cycle_step(
                     symbol,
                     1,
                     6,
@@ -1549,7 +2086,7 @@ class BotRunner:
                     emoji="\u26A0\ufe0f",
                     level="warning",
                 )
-                await self._broadcast_decision(
+                await broadcast_decision(
                     symbol=symbol,
                     phase="data",
                     decision="no_trade",
@@ -1561,9 +2098,18 @@ class BotRunner:
                 return False
             
         except Exception as e:
-            self._cycle_step(symbol, 1, 6, f"Data fetch failed: {e}", emoji="\u274C", level="error")
+            cycle_step(symbol, 1, 6, f"Data fetch failed: {e}", emoji="\u274C", level="error")
             raise  # Re-raise to be caught by caller
         
+        self._missing_tf_strikes.pop(symbol, None)
+        
+        # Cooperative early exit: the cycle was won while this fetch was in
+        # flight, so strategy analysis here can no longer lead to a trade.
+        # (Tasks are not cancelled outright: interrupting a fetch mid
+        # send/recv would desynchronize the shared data socket.)
+        if self._cycle_claimed_by_other(symbol):
+            return False
+        
         # Extract timeframe data
         data_1m = market_data.get('1m')
         data_5m = market_data.get('5m')
@@ -1574,14 +2120,12 @@ class BotRunner:
         
         # Execute strategy analysis using injected strategy
         try:
-            self._cycle_step(symbol, 2, 6, "Running strategy analysis", emoji="\U0001F9E0")
-            # Get required timeframes for this strategy
-            required_tfs = self.strategy.get_required_timeframes()
-            
+            cycle_step(symbol, 2, 6, "Running strategy analysis", emoji="\U0001F9E0")
             # Build kwargs for strategy analyze method
-            strategy_kwargs = {}
-            for tf in required_tfs:
-                strategy_kwargs[f'data_{tf.replace("m", "m").replace("h", "h").replace("d", "d").replace("w", "w")}'] = market_data.get(tf)
+            strategy_kwargs = {
+                name: market_data.get(tf)
+                for tf, name in self._get_strategy_kwarg_names().items()
+            }
             strategy_kwargs['symbol'] = symbol
             
             # Call strategy analyze method
@@ -1589,12 +2133,12 @@ class BotRunner:
             self._record_scalping_strategy_outcome(signal)
 
         except Exception as e:
-            self._cycle_step(symbol, 2, 6, f"Strategy analysis failed: {e}", emoji="\u274C", level="error")
+            cycle_step(symbol, 2, 6, f"Strategy analysis failed: {e}", emoji="\u274C", level="error")
             raise
 
         if not isinstance(signal, dict):
-            self._cycle_step(symbol, 3, 6, "No trade setup: Invalid strategy response", emoji="\u23ED\ufe0f")
-            await self._broadcast_decision(
+            cycle_step(symbol, 3, 6, "No trade setup: Invalid strategy response", emoji="\u23ED\ufe0f")
+            await broadcast_decision(
                 symbol=symbol,
                 phase="signal",
                 decision="no_trade",
@@ -1603,43 +2147,50 @@ class BotRunner:
             )
             return False
         
+        # Extracted once; every branch below reads these
+        details = signal.get('details') or {}
+        passed_checks = details.get('passed_checks') or []
+        
         if not signal.get('can_trade'):
-            details = signal.get('details', {})
             reason = details.get('reason', 'Unknown')
-            passed_checks = details.get('passed_checks', [])
-            
-            # Format reason with checks
-            if passed_checks:
-                checks_str = ", ".join(passed_checks)
-                full_reason = f"{reason} (Checks Passed: {checks_str})"
-            else:
-                full_reason = reason
             
-            # Smart Logging: Only log if reason changed or > 60s passed to avoid spam
-            now = datetime.now()
-            last_log = self.last_status_log.get(symbol, {'msg': '', 'time': datetime.min})
-            
-            should_log = False
-            if full_reason != last_log['msg']:
-                should_log = True
-            elif (now - last_log['time']).total_seconds() > 60:
-                should_log = True
-                
-            if should_log:
-                self._cycle_step(symbol, 3, 6, f"No trade setup: {full_reason}", emoji="\u23ED\ufe0f")
-                self.last_status_log[symbol] = {'msg': full_reason, 'time': now}
-                await self._broadcast_decision(
-                    symbol=symbol,
-                    phase="signal",
-                    decision="no_trade",
-                    reason=full_reason,
-                    details={"passed_checks": passed_checks},
-                    throttle_key=f"{symbol}:signal_skip",
-                )
-            else:
+            # Smart Logging: Only log if reason changed or > 60s passed to avoid spam.
+            # Decided on the raw reason/checks so the common repeat case builds
+            # no strings or payloads.
+            now = time.monotonic()
+            last_log = self.last_status_log.get(symbol)
+            if (
+                last_log is not None
+                and last_log.get('reason') == reason
+                and last_log.get('checks') == passed_checks
+                and now - last_log['time'] <= 60
+            ):
                 # Debug only for spammy updates
-                logger.debug(f"[{self._get_strategy_name()}][{symbol}] \u23ED\ufe0f No signal: {full_reason}")
-                
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "[%s][%s] \u23ED\ufe0f No signal: %s",
+                        self._get_strategy_name(),
+                        symbol,
+                        self._format_no_setup_reason(reason, passed_checks),
+                    )
+                return False
+            
+            full_reason = self._format_no_setup_reason(reason, passed_checks)
+            cycle_step(symbol, 3, 6, f"No trade setup: {full_reason}", emoji="\u23ED\ufe0f")
+            self.last_status_log[symbol] = {
+                'msg': full_reason,
+                'reason': reason,
+                'checks': passed_checks,
+                'time': now,
+            }
+            await broadcast_decision(
+                symbol=symbol,
+                phase="signal",
+                decision="no_trade",
+                reason=full_reason,
+                details={"passed_checks": passed_checks},
+                throttle_key=f"{symbol}:signal_skip",
+            )
             return False
         
         # Parallel scans can detect multiple opportunities at once.
@@ -1647,14 +2198,14 @@ class BotRunner:
         async with self._cycle_claim_mutex:
             if self._cycle_signal_claimed and self._cycle_winner_symbol != symbol:
                 winner = self._cycle_winner_symbol or "unknown"
-                self._cycle_step(
+                cycle_step(
                     symbol,
                     3,
                     6,
                     f"Signal skipped: cycle already claimed by {winner}",
                     emoji="\u23ED\ufe0f",
                 )
-                await self._broadcast_decision(
+                await broadcast_decision(
                     symbol=symbol,
                     phase="signal",
                     decision="no_trade",
@@ -1669,17 +2220,17 @@ class BotRunner:
                 self._cycle_winner_symbol = symbol
 
         # We have a signal! Log it
-        checks_passed = ", ".join(signal.get('details', {}).get('passed_checks', []))
         direction_emoji = "\U0001F7E2" if str(signal.get("signal", "")).upper() in {"BUY", "UP"} else "\U0001F534"
-        self._cycle_step(
+        cycle_step(
             symbol,
             3,
             6,
             f"Signal {signal['signal']} {direction_emoji} | Score {signal.get('score', 0):.2f} | Conf {signal.get('confidence', 0):.0f}%",
             emoji="\U0001F3AF",
         )
-        logger.debug(f"   Checks: {checks_passed}")
-        await self._broadcast_decision(
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("   Checks: %s", ", ".join(passed_checks))
+        await broadcast_decision(
             symbol=symbol,
             phase="signal",
             decision="opportunity_detected",
@@ -1688,18 +2239,20 @@ class BotRunner:
                 "direction": signal.get("signal"),
                 "score": signal.get("score", 0),
                 "confidence": signal.get("confidence", 0),
-                "checks_passed": signal.get("details", {}).get("passed_checks", []),
+                "checks_passed": passed_checks,
             },
             min_interval_seconds=0,
         )
         
         # Track signal
-        self.signals_by_symbol[symbol] = self.signals_by_symbol.get(symbol, 0) + 1
+        self.signals_by_symbol[symbol] += 1
 
         execution_mode = "auto" if self.auto_execute_signals else "manual"
         action_taken = "Trade Executed" if self.auto_execute_signals else "Awaiting Manual Entry"
 
         # Broadcast signal to WebSockets
+        # Full-resolution local time: this doubles as the signal's lookup key
+        # for update_signal_result, so it is not coarsened like _now_iso().
         timestamp = datetime.now().isoformat()
         signal['timestamp'] = timestamp # CRITICAL: Track signal time for result linking
         signal['symbol'] = symbol
@@ -1712,32 +2265,79 @@ class BotRunner:
             else "Strategy signal detected - proceeding with auto execution pipeline"
         )
 
-        await event_manager.broadcast({
-            "type": "signal",
-            "symbol": symbol,
-            "signal": signal['signal'],
-            "score": signal.get('score', 0),
-            "confidence": signal.get('confidence', 0),
-            "execution_mode": execution_mode,
-            "action_taken": action_taken,
-            "auto_execute_signals": self.auto_execute_signals,
-            "timestamp": timestamp,
-            "account_id": self.account_id
-        })
-        
         # Record signal in state
         self.state.add_signal(signal)
 
         # Notify Telegram on every detected signal, regardless of execution mode.
+        # `signal` is this call's own dict (state.add_signal stored a copy), so
+        # it is enriched in place here and again before execution. Background
+        # consumers get their own snapshot so execution-time changes to stake,
+        # multiplier and reason cannot leak into them.
+        signal['strategy_type'] = self._get_strategy_name()
+        signal['user_id'] = self.account_id
+        if self.user_stake is not None:
+            signal['stake'] = self.user_stake
         try:
-            signal_for_notify = signal.copy()
-            signal_for_notify['strategy_type'] = self._get_strategy_name()
-            signal_for_notify['user_id'] = self.account_id
-            if self.user_stake is not None:
-                signal_for_notify['stake'] = self.user_stake
-            await self.telegram_bridge.notify_signal(signal_for_notify)
+            self._notify(self.telegram_bridge.notify_signal(signal.copy()))
         except Exception as e:
-            logger.warning(f"[{self._get_strategy_name()}][SYSTEM] ⚠️ Signal Telegram notification failed: {e}")
+            logger.warning("[%s][SYSTEM] ⚠️ Signal Telegram notification failed: %s", self._get_strategy_name(), e)
+
+        # The WebSocket signal broadcast is not on the order path: overlap it
+        # with the risk gate and trade dispatch instead of awaiting it first.
+        # (A plain task rather than TaskGroup so execution errors propagate
+        # unwrapped to _analyze_symbol_safe.)
+        signal_broadcast = asyncio.create_task(self._broadcast_signal(symbol, signal.copy()))
+        try:
+            return await self._execute_detected_signal(symbol, signal, passed_checks)
+        finally:
+            await signal_broadcast
+
+    @staticmethod
+    def _format_no_setup_reason(reason: str, passed_checks: List) -> str:
+        """Reason text for a no-trade result, with the checks that did pass"""
+        if passed_checks:
+            return f"{reason} (Checks Passed: {', '.join(passed_checks)})"
+        return reason
+
+    async def _broadcast_signal(self, symbol: str, signal: Dict):
+        """Broadcast a detected signal to WebSocket clients"""
+        try:
+            await event_manager.broadcast({
+                "type": "signal",
+                "symbol": symbol,
+                "signal": signal['signal'],
+                "score": signal.get('score', 0),
+                "confidence": signal.get('confidence', 0),
+                "execution_mode": signal.get('execution_mode'),
+                "action_taken": signal.get('action_taken'),
+                "auto_execute_signals": self.auto_execute_signals,
+                "timestamp": signal.get('timestamp'),
+                "account_id": self.account_id
+            })
+        except Exception as e:
+            logger.warning(
+                "[%s][%s] Signal broadcast failed: %s",
+                self._get_strategy_name(),
+                symbol,
+                e,
+            )
+
+    async def _execute_detected_signal(
+        self, symbol: str, signal: Dict, passed_checks: Optional[List] = None
+    ) -> bool:
+        """
+        Route a claimed signal: manual mode stops at notification, auto mode
+        runs the risk gate and executes the trade.
+        
+        passed_checks is the list _analyze_symbol already extracted from the
+        signal details; it is read from the signal only when not supplied.
+        
+        Returns:
+            True if trade executed, False otherwise
+        """
+        execution_mode = signal.get('execution_mode')
+        action_taken = signal.get('action_taken')
+        timestamp = signal.get('timestamp')
 
         if not self.auto_execute_signals:
             self._cycle_step(
@@ -1764,7 +2364,7 @@ class BotRunner:
                 "level": "info",
                 "title": "Signal Ready (Manual Entry)",
                 "message": f"{symbol} {signal.get('signal')} detected. Open manually then use Sync to track.",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
                 "account_id": self.account_id,
             })
             return False
@@ -1805,11 +2405,10 @@ class BotRunner:
         stake = base_stake
 
         # Debug: Log signal structure before validation
-        logger.debug(f"Signal structure - Entry: {signal.get('entry_price')}, TP: {signal.get('take_profit')}, SL: {signal.get('stop_loss')}")
+        logger.debug("Signal structure - Entry: %s, TP: %s, SL: %s", signal.get('entry_price'), signal.get('take_profit'), signal.get('stop_loss'))
         
         # CRITICAL FIX: Add symbol to signal before validation
-        signal_for_validation = signal.copy()
-        signal_for_validation['symbol'] = symbol
+        signal['symbol'] = symbol
 
         # Parallel scans can detect multiple opportunities at once.
         # Ensure only one symbol can enter trade execution path at a time.
@@ -1839,7 +2438,7 @@ class BotRunner:
                 stake=stake,
                 take_profit=signal.get('take_profit'),
                 stop_loss=signal.get('stop_loss'),
-                signal_dict=signal_for_validation
+                signal_dict=signal
             )
             
             if not can_open:
@@ -1858,25 +2457,27 @@ class BotRunner:
             # Build execution payload once.
             # Do not send pre-execution signal alerts here because final
             # proposal-spot RR checks can still reject the entry.
-            passed_checks = signal.get("details", {}).get("passed_checks", [])
+            if passed_checks is None:
+                passed_checks = (signal.get('details') or {}).get('passed_checks') or []
             if passed_checks:
                 execution_reason = f"Checks passed: {', '.join(str(item) for item in passed_checks)}"
             else:
                 execution_reason = "All strategy checks aligned and risk gate passed"
-            signal_with_symbol = signal.copy()
-            signal_with_symbol['symbol'] = symbol
-            signal_with_symbol['stake'] = stake
-            signal_with_symbol['multiplier'] = multiplier
-            signal_with_symbol['strategy_type'] = self._get_strategy_name()
-            signal_with_symbol['user_id'] = self.account_id
-            signal_with_symbol['execution_reason'] = execution_reason
+            signal['stake'] = stake
+            signal['multiplier'] = multiplier
+            signal['strategy_type'] = self._get_strategy_name()
+            signal['user_id'] = self.account_id
+            signal['execution_reason'] = execution_reason
             
             # Execute trade!
             self._cycle_step(
                 symbol,
                 5,
                 6,
-                f"Executing {signal['signal']} | Stake ${stake:.2f} | Multiplier {multiplier}x",
+                "Executing %s | Stake $%.2f | Multiplier %sx",
+                signal['signal'],
+                stake,
+                multiplier,
                 emoji="\U0001F680",
             )
             await self._broadcast_decision(
@@ -1895,7 +2496,7 @@ class BotRunner:
             try:
                 # Execute trade using TradeEngine
                 result = await self.trade_engine.execute_trade(
-                    signal_with_symbol, 
+                    signal, 
                     self.risk_manager
                 )
                 
@@ -1910,92 +2511,63 @@ class BotRunner:
                         symbol,
                         6,
                         6,
-                        f"Trade completed: {status} | P&L: ${pnl:.2f} | Contract: {contract_id}",
+                        "Trade completed: %s | P&L: $%.2f | Contract: %s",
+                        status,
+                        pnl,
+                        contract_id,
                         emoji=result_emoji,
                     )
 
                     # CRITICAL FIX: Add signal to result for DB persistence
                     if 'signal' not in result:
-                        result['signal'] = signal_with_symbol['signal']
+                        result['signal'] = signal['signal']
                     
                     # NEW: Add strategy_type to result for database
-                    result['strategy_type'] = self.strategy.get_strategy_name()
+                    result['strategy_type'] = signal['strategy_type']
                     
                     # Record trade closure
                     self.risk_manager.record_trade_close(contract_id, pnl, status)
                     self.state.update_trade(contract_id, result)
 
 
-                    # Persist to Supabase with error handling
-                    try:
-                        saved = UserTradesService.save_trade(self.account_id, result)
-                        if saved:
-                            logger.info(f"[{self._get_strategy_name()}][{symbol}] \U0001F9FE Trade persisted to DB: {contract_id}")
-                        else:
-                            logger.error(
-                                f"[{self._get_strategy_name()}][{symbol}] \u274C DB persistence failed for contract {contract_id} (no data returned)"
-                            )
-                            # Notify via Telegram
-                            try:
-                                await self.telegram_bridge.notify_error(
-                                    f"Trade executed but DB save failed: {symbol} {status}"
-                                )
-                            except:
-                                pass
-                    except Exception as e:
-                        logger.error(f"[{self._get_strategy_name()}][{symbol}] \u274C DB save exception for contract {contract_id}: {e}")
-                        import traceback
-                        logger.error(traceback.format_exc())
-                        # Notify via Telegram
-                        try:
-                            await self.telegram_bridge.notify_error(
-                                f"Trade executed but DB error: {symbol} - {str(e)}"
-                            )
-                        except:
-                            pass
-
+                    # Persist to Supabase in the background; the scan does not
+                    # wait for it (stop_bot drains it via _flush_notifications)
+                    self._persist_in_background(symbol, contract_id, status, result)
                     
                     # Notify Telegram
                     try:
-                        # MERGE complete trade details into result for notification
-                        result_for_notify = result.copy()
-                        result_for_notify.update(signal_with_symbol) # Contains direction, stake, symbol
-                        result_for_notify['strategy_type'] = self._get_strategy_name()
-                        result_for_notify['user_id'] = self.account_id
-                        result_for_notify.setdefault(
-                            'execution_reason',
-                            signal_with_symbol.get('execution_reason', 'Signal conditions matched and risk checks passed')
-                        )
-                        
-                        # Ensure symbol is set (sometimes signal uses 'symbol', result uses 'symbol')
-                        if 'symbol' not in result_for_notify:
-                             result_for_notify['symbol'] = symbol
-                        
-                        await self.telegram_bridge.notify_trade_closed(result_for_notify, pnl, status, strategy_type=self.strategy.get_strategy_name())
-                    except:
-                        pass
+                        # MERGE complete trade details into result for notification;
+                        # signal already carries symbol, stake, strategy_type,
+                        # user_id and execution_reason
+                        result_for_notify = {**result, **signal}
+                        self._notify(self.telegram_bridge.notify_trade_closed(result_for_notify, pnl, status, strategy_type=signal['strategy_type']))
+                    except Exception as notify_error:
+                        logger.debug("Telegram notification failed: %s", notify_error)
                     
-                    # Broadcast to WebSockets
-                    await event_manager.broadcast({
+                    # Broadcast to WebSockets (post-trade burst goes out in one
+                    # broadcast_batch pass and shares one formatted timestamp)
+                    closed_at = _now_iso()
+                    post_trade_events = [{
                         "type": "trade_closed",
                         "symbol": symbol,
                         "trade": result,
                         "pnl": pnl,
                         "status": status,
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": closed_at,
                         "account_id": self.account_id
-                    })
+                    }]
                     
                     # Update statistics
                     stats = self.risk_manager.get_statistics()
                     self.state.update_statistics(stats)
+                    self._stats_cache = (0.0, None)
                     
                     # CRITICAL: Update signal result and broadcast
-                    signal_timestamp = signal_with_symbol.get('timestamp')
+                    signal_timestamp = signal.get('timestamp')
                     if signal_timestamp:
                         self.state.update_signal_result(signal_timestamp, status, pnl)
                         
-                        await event_manager.broadcast({
+                        post_trade_events.append({
                             "type": "signal_updated",
                             "timestamp": signal_timestamp,
                             "result": status,
@@ -2005,21 +2577,36 @@ class BotRunner:
 
                         # Send UI Notification
                         notification_type = "success" if pnl > 0 else "error" if pnl < 0 else "info"
-                        await event_manager.broadcast({
+                        post_trade_events.append({
                             "type": "notification",
                             "level": notification_type,
                             "title": f"Trade {status.title()}",
                             "message": f"{symbol} trade closed. P&L: ${pnl:.2f}",
-                            "timestamp": datetime.now().isoformat(),
+                            "timestamp": closed_at,
                             "account_id": self.account_id
                         })
                     
-                    await event_manager.broadcast({
-                        "type": "statistics",
-                        "stats": stats,
-                        "timestamp": datetime.now().isoformat(),
-                        "account_id": self.account_id
-                    })
+                    # Skip the statistics event when nothing changed since the
+                    # last one sent; clients keep their last-known stats.
+                    stats_fingerprint = self._stats_fingerprint(stats)
+                    if stats_fingerprint is None or stats_fingerprint != self._last_stats_fingerprint:
+                        self._last_stats_fingerprint = stats_fingerprint
+                        post_trade_events.append({
+                            "type": "statistics",
+                            "stats": stats,
+                            "timestamp": closed_at,
+                            "account_id": self.account_id
+                        })
+                    try:
+                        await event_manager.broadcast_batch(post_trade_events)
+                    except Exception as e:
+                        logger.error(
+                            "[%s][%s] Post-trade broadcast failed: %s",
+                            self._get_strategy_name(),
+                            symbol,
+                            e,
+                            exc_info=True,
+                        )
                     
                     return True  # Trade executed
                 else:
@@ -2037,7 +2624,9 @@ class BotRunner:
             except Exception as e:
                 self._cycle_step(symbol, 6, 6, f"Trade execution failed: {type(e).__name__}: {e}", emoji="\u274C", level="error")
                 logger.error(
-                    f"[{self._get_strategy_name()}][{symbol}] TRADE_EXECUTION_FAILED traceback",
+                    "[%s][%s] TRADE_EXECUTION_FAILED traceback",
+                    self._get_strategy_name(),
+                    symbol,
                     exc_info=True,
                 )
                 await self._broadcast_decision(
@@ -2049,16 +2638,19 @@ class BotRunner:
                     min_interval_seconds=0,
                 )
                 
-                try:
-                    await self.telegram_bridge.notify_error(f"{symbol} trade failed: {e}")
-                except:
-                    pass
+                self._notify_error(f"{symbol}:trade", f"{symbol} trade failed: {e}")
                 
                 return False
         finally:
             if self._execution_mutex.locked():
                 self._execution_mutex.release()
     
+    def _clear_active_monitor_state(self, contract_id, progress_key: str) -> None:
+        """Drop per-contract throttle markers once a trade has closed."""
+        self.last_status_log.pop(progress_key, None)
+        self.last_status_log.pop(progress_key + self._STATUS_MISS_SUFFIX, None)
+        self._active_status_miss_counts.pop(contract_id, None)
+
     async def _monitor_active_trade(self):
         """
         Monitor the currently active trade
@@ -2080,6 +2672,10 @@ class BotRunner:
             return
         contract_id = str(contract_id_raw)
         progress_key = f"{self._active_progress_key_prefix}{contract_id}"
+        # Bound once: the monitor runs every loop tick while a trade is open
+        risk_manager = self.risk_manager
+        trade_engine = self.trade_engine
+        strategy_name = self._get_strategy_name()
 
         def _to_float(value, default=0.0) -> float:
             try:
@@ -2101,7 +2697,7 @@ class BotRunner:
                 level="warning",
             )
             try:
-                sell_result = await self.trade_engine.close_trade(contract_id)
+                sell_result = await trade_engine.close_trade(contract_id)
                 if not sell_result:
                     return False
 
@@ -2123,8 +2719,8 @@ class BotRunner:
                     exit_price_fallback=current_spot,
                 )
 
-                if hasattr(self.risk_manager, "record_trade_close"):
-                    self.risk_manager.record_trade_close(contract_id, pnl, status)
+                if hasattr(risk_manager, "record_trade_close"):
+                    risk_manager.record_trade_close(contract_id, pnl, status)
                 self.state.update_trade(contract_id, result_for_db)
 
                 self._cycle_step(
@@ -2134,31 +2730,36 @@ class BotRunner:
                     "Trade closed - system unlocked",
                     emoji="\U0001F513",
                 )
-                logger.info(f"[{self._get_strategy_name()}][{symbol}] P&L: ${pnl:.2f}")
+                logger.info("[%s][%s] P&L: $%.2f", strategy_name, symbol, pnl)
 
+                # Off the event loop, but awaited: the next recovery pass reads
+                # persisted active trades and must see this close.
                 try:
-                    UserTradesService.save_trade(self.account_id, result_for_db)
+                    await asyncio.to_thread(UserTradesService.save_trade, self.account_id, result_for_db)
                 except Exception as save_error:
                     logger.error(
-                        f"[{self._get_strategy_name()}][{symbol}] "
-                        f"DB save failed for active-trade close: {save_error}"
+                        "[%s][%s] DB save failed for active-trade close: %s",
+                        strategy_name,
+                        symbol,
+                        save_error,
                     )
 
                 try:
-                    result_for_notify = dict(result_for_db)
-                    result_for_notify["user_id"] = self.account_id
-                    result_for_notify.setdefault("execution_reason", default_execution_reason)
-                    await self.telegram_bridge.notify_trade_closed(
+                    result_for_notify = {
+                        "execution_reason": default_execution_reason,
+                        **result_for_db,
+                        "user_id": self.account_id,
+                    }
+                    self._notify(self.telegram_bridge.notify_trade_closed(
                         result_for_notify,
                         pnl,
                         status,
-                        strategy_type=self._get_strategy_name(),
-                    )
-                except Exception:
-                    pass
+                        strategy_type=strategy_name,
+                    ))
+                except Exception as notify_error:
+                    logger.debug("Telegram notification failed: %s", notify_error)
 
-                self.last_status_log.pop(progress_key, None)
-                self._active_status_miss_counts.pop(contract_id, None)
+                self._clear_active_monitor_state(contract_id, progress_key)
                 return True
             except Exception as close_error:
                 self._cycle_step(
@@ -2172,17 +2773,17 @@ class BotRunner:
                 return False
 
         try:
-            trade_status = await self.trade_engine.get_trade_status(contract_id)
+            trade_status = await trade_engine.get_trade_status(contract_id)
             if not trade_status:
                 miss_count = self._active_status_miss_counts.get(contract_id, 0) + 1
                 self._active_status_miss_counts[contract_id] = miss_count
-                miss_log_key = f"{progress_key}:status_miss"
-                now = datetime.now()
-                last_miss = self.last_status_log.get(miss_log_key, {"time": datetime.min})
-                if (now - last_miss.get("time", datetime.min)).total_seconds() >= 15:
+                miss_log_key = progress_key + self._STATUS_MISS_SUFFIX
+                now = time.monotonic()
+                last_miss = self.last_status_log.get(miss_log_key, {"time": _NEVER})
+                if now - last_miss.get("time", _NEVER) >= 15:
                     logger.warning(
                         "[%s][%s] Active monitor: broker status unavailable for contract %s (attempt %s)",
-                        self._get_strategy_name(),
+                        strategy_name,
                         symbol,
                         contract_id,
                         miss_count,
@@ -2196,7 +2797,7 @@ class BotRunner:
                 # longer open, force runtime/db transition to avoid stale rows.
                 if miss_count >= 3:
                     try:
-                        portfolio_resp = await self.trade_engine.portfolio({"portfolio": 1})
+                        portfolio_resp = await trade_engine.portfolio({"portfolio": 1})
                         contracts = list((portfolio_resp or {}).get("portfolio", {}).get("contracts") or [])
                         open_ids = {
                             str(item.get("contract_id"))
@@ -2206,12 +2807,12 @@ class BotRunner:
                         if contract_id not in open_ids:
                             logger.warning(
                                 "[%s][%s] Active monitor fallback: %s absent from broker open portfolio; marking closed",
-                                self._get_strategy_name(),
+                                strategy_name,
                                 symbol,
                                 contract_id,
                             )
-                            if hasattr(self.risk_manager, "record_trade_close"):
-                                self.risk_manager.record_trade_close(contract_id, 0.0, "closed")
+                            if hasattr(risk_manager, "record_trade_close"):
+                                risk_manager.record_trade_close(contract_id, 0.0, "closed")
                             forced_close = dict(active_info)
                             forced_close.update(
                                 {
@@ -2219,18 +2820,17 @@ class BotRunner:
                                     "status": "closed",
                                     "profit": 0.0,
                                     "timestamp": datetime.now(),
-                                    "strategy_type": self._get_strategy_name(),
+                                    "strategy_type": strategy_name,
                                     "exit_reason": "broker_status_unavailable_portfolio_closed",
                                 }
                             )
                             self.state.update_trade(contract_id, forced_close)
-                            UserTradesService.save_trade(self.account_id, forced_close)
-                            self._active_status_miss_counts.pop(contract_id, None)
-                            self.last_status_log.pop(progress_key, None)
+                            await asyncio.to_thread(UserTradesService.save_trade, self.account_id, forced_close)
+                            self._clear_active_monitor_state(contract_id, progress_key)
                     except Exception as fallback_error:
                         logger.warning(
                             "[%s][%s] Active monitor fallback reconciliation failed for %s: %s",
-                            self._get_strategy_name(),
+                            strategy_name,
                             symbol,
                             contract_id,
                             fallback_error,
@@ -2252,25 +2852,24 @@ class BotRunner:
             open_time = self._parse_trade_datetime(
                 active_info.get("open_time") or active_info.get("timestamp")
             )
+            # One wall-clock read per poll, shared by the age and trailing-exit info
+            wall_now = datetime.now()
             elapsed_seconds = (
-                int((datetime.now() - open_time).total_seconds())
+                int((wall_now - open_time).total_seconds())
                 if isinstance(open_time, datetime)
                 else None
             )
 
             # Always emit active-trade progress logs so manual-tracked contracts
             # have visible monitoring updates in the same lifecycle as setup entries.
-            progress_interval = max(
-                int(getattr(config, "ACTIVE_TRADE_PROGRESS_LOG_INTERVAL_SECONDS", 15)),
-                1,
-            )
-            now = datetime.now()
-            last_progress = self.last_status_log.get(progress_key, {"time": datetime.min})
-            if (now - last_progress.get("time", datetime.min)).total_seconds() >= progress_interval:
+            progress_interval = self._progress_log_interval
+            now = time.monotonic()
+            last_progress = self.last_status_log.get(progress_key, {"time": _NEVER})
+            if now - last_progress.get("time", _NEVER) >= progress_interval:
                 age_text = f"{elapsed_seconds}s" if elapsed_seconds is not None else "n/a"
                 logger.info(
                     "[%s][%s] Active contract %s | P&L: $%.2f | Spot: %.5f | Age: %s",
-                    self._get_strategy_name(),
+                    strategy_name,
                     symbol,
                     contract_id,
                     current_pnl,
@@ -2284,7 +2883,7 @@ class BotRunner:
 
             if not is_sold:
                 trade_info = {
-                    "open_time": open_time or datetime.now(),
+                    "open_time": open_time or wall_now,
                     "stake": active_info.get("stake"),
                     "symbol": symbol,
                     "contract_id": contract_id,
@@ -2295,10 +2894,10 @@ class BotRunner:
                 }
 
                 if (
-                    hasattr(self.risk_manager, "check_trailing_profit")
-                    and hasattr(self.risk_manager, "check_stagnation_exit")
+                    hasattr(risk_manager, "check_trailing_profit")
+                    and hasattr(risk_manager, "check_stagnation_exit")
                 ):
-                    trailing_result = self.risk_manager.check_trailing_profit(
+                    trailing_result = risk_manager.check_trailing_profit(
                         trade_info,
                         current_pnl,
                     )
@@ -2311,7 +2910,7 @@ class BotRunner:
                         should_trail_exit, trail_reason, just_activated = False, "", False
                     if just_activated:
                         try:
-                            await self.trade_engine.remove_take_profit(contract_id)
+                            await trade_engine.remove_take_profit(contract_id)
                         except Exception as remove_tp_error:
                             self._cycle_step(
                                 symbol,
@@ -2333,7 +2932,7 @@ class BotRunner:
                         if closed:
                             return
 
-                    stagnation_result = self.risk_manager.check_stagnation_exit(
+                    stagnation_result = risk_manager.check_stagnation_exit(
                         trade_info,
                         current_pnl,
                     )
@@ -2357,9 +2956,9 @@ class BotRunner:
 
                 # Fallback path for conservative and generic risk managers:
                 # apply normal should_close_trade checks for manual-tracked contracts.
-                if hasattr(self.risk_manager, "should_close_trade"):
+                if hasattr(risk_manager, "should_close_trade"):
                     try:
-                        exit_check = self.risk_manager.should_close_trade(
+                        exit_check = risk_manager.should_close_trade(
                             contract_id,
                             current_pnl,
                             current_spot,
@@ -2368,7 +2967,7 @@ class BotRunner:
                     except Exception as risk_error:
                         logger.warning(
                             "[%s][%s] Risk-exit evaluation failed for %s: %s",
-                            self._get_strategy_name(),
+                            strategy_name,
                             symbol,
                             contract_id,
                             risk_error,
@@ -2392,7 +2991,7 @@ class BotRunner:
                             return
 
             if is_sold:
-                logger.info(f"[{self._get_strategy_name()}][{symbol}] Trade detected as closed")
+                logger.info("[%s][%s] Trade detected as closed", strategy_name, symbol)
                 pnl = current_pnl
                 status = trade_status.get("status", "sold")
                 result_for_db = self._build_closed_trade_payload(
@@ -2404,43 +3003,52 @@ class BotRunner:
                     status_fallback=str(status),
                     exit_price_fallback=current_spot,
                 )
-                if hasattr(self.risk_manager, "record_trade_close"):
-                    self.risk_manager.record_trade_close(contract_id, pnl, status)
+                if hasattr(risk_manager, "record_trade_close"):
+                    risk_manager.record_trade_close(contract_id, pnl, status)
                 self.state.update_trade(contract_id, result_for_db)
 
-                logger.info(f"[{self._get_strategy_name()}][{symbol}] Trade closed - system unlocked")
-                logger.info(f"[{self._get_strategy_name()}][{symbol}] P&L: ${pnl:.2f}")
+                logger.info("[%s][%s] Trade closed - system unlocked", strategy_name, symbol)
+                logger.info("[%s][%s] P&L: $%.2f", strategy_name, symbol, pnl)
 
                 try:
-                    UserTradesService.save_trade(self.account_id, result_for_db)
+                    await asyncio.to_thread(UserTradesService.save_trade, self.account_id, result_for_db)
                 except Exception as save_error:
                     logger.error(
-                        f"[{self._get_strategy_name()}][{symbol}] "
-                        f"DB save failed for externally closed trade: {save_error}"
+                        "[%s][%s] DB save failed for externally closed trade: %s",
+                        strategy_name,
+                        symbol,
+                        save_error,
                     )
 
                 try:
-                    result_for_notify = dict(result_for_db)
-                    result_for_notify["user_id"] = self.account_id
-                    result_for_notify.setdefault(
-                        "execution_reason",
-                        "Trade opened by strategy signal and closed at broker settlement/limits",
-                    )
-                    await self.telegram_bridge.notify_trade_closed(
+                    result_for_notify = {
+                        "execution_reason": "Trade opened by strategy signal and closed at broker settlement/limits",
+                        **result_for_db,
+                        "user_id": self.account_id,
+                    }
+                    self._notify(self.telegram_bridge.notify_trade_closed(
                         result_for_notify,
                         pnl,
                         status,
-                        strategy_type=self._get_strategy_name(),
-                    )
-                except Exception:
-                    pass
+                        strategy_type=strategy_name,
+                    ))
+                except Exception as notify_error:
+                    logger.debug("Telegram notification failed: %s", notify_error)
 
-                self.last_status_log.pop(progress_key, None)
-                self._active_status_miss_counts.pop(contract_id, None)
+                self._clear_active_monitor_state(contract_id, progress_key)
 
         except Exception as e:
-            logger.warning(f"[{self._get_strategy_name()}][{symbol}] Could not monitor trade: {e}")
+            logger.warning("[%s][%s] Could not monitor trade: %s", strategy_name, symbol, e)
 
 # Global bot runner instance - DEPRECATED / DEFAULT
-# We keep this for backward compatibility if needed, using env vars
-bot_runner = BotRunner()
+# We keep this for backward compatibility if needed, using env vars. It is
+# built on first use rather than at import time.
+@lru_cache(maxsize=1)
+def get_bot_runner() -> BotRunner:
+    return BotRunner()
+
+
+def __getattr__(name: str):
+    if name == "bot_runner":
+        return get_bot_runner()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -60,21 +60,21 @@ class BotState:
             self.status = status
             self.error_message = error
             self.last_updated = datetime.now()
-            logger.debug(f"Bot status updated: {status}")
+            logger.debug("Bot status updated: %s", status)
     
     def update_balance(self, balance: float):
         """Update account balance"""
         with self._lock:
             self.balance = balance
-            logger.debug(f"Balance updated: ${balance:.2f}")
+            logger.debug("Balance updated: $%.2f", balance)
     
     def add_trade(self, trade: Dict):
         """Add new trade to active trades"""
+        trade_copy = trade.copy()
+        trade_copy['added_at'] = datetime.now().isoformat()
         with self._lock:
-            trade_copy = trade.copy()
-            trade_copy['added_at'] = datetime.now().isoformat()
             self.active_trades.append(trade_copy)
-            logger.debug(f"Trade added: {trade.get('contract_id')}")
+        logger.debug("Trade added: %s", trade.get('contract_id'))
     
     def update_trade(self, contract_id: str, final_status: Dict):
         """Move trade from active to history"""
@@ -85,22 +85,24 @@ class BotState:
                 if t.get('contract_id') == contract_id:
                     trade = self.active_trades.pop(i)
                     break
-            
-            if trade:
-                # Add final status
-                trade['final_status'] = final_status
-                trade['status'] = final_status.get('status', 'closed')
-                trade['closed_at'] = datetime.now().isoformat()
-                trade['pnl'] = final_status.get('profit', 0.0)
-                
-                # Add to history
-                self.trade_history.insert(0, trade)
-                
-                # Trim history
-                if len(self.trade_history) > self.max_history:
-                    self.trade_history = self.trade_history[:self.max_history]
-                
-                logger.debug(f"Trade moved to history: {contract_id}")
+
+            if not trade:
+                return
+
+            # Add final status
+            trade['final_status'] = final_status
+            trade['status'] = final_status.get('status', 'closed')
+            trade['closed_at'] = datetime.now().isoformat()
+            trade['pnl'] = final_status.get('profit', 0.0)
+
+            # Add to history
+            self.trade_history.insert(0, trade)
+
+            # Trim history
+            if len(self.trade_history) > self.max_history:
+                del self.trade_history[self.max_history:]
+
+        logger.debug("Trade moved to history: %s", contract_id)
     
     def add_signal(self, signal: Dict):
         """Add signal to recent signals"""
@@ -115,7 +117,7 @@ class BotState:
             if len(self.recent_signals) > self.max_signals:
                 self.recent_signals = self.recent_signals[:self.max_signals]
             
-            logger.debug(f"Signal added: {signal.get('signal')}")
+            logger.debug("Signal added: %s", signal.get('signal'))
 
     def update_signal_result(self, signal_timestamp: str, result: str, pnl: float):
         """Update signal with trade result"""
@@ -125,7 +127,7 @@ class BotState:
                     signal['result'] = result
                     signal['pnl'] = pnl
                     signal['updated_at'] = datetime.now().isoformat()
-                    logger.debug(f"Signal updated: {result} ({pnl})")
+                    logger.debug("Signal updated: %s (%s)", result, pnl)
                     return True
             return False
     
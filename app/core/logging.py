@@ -1,10 +1,13 @@
+import atexit
 import logging
+import queue
 import sys
 import asyncio
 import time
 import re
 import os
 from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
 from app.core.context import user_id_var
@@ -252,7 +255,17 @@ def setup_api_logger():
         ascii_only=console_ascii_only,
     )
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+
+    # Console formatting and stdout writes happen on a listener thread; the
+    # calling coroutine only enqueues the record, so a slow log collector
+    # cannot stall the event loop.
+    console_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(console_queue)
+    queue_handler.setLevel(logging.INFO)
+    console_listener = QueueListener(console_queue, console_handler, respect_handler_level=True)
+    console_listener.start()
+    atexit.register(console_listener.stop)
+    logger.addHandler(queue_handler)
 
     # Route uvicorn logs to stdout so transport doesn't classify INFO as stderr errors.
     for uvicorn_logger_name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
@@ -260,7 +273,7 @@ def setup_api_logger():
         uvicorn_logger.handlers.clear()
         uvicorn_logger.setLevel(logging.INFO)
         uvicorn_logger.propagate = False
-        uvicorn_logger.addHandler(console_handler)
+        uvicorn_logger.addHandler(queue_handler)
 
     # 2. Context Filter (Injects user_id)
     context_filter = ContextInjectingFilter()
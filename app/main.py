@@ -94,6 +94,12 @@ async def lifespan(app: FastAPI):
     logger.info("FastAPI application shutting down...")
     # Stop all running user bots
     await bot_manager.stop_all()
+    # Release the shared Telegram HTTP session
+    try:
+        from telegram_notifier import notifier as telegram_notifier
+        await telegram_notifier.close()
+    except Exception as e:
+        logger.warning(f"Telegram session close failed: {e}")
     logger.info("Shutdown complete")
 
 
@@ -225,11 +225,11 @@ class UserTradesService:
             for field, name in required_fields.items():
                 if not trade_data.get(field):
                     logger.error(f"❌ Cannot save trade: Missing required field '{name}'")
-                    logger.debug(f"Trade data keys: {list(trade_data.keys())}")
+                    logger.debug("Trade data keys: %s", list(trade_data.keys()))
                     return None
             if not (trade_data.get("signal") or trade_data.get("direction")):
                 logger.error("❌ Cannot save trade: Missing required field 'Signal (UP/DOWN)'")
-                logger.debug(f"Trade data keys: {list(trade_data.keys())}")
+                logger.debug("Trade data keys: %s", list(trade_data.keys()))
                 return None
             
             timestamp = UserTradesService._resolve_trade_timestamp(trade_data)
@@ -680,9 +680,7 @@ class UserTradesService:
             return result
         
         except Exception as e:
-            import traceback
-            error_details = traceback.format_exc()
-            logger.error(f"❌ Error calculating user stats: {e}\n{error_details}")
+            logger.error(f"❌ Error calculating user stats: {e}", exc_info=True)
             # Return empty structure on error to prevent API 500
             return {
                 "total_trades": 0,
@@ -249,7 +249,7 @@ class RiskManager:
             active_symbols = [t['symbol'] for t in self.active_trades]
             reason = f"GLOBAL LIMIT: {len(self.active_trades)}/{self.max_concurrent_trades} active trades ({', '.join(active_symbols)})"
             if symbol and symbol not in active_symbols:
-                logger.debug(f"⏸️ {symbol} blocked: {reason}")
+                logger.debug("⏸️ %s blocked: %s", symbol, reason)
             
             if verbose:
                 print(f"[RISK] ⛔ blocked: {reason}")
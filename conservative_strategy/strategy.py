@@ -347,7 +347,7 @@ class TradingStrategy:
         
         # Document middle zone override if applicable
         if is_mid_zone:
-            logger.debug(f"[CONSERVATIVE][{symbol}] ⚠️ Middle-zone breakout validated - entry quality: caution")
+            logger.debug("[CONSERVATIVE][%s] ⚠️ Middle-zone breakout validated - entry quality: caution", symbol)
             passed_checks.append("Momentum Override Middle Zone")
         else:
             passed_checks.append("Entry at Structure Boundary")
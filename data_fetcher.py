@@ -5,10 +5,11 @@ data_fetcher.py - MULTI-ASSET VERSION
 """
 
 import asyncio
+import time
 import websockets
 import json
 import pandas as pd
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import config
 from utils import setup_logger, parse_candle_data, TokenBucket
@@ -16,6 +17,16 @@ from utils import setup_logger, parse_candle_data, TokenBucket
 # Setup logger
 logger = setup_logger()
 
+# Bar period (seconds) per higher-timeframe source series whose candles are
+# reused until the bar bucket rolls over (4h/1w are derived from 1h/1d).
+_HTF_BUCKET_SECONDS = {
+    '1h': 3600,
+    '1d': 86400,
+}
+# Bars refetched on a cache hit: the forming bar plus the one before it, so
+# small clock skew around a bar boundary cannot leave a stale closed bar.
+_HTF_TAIL_COUNT = 2
+
 class DataFetcher:
     """Handles all data fetching operations from Deriv API with multi-asset support"""
     
@@ -42,6 +53,9 @@ class DataFetcher:
         # Prevent reconnect storms when many tasks detect a dropped socket.
         self._connection_lock = asyncio.Lock()
         
+        # Higher-timeframe candles per (symbol, timeframe): (bar bucket, frame)
+        self._htf_cache: Dict[Tuple[str, str], Tuple[int, pd.DataFrame]] = {}
+        
         # Error tracking
         self.last_error: Optional[str] = None
     
@@ -89,8 +103,8 @@ class DataFetcher:
         if self.ws:
             try:
                 await self.ws.close()
-            except:
-                pass
+            except Exception as close_error:
+                logger.debug("Ignoring error closing stale socket: %s", close_error)
         
         self.is_connected = False
         
@@ -265,7 +279,7 @@ class DataFetcher:
             # Convert timestamp to datetime
             df['datetime'] = pd.to_datetime(df['timestamp'], unit='s')
             
-            logger.debug(f"[OK] Fetched {len(df)} {symbol} candles ({granularity}s)")
+            logger.debug("[OK] Fetched %s %s candles (%ss)", len(df), symbol, granularity)
             return df
             
         except Exception as e:
@@ -331,7 +345,7 @@ class DataFetcher:
                 "quote": [float(price) for price in prices],
             })
             df["datetime"] = pd.to_datetime(df["timestamp"], unit="s")
-            logger.debug(f"[OK] Fetched {len(df)} ticks for {symbol}")
+            logger.debug("[OK] Fetched %s ticks for %s", len(df), symbol)
             return df
 
         except Exception as e:
@@ -399,7 +413,7 @@ class DataFetcher:
             fetch_count = count
         
         try:
-            logger.debug(f"Fetching {fetch_count} candles ({granularity}s) for {symbol} to build {timeframe}...")
+            logger.debug("Fetching %s candles (%ss) for %s to build %s...", fetch_count, granularity, symbol, timeframe)
             df = await self.fetch_candles(symbol, granularity, fetch_count)
             
             if df is not None:
@@ -410,7 +424,7 @@ class DataFetcher:
                     if df is not None:
                         df = df.tail(count)
                 
-                logger.debug(f"[OK] Fetched {len(df)} {symbol} {timeframe} candles")
+                logger.debug("[OK] Fetched %s %s %s candles", len(df), symbol, timeframe)
             else:
                 logger.warning(f"[WARNING] Failed to fetch {symbol} {timeframe} candles")
             
@@ -453,6 +467,12 @@ class DataFetcher:
         """
         Fetch all timeframes needed for Top-Down strategy
         
+        Only three candle series are requested; the rest are aggregated
+        locally from them:
+            1m -> 1m, 5m
+            1h -> 1h, 4h
+            1d -> 1d, 1w
+        
         Args:
             symbol: Trading symbol (e.g., 'R_25', 'R_50')
         
@@ -467,29 +487,104 @@ class DataFetcher:
             '1d': config.CANDLES_1D,
             '1w': config.CANDLES_1W
         }
+        # Source series with enough history for the derived timeframe; one
+        # spare bar absorbs a partial first bucket.
+        sources = {
+            '1m': max(timeframes['1m'], (timeframes['5m'] + 1) * 5),
+            '1h': max(timeframes['1h'], (timeframes['4h'] + 1) * 4),
+            '1d': max(timeframes['1d'], timeframes['1w'] * 7),
+        }
         
         data = {}
         
         logger.info(f"[INFO] Fetching all timeframes for {symbol}...")
         
-        for tf, count in timeframes.items():
-            try:
-                df = await self.fetch_timeframe(symbol, tf, count)
-                if df is not None and not df.empty:
-                    data[tf] = df
-                else:
-                    logger.warning(f"[WARNING] Empty or failed {symbol} {tf} data")
-                
-                # Rate limiting between requests
-                await asyncio.sleep(0.3)
-                
-            except Exception as e:
-                logger.error(f"[ERROR] Failed to fetch {symbol} {tf}: {e}")
+        # Issue the source requests together; send_request's TokenBucket
+        # enforces the Deriv rate limit and the socket lock keeps each
+        # send/recv pair intact, so no fixed sleep between requests is needed.
+        results = await asyncio.gather(
+            *(self._fetch_timeframe_cached(symbol, tf, count) for tf, count in sources.items()),
+            return_exceptions=True,
+        )
+        
+        derived = {'1m': ('5m', '5min'), '1h': ('4h', '4h'), '1d': ('1w', None)}
+        for tf, df in zip(sources, results):
+            if isinstance(df, Exception):
+                logger.error(f"[ERROR] Failed to fetch {symbol} {tf}: {df}")
+                continue
+            if df is None or df.empty:
+                logger.warning(f"[WARNING] Empty or failed {symbol} {tf} data")
+                continue
+            
+            data[tf] = df.tail(timeframes[tf]).reset_index(drop=True)
+            
+            child_tf, rule = derived[tf]
+            if rule is None:
+                child = self._resample_to_weekly(df)
+            else:
+                child = self._resample_candles(df, rule)
+            if child is not None and not child.empty:
+                data[child_tf] = child.tail(timeframes[child_tf]).reset_index(drop=True)
+            else:
+                logger.warning(f"[WARNING] Could not build {symbol} {child_tf} from {tf} data")
         
         logger.info(f"[OK] Fetched {len(data)}/{len(timeframes)} timeframes for {symbol}")
         
         return data
 
+    async def _fetch_timeframe_cached(self, symbol: str, timeframe: str, count: int) -> Optional[pd.DataFrame]:
+        """
+        fetch_timeframe with reuse of closed higher-timeframe candles within
+        the current bar bucket (e.g. the full 1h history is fetched once per
+        hour). The still-forming bar is never cached: on a hit only the last
+        _HTF_TAIL_COUNT bars are requested and merged onto the closed bars.
+        1m always goes to the network.
+        """
+        period = _HTF_BUCKET_SECONDS.get(timeframe)
+        if period is None:
+            return await self.fetch_timeframe(symbol, timeframe, count)
+        
+        bucket = int(time.time()) // period
+        cached = self._htf_cache.get((symbol, timeframe))
+        if cached is not None and cached[0] == bucket:
+            tail = await self.fetch_timeframe(symbol, timeframe, _HTF_TAIL_COUNT)
+            if tail is not None and not tail.empty:
+                # concat builds a new frame, so callers never share the cache
+                merged = pd.concat([cached[1], tail], ignore_index=True)
+                merged = merged.drop_duplicates('timestamp', keep='last').sort_values('timestamp')
+                return merged.tail(count).reset_index(drop=True)
+            # Tail request failed: fall back to a full fetch below
+        
+        df = await self.fetch_timeframe(symbol, timeframe, count)
+        if df is not None and not df.empty:
+            closed = df[df['timestamp'] < bucket * period]
+            self._htf_cache[(symbol, timeframe)] = (bucket, closed.copy())
+        return df
+
+    def _resample_candles(self, df: pd.DataFrame, rule: str) -> Optional[pd.DataFrame]:
+        """
+        Aggregate OHLC candles into a larger bar size (e.g. 1m -> 5min).
+        Buckets are epoch-aligned like Deriv's own candles, and 'timestamp'
+        is the bucket open epoch.
+        """
+        if df is None or df.empty:
+            return None
+        
+        try:
+            frame = df.set_index('datetime')
+            out = frame.resample(rule, label='left', closed='left').agg({
+                'open': 'first',
+                'high': 'max',
+                'low': 'min',
+                'close': 'last',
+            }).dropna()
+            out['timestamp'] = (out.index - pd.Timestamp(0)) // pd.Timedelta(seconds=1)
+            out = out.reset_index()
+            return out[['timestamp', 'open', 'high', 'low', 'close', 'datetime']]
+        except Exception as e:
+            logger.error(f"[ERROR] Resampling to {rule} failed: {e}")
+            return None
+
     def _resample_to_weekly(self, df_daily: pd.DataFrame) -> Optional[pd.DataFrame]:
         """
         Resample daily data to weekly data
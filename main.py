@@ -5,6 +5,7 @@ main.py - MULTI-ASSET WITH TOP-DOWN STRATEGY SUPPORT
 """
 
 import asyncio
+import logging
 import signal
 import sys
 from datetime import datetime
@@ -213,7 +214,8 @@ class TradingBot:
                     return None
                 
                 fetched_tfs = list(all_timeframes.keys())
-                logger.debug(f"   Fetched timeframes: {', '.join(fetched_tfs)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("   Fetched timeframes: %s", ", ".join(fetched_tfs))
                 
                 # Analyze with all available timeframes
                 signal = self.strategy.analyze(
@@ -277,7 +279,7 @@ class TradingBot:
         tasks = [analyze_with_semaphore(symbol) for symbol in self.symbols]
         
         # Execute all analyses in parallel
-        logger.debug(f"⚡ Running {len(tasks)} analyses in parallel (max {max_concurrent} concurrent)...")
+        logger.debug("⚡ Running %s analyses in parallel (max %s concurrent)...", len(tasks), max_concurrent)
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Process results
@@ -298,7 +300,7 @@ class TradingBot:
                 logger.info(f"✅ {symbol}: Valid {result['signal']} signal (score: {result.get('score', 0)})")
             else:
                 reason = result['details'].get('reason', 'Unknown') if result else 'Analysis failed'
-                logger.debug(f"⚪ {symbol}: {reason}")
+                logger.debug("⚪ %s: %s", symbol, reason)
         
         if not valid_signals:
             logger.info("📭 No valid signals found across all assets")
@@ -318,7 +320,7 @@ class TradingBot:
             can_trade, reason = self.risk_manager.can_trade()
             
             if not can_trade:
-                logger.debug(f"⏸️ Cannot trade: {reason}")
+                logger.debug("⏸️ Cannot trade: %s", reason)
                 return
             
             # Scan all assets for trading opportunities
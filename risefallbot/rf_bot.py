@@ -642,7 +642,8 @@ async def run(stake: Optional[float] = None, api_token: Optional[str] = None,
         while _is_running_for_user(user_id):
             cycle += 1
             await _refresh_session_lock(user_id)
-            logger.debug(f"[RF] Cycle #{cycle} | {datetime.now().strftime('%H:%M:%S')}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[RF] Cycle #%s | %s", cycle, datetime.now().strftime('%H:%M:%S'))
 
             # Daily stats reset at midnight
             risk_manager.ensure_daily_reset_if_needed()
@@ -893,8 +894,13 @@ async def run(stake: Optional[float] = None, api_token: Optional[str] = None,
         if risk_manager.trade_mutex.locked():
             risk_manager.release_trade_lock(reason="bot shutdown — forced cleanup")
 
-        await data_fetcher.disconnect()
-        await trade_engine.disconnect()
+        # Independent sockets: close both at once; one failing must not
+        # keep the other open or skip the session-lock release below.
+        await asyncio.gather(
+            data_fetcher.disconnect(),
+            trade_engine.disconnect(),
+            return_exceptions=True,
+        )
 
         # Release cross-process session lock
         await _release_session_lock(user_id)
@@ -1012,7 +1018,7 @@ async def _broadcast_rf_decision(
     try:
         await event_manager.broadcast(payload)
     except Exception as e:
-        logger.debug(f"[RF] Decision event broadcast skipped due to error: {e}")
+        logger.debug("[RF] Decision event broadcast skipped due to error: %s", e)
 
 
 async def _process_symbol(
@@ -118,7 +118,7 @@ class ScalpingStrategy(BaseStrategy):
             logger.warning(f"[SCALPING][{symbol}] ADX fallback applied (0)")
             adx_1m = 0.0
 
-        logger.debug(f"[SCALPING][{symbol}] Indicators | RSI={rsi_1m:.2f} ADX={adx_1m:.2f}")
+        logger.debug("[SCALPING][%s] Indicators | RSI=%.2f ADX=%.2f", symbol, rsi_1m, adx_1m)
 
         if adx_1m < scalping_config.SCALPING_ADX_THRESHOLD:
             _step_log(3, f"Weak trend (ADX {adx_1m:.1f} < {scalping_config.SCALPING_ADX_THRESHOLD})")
@@ -391,7 +391,7 @@ class ScalpingStrategy(BaseStrategy):
         """
         min_required = slow_period + 5
         if len(df) < min_required:
-            logger.debug(f"[SCALPING][{timeframe_name}] Insufficient candles for bias detection")
+            logger.debug("[SCALPING][%s] Insufficient candles for bias detection", timeframe_name)
             return None
 
         ema_fast = self._calculate_ema(df, fast_period)
@@ -428,7 +428,7 @@ class ScalpingStrategy(BaseStrategy):
         lookback = max(int(crossover_lookback), 1)
         min_required = max(slow_period + 5, lookback + 3)
         if len(df) < min_required:
-            logger.debug(f"[SCALPING][{timeframe_name}] Insufficient candles for trend detection")
+            logger.debug("[SCALPING][%s] Insufficient candles for trend detection", timeframe_name)
             return None
 
         ema_fast = self._calculate_ema(df, fast_period)
@@ -150,7 +150,7 @@ class ScalpingStrategy(BaseStrategy):
             logger.warning(f"[SCALPING][{symbol}] ADX fallback applied (0)")
             adx_1m = 0.0
 
-        logger.debug(f"[SCALPING][{symbol}] Indicators | RSI={rsi_1m:.2f} ADX={adx_1m:.2f}")
+        logger.debug("[SCALPING][%s] Indicators | RSI=%.2f ADX=%.2f", symbol, rsi_1m, adx_1m)
 
         # ------------------------------------------------------------------
         # STEP 4/9: ADX threshold
@@ -7,10 +7,11 @@ Sends trade notifications via Telegram
 import os
 import asyncio
 import re
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 from telegram import Bot
 from telegram.error import TelegramError
+from telegram.request import HTTPXRequest
 import logging
 import config
 from utils import format_currency
@@ -82,9 +83,25 @@ class TelegramNotifier:
         # within a short TTL window to prevent won/sold double-alerts.
         self.processed_closed_trades: Dict[str, datetime] = {}
         
+        # Trade-close coalescing: closes arriving within close_batch_window
+        # (e.g. several users stopped out together) share one Telegram send
+        # of up to close_batch_max messages, instead of one request each.
+        self.close_batch_window: float = 0.25
+        self.close_batch_max: int = 10
+        self._pending_closes: List[str] = []
+        # Owned by the notifier, not by the close that opened the window, so
+        # cancelling that caller cannot strand the queued messages.
+        self._close_flush_task: Optional[asyncio.Task] = None
+        
         if self.bot_token and self.chat_id:
             try:
-                self.bot = Bot(token=self.bot_token)
+                # One Bot (and its pooled HTTPX client) for the whole process so
+                # notifications reuse keep-alive connections instead of
+                # re-handshaking TLS; pool sized for concurrent fire-and-forget sends.
+                self.bot = Bot(
+                    token=self.bot_token,
+                    request=HTTPXRequest(connection_pool_size=8, pool_timeout=5.0),
+                )
                 self.enabled = True
                 logger.info("✅ Telegram notifications enabled")
             except Exception as e:
@@ -396,6 +413,15 @@ class TelegramNotifier:
 
         return "Configured by strategy risk rules"
 
+    async def close(self):
+        """Close the persistent Telegram HTTP session (call on app shutdown)"""
+        if self.bot is None:
+            return
+        try:
+            await self.bot.shutdown()
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to close Telegram session: {e}")
+
     async def send_message(self, message: str, parse_mode: str = "HTML", retries: int = 3) -> bool:
         """
         Send a message via Telegram with timeout and retry logic
@@ -711,7 +737,48 @@ class TelegramNotifier:
             f"Duration: {duration_text}\n"
             f"ID: <code>{contract_id or 'N/A'}</code> | Time: {datetime.now().strftime('%H:%M:%S')}"
         )
-        await self.send_message(message)
+        await self._send_trade_close(message)
+
+    async def _send_trade_close(self, message: str):
+        """
+        Queue a trade-close message for a coalesced send.
+
+        The first close in a window starts a flush task that waits
+        close_batch_window, then sends everything queued meanwhile; every
+        close returns at once.
+        """
+        self._pending_closes.append(message)
+        if self._live_close_flush_task() is None:
+            self._close_flush_task = asyncio.create_task(self._flush_trade_closes())
+
+    def _live_close_flush_task(self) -> Optional[asyncio.Task]:
+        """The pending flush task, ignoring one left behind by a stopped event loop"""
+        task = self._close_flush_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            return None
+        return task
+
+    async def _flush_trade_closes(self):
+        """Send the queued trade-close messages in batches of close_batch_max"""
+        try:
+            await asyncio.sleep(self.close_batch_window)
+        except asyncio.CancelledError:
+            # Queue is kept; the next close starts a fresh flush for it
+            self._close_flush_task = None
+            raise
+        # Closes queued from here on open a new window with their own task
+        batch, self._pending_closes = self._pending_closes, []
+        self._close_flush_task = None
+        for start in range(0, len(batch), self.close_batch_max):
+            chunk = batch[start:start + self.close_batch_max]
+            try:
+                sent = await self.send_message("\n\n".join(chunk))
+            except Exception as e:
+                logger.error(f"❌ Trade-close batch send failed ({len(chunk)} messages): {e}")
+                continue
+            if not sent and self.enabled:
+                logger.error(f"❌ Trade-close batch not delivered ({len(chunk)} messages)")
+
     async def notify_daily_summary(self, stats: Dict):
         """Send daily trading summary"""
         win_rate = stats.get("win_rate", 0)
@@ -773,6 +840,11 @@ class TelegramNotifier:
     
     async def notify_bot_stopped(self, stats: Dict):
         """Notify that bot has stopped"""
+        # Let a pending trade-close batch go out before the stop summary.
+        # asyncio.wait leaves the flush task running if this caller is cancelled.
+        flush_task = self._live_close_flush_task()
+        if flush_task is not None:
+            await asyncio.wait({flush_task}, timeout=self.close_batch_window + 5)
         total_pnl = stats.get("total_pnl", 0)
 
         message = (
@@ -497,3 +497,16 @@ def test_monitor_logs_repairs_mojibake_lines(mock_auth):
         logs = response.json()["logs"]
         assert any("✅ Trade Engine connected to Deriv API" in line for line in logs)
         assert any("• R_25: 160x" in line for line in logs)
+
+
+def test_config_update_strategy_invalidates_manager_strategy_cache(mock_auth):
+    with patch("app.api.config.supabase") as mock_supabase, \
+         patch("app.api.config.cache"), \
+         patch("app.api.config.bot_manager") as mock_bot_manager:
+        mock_supabase.table.return_value.update.return_value.eq.return_value.execute.return_value = MagicMock()
+        mock_bot_manager._bots = {}
+
+        response = client.put("/api/v1/config/update", json={"active_strategy": "Scalping"})
+
+        assert response.status_code == 200
+        mock_bot_manager.invalidate_user_strategy.assert_called_once_with(mock_auth["id"])
@@ -59,6 +59,7 @@ async def test_bot_runner_start_stop(mock_components):
     async def fake_run():
         runner.is_running = True
         runner.status = BotStatus.RUNNING
+        runner._ready_event.set()
         while runner.is_running:
             await asyncio.sleep(0.1)
     
@@ -140,7 +141,7 @@ async def test_bot_runner_run_bot_initialization(mock_components):
             reached_running = True
         raise asyncio.CancelledError()
 
-    with patch("app.bot.runner.asyncio.sleep", side_effect=side_effect):
+    with patch.object(runner, "_wait_for_stop", side_effect=side_effect):
         try:
             await runner._run_bot()
         except asyncio.CancelledError:
@@ -162,7 +163,7 @@ async def test_bot_runner_active_trade_monitor_ignores_entry_cooldown(mock_compo
     runner.risk_manager.active_trades = ["C001"]
 
     async def fake_scan_cycle():
-        # End after first loop iteration; _run_bot should still compute wait_time.
+        # End after first loop iteration; _run_bot should still compute the wait.
         runner.is_running = False
 
     runner._multi_asset_scan_cycle = AsyncMock(side_effect=fake_scan_cycle)
@@ -170,8 +171,11 @@ async def test_bot_runner_active_trade_monitor_ignores_entry_cooldown(mock_compo
     with patch("app.bot.runner.logger.debug") as mock_debug:
         await runner._run_bot()
 
-    messages = [str(call.args[0]) for call in mock_debug.call_args_list if call.args]
-    assert any("Active trade monitor in 1s" in msg for msg in messages)
+    messages = [str(call.args[0]) % call.args[1:] for call in mock_debug.call_args_list if call.args]
+    monitor = [msg for msg in messages if "Active trade monitor in" in msg]
+    assert monitor
+    # Logged wait is the actual sleep: the 1s interval minus scan time, never the 45s cooldown
+    assert 0.0 <= float(monitor[0].rsplit(" in ", 1)[1].rstrip("s")) <= 1.0
 
 @pytest.mark.asyncio
 async def test_bot_runner_scan_cycle_executes_trade(mock_components, sample_ohlc_data):
@@ -228,6 +232,22 @@ async def test_bot_runner_scan_cycle_executes_trade(mock_components, sample_ohlc
     assert runner.signals_by_symbol["R_25"] == 1
     assert len(runner.state.recent_signals) == 1
 
+    # Post-trade events go out as one composite broadcast
+    batch = mock_components["em"].broadcast_batch.await_args.args[0]
+    assert [event["type"] for event in batch][0] == "trade_closed"
+    assert mock_components["em"].broadcast_batch.await_count == 1
+
+    # Same statistics after the next close -> no duplicate statistics event
+    stats_events = lambda: [
+        event for c in mock_components["em"].broadcast_batch.await_args_list
+        for event in c.args[0] if event.get("type") == "statistics"
+    ]
+    assert len(stats_events()) == 1
+    runner._cycle_signal_claimed = False
+    runner.symbols = ["R_25"]
+    await runner._analyze_symbol("R_25")
+    assert len(stats_events()) == 1
+
 @pytest.mark.asyncio
 async def test_bot_runner_monitor_active_trade_none(mock_components):
     runner = BotRunner(account_id="test_user")
@@ -287,6 +307,7 @@ async def test_bot_runner_monitor_active_trade_already_closed(mock_components):
         for t in runner.state.active_trades
     )
     assert mock_components["uts"].save_trade.called
+    await runner._flush_notifications()
     runner.telegram_bridge.notify_trade_closed.assert_awaited_once()
 
 @pytest.mark.asyncio
@@ -662,6 +683,7 @@ async def test_runner_startup_reconcile_settles_stale_open_db_trade(mock_compone
     payload = mock_components["uts"].save_trade.call_args[0][1]
     assert payload["contract_id"] == "C-CLOSED-1"
     assert payload["status"] != "open"
+    await runner._flush_notifications()
     assert runner.telegram_bridge.notify_trade_closed.await_count == 1
 
 
@@ -735,4 +757,105 @@ async def test_runner_startup_reconcile_handles_manual_and_system_entries(mock_c
     assert saved_payload["contract_id"] == "SYSTEM-CLOSED-1"
     assert saved_payload["status"] != "open"
     assert float(saved_payload["profit"]) == pytest.approx(-3.25)
+    await runner._flush_notifications()
     assert runner.telegram_bridge.notify_trade_closed.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_bot_runner_main_loop_waits_once_per_cycle(mock_components):
+    runner = BotRunner(account_id="test_user", api_token="valid_token")
+    runner.user_stake = 10.0
+
+    runner.risk_manager = MagicMock()
+    runner.risk_manager.check_for_existing_positions = AsyncMock(return_value=False)
+    runner.risk_manager.get_cooldown_remaining.return_value = 0
+    runner.risk_manager.active_trades = []
+    runner._multi_asset_scan_cycle = AsyncMock()
+
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        runner.is_running = False
+
+    with patch.object(runner, "_wait_for_stop", side_effect=fake_sleep):
+        await runner._run_bot()
+
+    assert len(sleeps) == 1
+    assert sleeps[0] == pytest.approx(30, abs=1)
+
+
+@pytest.mark.asyncio
+async def test_bot_runner_main_loop_deducts_cycle_time_from_interval(mock_components):
+    runner = BotRunner(account_id="test_user", api_token="valid_token")
+    runner.user_stake = 10.0
+
+    runner.risk_manager = MagicMock()
+    runner.risk_manager.check_for_existing_positions = AsyncMock(return_value=False)
+    runner.risk_manager.get_cooldown_remaining.return_value = 0
+    runner.risk_manager.active_trades = []
+
+    # start mark, cycle start, cycle end
+    clock = iter([900.0, 1000.0, 1025.0])
+    runner._multi_asset_scan_cycle = AsyncMock()
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        runner.is_running = False
+
+    with patch("app.bot.runner.time", MagicMock(monotonic=lambda: next(clock))), \
+         patch.object(runner, "_wait_for_stop", side_effect=fake_sleep):
+        await runner._run_bot()
+
+    assert sleeps == [pytest.approx(5.0)]
+
+
+@pytest.mark.asyncio
+async def test_bot_runner_start_does_not_duplicate_running_status(mock_components):
+    runner = BotRunner(account_id="test_user")
+
+    async def fake_run():
+        runner.is_running = True
+        runner.status = BotStatus.RUNNING
+        runner._ready_event.set()
+        while runner.is_running:
+            await asyncio.sleep(0.1)
+
+    with patch.object(BotRunner, "_run_bot", side_effect=fake_run):
+        res = await runner.start_bot(stake=10.0)
+        assert res["success"] is True
+        sent = [c.args[0] for c in mock_components["em"].broadcast.await_args_list]
+        assert not any(m.get("type") == "bot_status" for m in sent)
+        await runner.stop_bot()
+
+
+@pytest.mark.asyncio
+async def test_bot_runner_start_loads_history_off_the_event_loop(mock_components):
+    import threading
+
+    runner = BotRunner(account_id="test_user")
+    history = [{"contract_id": "old1"}]
+    seen_threads = []
+
+    def fake_get_user_trades(user_id, limit=50):
+        seen_threads.append(threading.current_thread())
+        assert (user_id, limit) == ("test_user", 100)
+        return history
+
+    mock_components["uts"].get_user_trades.side_effect = fake_get_user_trades
+
+    async def fake_run():
+        runner.is_running = True
+        runner.status = BotStatus.RUNNING
+        runner._ready_event.set()
+        while runner.is_running:
+            await asyncio.sleep(0.1)
+
+    with patch.object(BotRunner, "_run_bot", side_effect=fake_run):
+        res = await runner.start_bot(stake=10.0)
+        assert res["success"] is True
+        await runner.stop_bot()
+
+    assert seen_threads and seen_threads[0] is not threading.main_thread()
+    assert runner.state.trade_history == history
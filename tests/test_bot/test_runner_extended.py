@@ -1,5 +1,7 @@
 import pytest
 import asyncio
+import threading
+import time
 from unittest.mock import MagicMock, AsyncMock, patch
 from datetime import datetime
 from app.bot.runner import BotRunner, BotStatus
@@ -67,6 +69,7 @@ async def test_run_bot_connection_failure(runner, mock_deps):
     df_instance = mock_deps["df"].return_value
     df_instance.connect = AsyncMock(return_value=False)
     df_instance.last_error = "Connection timeout"
+    mock_deps["te"].return_value.connect = AsyncMock(return_value=True)
     
     await runner._run_bot()
     assert runner.status == BotStatus.ERROR
@@ -214,6 +217,7 @@ async def test_analyze_symbol_manual_mode_skips_execution_and_emits_signal_metad
     assert await runner._analyze_symbol("R_25") is False
     runner.risk_manager.can_open_trade.assert_not_called()
     runner.trade_engine.execute_trade.assert_not_called()
+    await runner._flush_notifications()
     runner.telegram_bridge.notify_signal.assert_awaited_once()
 
     payloads = [c.args[0] for c in ev.broadcast.await_args_list if c.args]
@@ -336,4 +340,1051 @@ async def test_monitor_active_trade_fallback_closes_when_status_missing_and_not_
     risk_manager.record_trade_close.assert_called_once_with("c1", 0.0, "closed")
     runner.state.update_trade.assert_called_once()
     assert "c1" not in runner._active_status_miss_counts
+    assert not [k for k in runner.last_status_log if k.startswith("active:c1")]
     assert mock_save.called
+
+
+@pytest.mark.asyncio
+async def test_monitor_active_trade_saves_closed_trade_off_event_loop(runner):
+    runner.account_id = "u-test"
+    runner.state = MagicMock()
+    runner.telegram_bridge = MagicMock(notify_trade_closed=AsyncMock())
+
+    risk_manager = MagicMock()
+    risk_manager.active_trades = ["c1"]
+    risk_manager.get_active_trade_info.return_value = {
+        "contract_id": "c1",
+        "symbol": "R_25",
+        "stake": 10.0,
+    }
+    runner.risk_manager = risk_manager
+
+    trade_engine = MagicMock()
+    trade_engine.get_trade_status = AsyncMock(
+        return_value={"contract_id": "c1", "status": "won", "is_sold": True, "profit": 2.5}
+    )
+    runner.trade_engine = trade_engine
+
+    loop_thread = threading.get_ident()
+    save_threads = []
+
+    def fake_save(account_id, payload):
+        save_threads.append(threading.get_ident())
+        return {"contract_id": payload["contract_id"]}
+
+    with patch("app.bot.runner.UserTradesService.save_trade", side_effect=fake_save), \
+         patch("app.bot.runner.event_manager", new_callable=AsyncMock):
+        await runner._monitor_active_trade()
+        await runner._flush_notifications()
+
+    assert save_threads and loop_thread not in save_threads
+
+
+@pytest.mark.asyncio
+async def test_start_bot_returns_on_early_run_failure_without_timeout(runner, mock_deps):
+    async def failing_run():
+        runner.status = BotStatus.ERROR
+        runner.error_message = "Deriv API connection failed: boom"
+        runner._error_event.set()
+
+    with patch.object(BotRunner, "_run_bot", side_effect=failing_run):
+        res = await asyncio.wait_for(runner.start_bot(stake=10.0), timeout=2)
+
+    assert res["success"] is False
+    assert "Deriv API connection failed" in res["message"]
+
+
+@pytest.mark.asyncio
+async def test_run_bot_connects_components_concurrently(runner, mock_deps):
+    runner.api_token = "valid_token"
+    both_started = asyncio.Event()
+    started = []
+
+    async def _connect(name):
+        started.append(name)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return name == "df"
+
+    async def _df_connect():
+        return await _connect("df")
+
+    async def _te_connect():
+        return await _connect("te")
+
+    mock_deps["df"].return_value.connect = _df_connect
+    mock_deps["te"].return_value.connect = _te_connect
+
+    await runner._run_bot()
+    assert sorted(started) == ["df", "te"]
+    assert runner.status == BotStatus.ERROR
+    assert "TradeEngine failed to connect" in runner.error_message
+
+
+@pytest.mark.asyncio
+async def test_run_bot_connect_exception_reported(runner, mock_deps):
+    runner.api_token = "valid_token"
+    mock_deps["df"].return_value.connect = AsyncMock(side_effect=RuntimeError("tls reset"))
+    mock_deps["te"].return_value.connect = AsyncMock(return_value=True)
+
+    await runner._run_bot()
+    assert runner.status == BotStatus.ERROR
+    assert "DataFetcher failed to connect: tls reset" in runner.error_message
+
+
+@pytest.mark.asyncio
+async def test_stop_bot_abandons_task_that_ignores_cancellation(runner, monkeypatch):
+    monkeypatch.setattr(config, "BOT_SHUTDOWN_GRACE_SECONDS", 0.05, raising=False)
+    monkeypatch.setattr("app.bot.runner._FORCED_CANCEL_TIMEOUT", 0.1)
+    release = asyncio.Event()
+
+    async def stubborn():
+        while not release.is_set():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                continue
+
+    runner.is_running = True
+    runner.status = BotStatus.RUNNING
+    task = asyncio.create_task(stubborn())
+    runner.task = task
+    runner.data_fetcher = MagicMock(disconnect=AsyncMock())
+    runner.trade_engine = MagicMock(disconnect=AsyncMock())
+    runner.telegram_bridge = MagicMock(notify_bot_stopped=AsyncMock())
+
+    started = time.monotonic()
+    with patch("app.bot.runner.event_manager", new_callable=AsyncMock), \
+         patch("app.bot.runner.logger") as mock_logger:
+        res = await asyncio.wait_for(runner.stop_bot(), timeout=3)
+    elapsed = time.monotonic() - started
+
+    assert res["success"] is True
+    assert elapsed < 2
+    assert not task.done()
+    assert any("re-cancelling" in str(c.args[0]) for c in mock_logger.warning.call_args_list)
+    assert any("abandoning it" in str(c.args[0]) for c in mock_logger.error.call_args_list)
+    assert runner.status == BotStatus.STOPPED
+    runner.data_fetcher.disconnect.assert_awaited_once()
+    runner.trade_engine.disconnect.assert_awaited_once()
+    release.set()
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+
+@pytest.mark.asyncio
+async def test_stop_bot_propagates_its_own_cancellation(runner, monkeypatch):
+    monkeypatch.setattr(config, "BOT_SHUTDOWN_GRACE_SECONDS", 5, raising=False)
+    release = asyncio.Event()
+
+    async def stubborn():
+        while not release.is_set():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                continue
+
+    runner.is_running = True
+    runner.status = BotStatus.RUNNING
+    task = asyncio.create_task(stubborn())
+    runner.task = task
+
+    with patch("app.bot.runner.event_manager", new_callable=AsyncMock):
+        stopper = asyncio.create_task(runner.stop_bot())
+        await asyncio.sleep(0.05)
+        stopper.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await stopper
+
+    release.set()
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+def test_get_status_reuses_statistics_within_ttl(runner):
+    runner.state.update_statistics({"total_trades": 1})
+    first = runner.get_status()["statistics"]
+
+    runner.state.update_statistics({"total_trades": 2})
+    assert runner.get_status()["statistics"] is first
+
+    runner._stats_cache = (0.0, None)
+    assert runner.get_status()["statistics"] == {"total_trades": 2}
+
+
+def test_get_status_uses_precomputed_start_time(runner):
+    started = datetime(2024, 1, 1, 12, 0, 0)
+    runner.start_time = started
+    runner._start_time_iso = started.isoformat()
+    with patch("app.bot.runner.time.monotonic", return_value=100.0):
+        runner._start_monotonic = 40.0
+        status = runner.get_status()
+
+    assert status["start_time"] == "2024-01-01T12:00:00"
+    assert status["uptime_seconds"] == 60
+
+
+@pytest.mark.asyncio
+async def test_notify_runs_in_background_and_flush_waits(runner):
+    gate = asyncio.Event()
+    delivered = []
+
+    async def slow_notify():
+        await gate.wait()
+        delivered.append(True)
+
+    async def failing_notify():
+        raise RuntimeError("telegram down")
+
+    runner._notify(slow_notify())
+    runner._notify(failing_notify())
+    assert delivered == []
+    assert len(runner._notify_tasks) == 2
+
+    gate.set()
+    await runner._flush_notifications()
+    assert delivered == [True]
+    assert not runner._notify_tasks
+
+
+@pytest.mark.asyncio
+async def test_signal_broadcast_overlaps_execution(runner, monkeypatch):
+    order = []
+    broadcast_started = asyncio.Event()
+
+    async def slow_broadcast(message):
+        if message.get("type") == "signal":
+            order.append("broadcast_start")
+            broadcast_started.set()
+            await asyncio.sleep(0.05)
+            order.append("broadcast_end")
+
+    async def fake_execute(symbol, signal, passed_checks=None):
+        await broadcast_started.wait()
+        order.append("execute")
+        return True
+
+    monkeypatch.setattr("app.bot.runner.event_manager", MagicMock(broadcast=slow_broadcast))
+    runner._execute_detected_signal = fake_execute
+    runner.data_fetcher = MagicMock()
+    runner.data_fetcher.fetch_all_timeframes = AsyncMock(
+        return_value={tf: object() for tf in ["1m", "5m", "1h", "4h", "1d", "1w"]}
+    )
+    runner.strategy = MagicMock()
+    runner.strategy.get_required_timeframes.return_value = ["1m"]
+    runner.strategy.analyze.return_value = {"can_trade": True, "signal": "BUY", "details": {}}
+    runner.telegram_bridge = MagicMock(notify_signal=AsyncMock())
+
+    assert await runner._analyze_symbol("R_25") is True
+    assert order == ["broadcast_start", "execute", "broadcast_end"]
+
+
+@pytest.mark.asyncio
+async def test_background_signal_consumers_get_snapshots(runner, monkeypatch):
+    broadcasts = []
+
+    async def capture_broadcast(message):
+        broadcasts.append(message)
+
+    async def mutating_execute(symbol, signal, passed_checks=None):
+        # Execution enriches the live dict before the background tasks run
+        signal["stake"] = 99.0
+        signal["execution_reason"] = "executed"
+        signal["action_taken"] = "executed"
+        return True
+
+    monkeypatch.setattr("app.bot.runner.event_manager", MagicMock(broadcast=capture_broadcast))
+    runner._execute_detected_signal = mutating_execute
+    runner.user_stake = 5.0
+    runner.data_fetcher = MagicMock()
+    runner.data_fetcher.fetch_all_timeframes = AsyncMock(
+        return_value={tf: object() for tf in ["1m", "5m", "1h", "4h", "1d", "1w"]}
+    )
+    runner.strategy = MagicMock()
+    runner.strategy.get_required_timeframes.return_value = ["1m"]
+    runner.strategy.analyze.return_value = {"can_trade": True, "signal": "BUY", "details": {}}
+    runner.telegram_bridge = MagicMock(notify_signal=AsyncMock())
+
+    assert await runner._analyze_symbol("R_25") is True
+    await runner._flush_notifications()
+
+    notified = runner.telegram_bridge.notify_signal.await_args.args[0]
+    assert notified["stake"] == 5.0
+    assert notified.get("execution_reason") != "executed"
+    signal_events = [m for m in broadcasts if m.get("type") == "signal"]
+    assert signal_events[0]["action_taken"] != "executed"
+
+@pytest.mark.asyncio
+async def test_scan_cycle_global_gate_blocks_before_data_fetch(runner, monkeypatch):
+    monkeypatch.setattr("app.bot.runner.event_manager", AsyncMock())
+    runner._recover_runtime_active_trades = MagicMock()
+    runner.risk_manager = MagicMock()
+    runner.risk_manager.active_trades = []
+    runner.risk_manager.can_trade.return_value = (False, "cooldown")
+    runner.data_fetcher = MagicMock(fetch_all_timeframes=AsyncMock())
+
+    await runner._multi_asset_scan_cycle()
+
+    runner.data_fetcher.fetch_all_timeframes.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_scan_cycle_skips_global_gate_while_monitoring(runner, monkeypatch):
+    monkeypatch.setattr("app.bot.runner.event_manager", AsyncMock())
+    runner._recover_runtime_active_trades = MagicMock()
+    runner._monitor_active_trade = AsyncMock()
+    runner.risk_manager = MagicMock()
+    runner.risk_manager.active_trades = ["C1"]
+
+    await runner._multi_asset_scan_cycle()
+
+    runner._monitor_active_trade.assert_awaited_once()
+    runner.risk_manager.can_trade.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_restart_bot_has_no_settle_delay(runner):
+    runner.start_bot = AsyncMock(return_value={"success": True})
+    runner.stop_bot = AsyncMock(return_value={"success": True})
+    runner.is_running = True
+    with patch("app.bot.runner.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+        res = await runner.restart_bot()
+    assert res["success"] is True
+    mock_sleep.assert_not_awaited()
+
+
+def test_status_assignment_keeps_serialized_value_in_sync(runner):
+    runner.status = BotStatus.RUNNING
+    assert runner._status_str == "running"
+    assert runner.get_status()["status"] == "running"
+    runner.status = BotStatus.ERROR
+    assert runner.get_status()["status"] == "error"
+
+
+def test_now_iso_is_utc_with_second_resolution():
+    from app.bot.runner import _now_iso
+
+    value = _now_iso()
+    parsed = datetime.fromisoformat(value)
+    assert value.endswith("+00:00")
+    assert parsed.microsecond == 0
+
+
+@pytest.mark.asyncio
+async def test_scan_cycle_bounds_symbol_concurrency(runner, monkeypatch):
+    monkeypatch.setattr("app.bot.runner.event_manager", AsyncMock())
+    runner._recover_runtime_active_trades = MagicMock()
+    runner.risk_manager = MagicMock()
+    runner.risk_manager.active_trades = []
+    runner.risk_manager.can_trade.return_value = (True, "ok")
+    runner.symbols = ["R_10", "R_25", "R_50", "R_75", "R_100"]
+    runner._scan_semaphore = asyncio.BoundedSemaphore(2)
+
+    in_flight = 0
+    peak = 0
+
+    async def fake_analyze(_symbol):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return False
+
+    runner._analyze_symbol = fake_analyze
+    await runner._multi_asset_scan_cycle()
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_scan_cycle_lets_losing_analyses_finish_instead_of_cancelling(runner, monkeypatch):
+    monkeypatch.setattr("app.bot.runner.event_manager", AsyncMock())
+    runner._recover_runtime_active_trades = MagicMock()
+    runner.risk_manager = MagicMock()
+    runner.risk_manager.active_trades = []
+    runner.risk_manager.can_trade.return_value = (True, "ok")
+    runner.symbols = ["R_10", "R_25"]
+    runner.asset_config = {"R_10": {"multiplier": 400}, "R_25": {"multiplier": 160}}
+    finished = []
+
+    async def fake_analyze(symbol):
+        if symbol == "R_25":
+            return True
+        # Simulates a fetch still in flight on the shared socket
+        await asyncio.sleep(0.02)
+        finished.append(symbol)
+        return False
+
+    runner._analyze_symbol = fake_analyze
+    await asyncio.wait_for(runner._multi_asset_scan_cycle(), timeout=1)
+
+    assert finished == ["R_10"]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_stop_returns_on_stop_or_timeout(runner):
+    assert await runner._wait_for_stop(0.01) is False
+    runner._stop_event.set()
+    assert await asyncio.wait_for(runner._wait_for_stop(30), timeout=1) is True
+
+
+def test_strategy_to_bot_type_maps_known_names_and_defaults_to_system():
+    from app.bot.runner import _strategy_to_bot_type
+
+    assert _strategy_to_bot_type(" Scalping ") == "scalping"
+    assert _strategy_to_bot_type("Conservative") == "conservative"
+    assert _strategy_to_bot_type("RiseFall") == "risefall"
+    assert _strategy_to_bot_type("Unknown") == "system"
+    assert _strategy_to_bot_type(None) == "system"
+
+
+def test_strategy_name_is_cached_per_strategy_object(runner):
+    calls = []
+    first = MagicMock()
+    first.get_strategy_name.side_effect = lambda: calls.append(1) or "Scalping"
+    runner.strategy = first
+    assert runner._get_strategy_name() == "Scalping"
+    assert runner._get_strategy_name() == "Scalping"
+    assert len(calls) == 1
+
+    second = MagicMock()
+    second.get_strategy_name.return_value = "Conservative"
+    runner.strategy = second
+    assert runner._get_strategy_name() == "Conservative"
+
+
+def test_should_emit_decision_throttles_on_monotonic_clock(runner):
+    with patch("app.bot.runner.time.monotonic", side_effect=[100.0, 105.0, 125.0]):
+        assert runner._should_emit_decision("k", "fp") is True
+        assert runner._should_emit_decision("k", "fp") is False
+        assert runner._should_emit_decision("k", "fp") is True
+
+
+def test_sync_strategy_scope_keeps_counters_when_symbols_unchanged(runner):
+    runner.strategy = MagicMock()
+    runner.strategy.get_symbols.return_value = ["R_25", "R_50"]
+    runner.strategy.get_asset_config.return_value = {}
+    runner._sync_strategy_scope()
+    runner.signals_by_symbol["R_25"] = 3
+    counters = runner.signals_by_symbol
+
+    runner._sync_strategy_scope()
+    assert runner.signals_by_symbol is counters
+
+    runner.strategy.get_symbols.return_value = ["R_25"]
+    runner._sync_strategy_scope()
+    assert runner.signals_by_symbol == {"R_25": 3}
+    assert runner.errors_by_symbol == {"R_25": 0}
+
+
+@pytest.mark.asyncio
+async def test_send_concurrently_runs_sends_together_and_swallows_errors(runner):
+    started = []
+    release = asyncio.Event()
+
+    async def send(name):
+        started.append(name)
+        await release.wait()
+
+    async def failing():
+        raise RuntimeError("telegram down")
+
+    task = asyncio.create_task(runner._send_concurrently(send("telegram"), send("ws"), failing()))
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert started == ["telegram", "ws"]
+    release.set()
+    await task
+
+
+def test_cycle_step_line_has_local_second_resolution_timestamp(runner):
+    import re
+
+    mock_info = MagicMock()
+    with patch.dict("app.bot.runner._LEVEL_FNS", {"info": mock_info}), \
+         patch("app.bot.runner.logger.isEnabledFor", return_value=True):
+        runner._cycle_step("R_25", 2, 6, "Analyzing", emoji="*")
+    line = mock_info.call_args.args[0]
+    assert re.search(r"\] STEP 2/6 \| \d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} \| \* Analyzing$", line)
+
+
+def test_cycle_step_dispatches_by_level_and_defaults_to_info(runner):
+    fns = {"info": MagicMock(), "error": MagicMock()}
+    with patch.dict("app.bot.runner._LEVEL_FNS", fns), \
+         patch("app.bot.runner.logger.isEnabledFor", return_value=True):
+        runner._cycle_step("SYSTEM", 1, 6, "boom", level="error")
+        runner._cycle_step("SYSTEM", 1, 6, "odd", level="verbose")
+    assert fns["error"].call_count == 1
+    assert fns["info"].call_count == 1
+
+
+def test_cycle_step_formats_args_lazily(runner):
+    mock_info = MagicMock()
+    with patch.dict("app.bot.runner._LEVEL_FNS", {"info": mock_info}):
+        with patch("app.bot.runner.logger.isEnabledFor", return_value=True):
+            runner._cycle_step("R_25", 6, 6, "P&L: $%.2f | %s", 1.234, "won", emoji="*")
+        assert mock_info.call_args.args[0].endswith("* P&L: $1.23 | won")
+
+        mock_info.reset_mock()
+        with patch("app.bot.runner.logger.isEnabledFor", return_value=False), \
+             patch("app.bot.runner.time.strftime") as strftime:
+            runner._cycle_step("R_25", 6, 6, "P&L: $%.2f", 1.0, emoji="*")
+        mock_info.assert_not_called()
+        strftime.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_decision_payload_does_not_share_base_dict(runner, monkeypatch):
+    mock_em = AsyncMock()
+    monkeypatch.setattr("app.bot.runner.event_manager", mock_em)
+
+    await runner._broadcast_decision("R_25", "scan", "no_trade")
+    await runner._broadcast_decision("R_50", "risk", "no_trade", reason="cooldown")
+    await runner._flush_notifications()
+
+    first, second = [c.args[0] for c in mock_em.broadcast.await_args_list]
+    assert first["type"] == "bot_decision" and first["bot"] == "multiplier"
+    assert first["message"] == "no trade"
+    assert "reason" not in first
+    assert second["reason"] == "cooldown"
+    assert first is not second
+    assert "symbol" not in BotRunner._DECISION_BASE
+
+
+def test_log_prefix_is_cached_and_follows_strategy_changes(runner):
+    runner.strategy = MagicMock()
+    runner.strategy.get_strategy_name.return_value = "Scalping"
+    first = runner._log_prefix("R_25")
+    assert first == "[Scalping][R_25]"
+    assert runner._log_prefix("R_25") is first
+
+    runner.strategy = MagicMock()
+    runner.strategy.get_strategy_name.return_value = "Conservative"
+    assert runner._log_prefix("R_25") == "[Conservative][R_25]"
+
+
+def test_should_emit_decision_prunes_stale_keys_when_full(runner):
+    runner._decision_state_max = 2
+    with patch("app.bot.runner.time.monotonic", side_effect=[0.0, 1.0, 1000.0, 1001.0]):
+        assert runner._should_emit_decision("a", "fp") is True
+        assert runner._should_emit_decision("b", "fp") is True
+        assert runner._should_emit_decision("c", "fp") is True
+        assert runner._should_emit_decision("c", "fp") is False
+    assert set(runner._decision_log_state) == {"c"}
+
+
+def test_default_risk_manager_matches_strategy(runner):
+    from conservative_risk_manager import ConservativeRiskManager
+    from scalping_risk_manager import ScalpingRiskManager
+
+    runner.strategy = MagicMock()
+    runner.strategy.get_strategy_name.return_value = "Scalping"
+    assert isinstance(runner._init_risk_manager_for_strategy(), ScalpingRiskManager)
+
+    runner.strategy = MagicMock()
+    runner.strategy.get_strategy_name.return_value = "Conservative"
+    assert isinstance(runner._init_risk_manager_for_strategy(), ConservativeRiskManager)
+
+
+def test_now_iso_reuses_string_within_the_same_second():
+    from app.bot.runner import _now_iso
+
+    with patch("app.bot.runner.time.time", side_effect=[1700000000.1, 1700000000.9, 1700000001.0]):
+        first = _now_iso()
+        assert _now_iso() is first
+        assert _now_iso() == "2023-11-14T22:13:21+00:00"
+    assert first == "2023-11-14T22:13:20+00:00"
+
+
+@pytest.mark.asyncio
+async def test_analyze_symbol_skips_analysis_once_cycle_claimed_elsewhere(runner):
+    runner.data_fetcher = MagicMock()
+    runner.data_fetcher.fetch_all_timeframes = AsyncMock(
+        return_value={tf: object() for tf in ["1m", "5m", "1h", "4h", "1d", "1w"]}
+    )
+    runner.strategy = MagicMock()
+    runner._cycle_signal_claimed = True
+    runner._cycle_winner_symbol = "R_50"
+
+    assert await runner._analyze_symbol("R_25") is False
+    runner.strategy.analyze.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_scan_cycle_parks_symbols_with_repeated_missing_timeframes(runner, monkeypatch):
+    monkeypatch.setattr("app.bot.runner.event_manager", AsyncMock())
+    runner._recover_runtime_active_trades = MagicMock()
+    runner.risk_manager = MagicMock()
+    runner.risk_manager.active_trades = []
+    runner.risk_manager.can_trade.return_value = (True, "ok")
+    runner.symbols = ["R_25", "R_50"]
+    runner.asset_config = {"R_25": {"multiplier": 100}}  # R_50 has no multiplier
+    runner.data_fetcher = MagicMock(fetch_all_timeframes=AsyncMock(return_value={"1m": object()}))
+
+    for _ in range(3):
+        await runner._multi_asset_scan_cycle()
+    assert runner.data_fetcher.fetch_all_timeframes.await_count == 3
+    assert all(c.args[0] == "R_25" for c in runner.data_fetcher.fetch_all_timeframes.await_args_list)
+
+    await runner._multi_asset_scan_cycle()
+    assert runner.data_fetcher.fetch_all_timeframes.await_count == 3
+
+    runner._symbol_skip_until["R_25"] = 0.0
+    await runner._multi_asset_scan_cycle()
+    assert runner.data_fetcher.fetch_all_timeframes.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_broadcast_decision_reports_suppressed_repeats(runner, monkeypatch):
+    mock_em = AsyncMock()
+    monkeypatch.setattr("app.bot.runner.event_manager", mock_em)
+
+    with patch("app.bot.runner.time.monotonic", side_effect=[0.0, 1.0, 2.0, 30.0]):
+        for _ in range(4):
+            await runner._broadcast_decision("R_25", "scan", "no_trade", throttle_key="k")
+    await runner._flush_notifications()
+
+    payloads = [c.args[0] for c in mock_em.broadcast.await_args_list]
+    assert len(payloads) == 2
+    assert "suppressed_count" not in payloads[0]
+    assert payloads[1]["suppressed_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_no_setup_log_throttle_uses_monotonic_clock(runner, monkeypatch):
+    monkeypatch.setattr("app.bot.runner.event_manager", AsyncMock())
+    frame = MagicMock(empty=False)
+    runner.strategy.get_required_timeframes = MagicMock(return_value=["1m"])
+    runner.strategy.analyze = MagicMock(return_value={"can_trade": False, "details": {"reason": "No setup"}})
+    market_data = {tf: frame for tf in ("1m", "5m", "1h", "4h", "1d", "1w")}
+    runner.data_fetcher = MagicMock(fetch_all_timeframes=AsyncMock(return_value=market_data))
+    runner.asset_config = {"R_25": {"multiplier": 100}}
+    runner._cycle_step = MagicMock()
+    clock = [1000.0]
+
+    with patch("app.bot.runner.time.monotonic", side_effect=lambda: clock[0]):
+        await runner._analyze_symbol("R_25")
+        clock[0] = 1030.0
+        await runner._analyze_symbol("R_25")
+        clock[0] = 1061.0
+        await runner._analyze_symbol("R_25")
+
+    no_setup = [c for c in runner._cycle_step.call_args_list if "No trade setup" in c.args[3]]
+    assert len(no_setup) == 2
+    assert runner.last_status_log["R_25"]["time"] == 1061.0
+
+
+@pytest.mark.asyncio
+async def test_persist_trade_result_alerts_on_failure(runner):
+    runner.telegram_bridge = MagicMock(notify_error=AsyncMock())
+
+    with patch("app.bot.runner.UserTradesService.save_trade", return_value={"id": 1}):
+        await runner._persist_trade_result("R_25", "c1", "won", {"contract_id": "c1"})
+    with patch("app.bot.runner.UserTradesService.save_trade", return_value=None):
+        await runner._persist_trade_result("R_25", "c1", "won", {"contract_id": "c1"})
+    with patch("app.bot.runner.UserTradesService.save_trade", side_effect=RuntimeError("db down")):
+        await runner._persist_trade_result("R_25", "c1", "won", {"contract_id": "c1"})
+    await runner._flush_notifications()
+
+    alerts = [c.args[0] for c in runner.telegram_bridge.notify_error.await_args_list]
+    assert alerts == [
+        "Trade executed but DB save failed: R_25 won",
+        "Trade executed but DB error: R_25 - db down",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_notify_deadline_defaults_to_two_seconds(runner):
+    loop = asyncio.get_running_loop()
+
+    async def ok_notify():
+        pass
+
+    with patch.object(loop, "call_later", wraps=loop.call_later) as call_later:
+        runner._notify(ok_notify())
+    await runner._flush_notifications()
+
+    assert call_later.call_args.args[0] == 2.0
+
+
+@pytest.mark.asyncio
+async def test_notify_circuit_breaker_drops_notifications_after_repeated_failures(runner):
+    runner._notify_timeout = 0.01
+    hung = asyncio.Event()
+
+    for _ in range(3):
+        runner._notify(hung.wait())
+    await runner._flush_notifications()
+    assert runner._notify_down_until > 0
+
+    delivered = []
+
+    async def ok_notify():
+        delivered.append(True)
+
+    skipped = ok_notify()
+    runner._notify(skipped)
+    assert not runner._notify_tasks
+    assert skipped.cr_frame is None  # closed, never awaited
+
+    runner._notify_down_until = 0.0
+    runner._notify(ok_notify())
+    await runner._flush_notifications()
+    assert delivered == [True]
+
+
+@pytest.mark.asyncio
+async def test_execute_detected_signal_enriches_signal_in_place(runner, monkeypatch):
+    monkeypatch.setattr("app.bot.runner.event_manager", AsyncMock())
+    runner.auto_execute_signals = True
+    runner.user_stake = 2.0
+    runner.asset_config = {"R_25": {"multiplier": 100}}
+    runner.risk_manager = MagicMock()
+    runner.risk_manager.can_open_trade.return_value = (True, "ok")
+    runner.risk_manager.get_statistics.return_value = {}
+    runner.trade_engine = MagicMock(
+        execute_trade=AsyncMock(return_value={"contract_id": "c1", "profit": 1.0, "status": "won"})
+    )
+    runner.telegram_bridge = MagicMock(notify_trade_closed=AsyncMock())
+    signal = {"signal": "UP", "details": {"passed_checks": ["trend"]}, "timestamp": "t0"}
+
+    with patch("app.bot.runner.UserTradesService.save_trade", return_value={"id": 1}):
+        assert await runner._execute_detected_signal("R_25", signal) is True
+        await runner._flush_notifications()
+
+    assert runner.risk_manager.can_open_trade.call_args.kwargs["signal_dict"] is signal
+    assert runner.trade_engine.execute_trade.await_args.args[0] is signal
+    assert signal["symbol"] == "R_25"
+    assert signal["stake"] == 2.0
+    assert signal["multiplier"] == 100
+    notified = runner.telegram_bridge.notify_trade_closed.await_args.args[0]
+    assert notified["contract_id"] == "c1"
+    assert notified["execution_reason"] == "Checks passed: trend"
+    assert notified["user_id"] == "test_user"
+
+
+def test_strategy_kwarg_names_cached_per_strategy_object(runner):
+    first = MagicMock()
+    first.get_required_timeframes.return_value = ["1m", "1h"]
+    runner.strategy = first
+    assert runner._get_strategy_kwarg_names() == {"1m": "data_1m", "1h": "data_1h"}
+    runner._get_strategy_kwarg_names()
+    assert first.get_required_timeframes.call_count == 1
+
+    second = MagicMock()
+    second.get_required_timeframes.return_value = ["5m"]
+    runner.strategy = second
+    assert runner._get_strategy_kwarg_names() == {"5m": "data_5m"}
+
+
+@pytest.mark.asyncio
+async def test_missing_timeframes_reported_in_required_order(runner, monkeypatch):
+    mock_em = AsyncMock()
+    monkeypatch.setattr("app.bot.runner.event_manager", mock_em)
+    runner.data_fetcher = MagicMock(
+        fetch_all_timeframes=AsyncMock(return_value={"1m": object(), "1h": object(), "1d": object()})
+    )
+
+    assert await runner._analyze_symbol("R_25") is False
+    await runner._flush_notifications()
+
+    payload = mock_em.broadcast.await_args.args[0]
+    assert payload["details"]["missing_timeframes"] == ["5m", "4h", "1w"]
+
+
+@pytest.mark.asyncio
+async def test_trade_close_path_reuses_resolved_strategy_name(runner, monkeypatch):
+    monkeypatch.setattr("app.bot.runner.event_manager", AsyncMock())
+    runner.strategy = MagicMock()
+    runner.strategy.get_strategy_name.return_value = "Conservative"
+    runner.auto_execute_signals = True
+    runner.user_stake = 1.0
+    runner.asset_config = {"R_25": {"multiplier": 100}}
+    runner.risk_manager = MagicMock()
+    runner.risk_manager.can_open_trade.return_value = (True, "ok")
+    runner.risk_manager.get_statistics.return_value = {}
+    runner.trade_engine = MagicMock(
+        execute_trade=AsyncMock(return_value={"contract_id": "c1", "profit": -1.0, "status": "lost"})
+    )
+    runner.telegram_bridge = MagicMock(notify_trade_closed=AsyncMock())
+
+    with patch("app.bot.runner.UserTradesService.save_trade", return_value={"id": 1}) as save:
+        assert await runner._execute_detected_signal("R_25", {"signal": "DOWN", "timestamp": "t0"}) is True
+        await runner._flush_notifications()
+
+    assert runner.strategy.get_strategy_name.call_count == 1
+    assert save.call_args.args[1]["strategy_type"] == "Conservative"
+    assert runner.telegram_bridge.notify_trade_closed.await_args.kwargs["strategy_type"] == "Conservative"
+
+
+def test_symbol_counters_are_counters_and_survive_scope_sync(runner):
+    from collections import Counter
+
+    runner.errors_by_symbol["NOT_IN_UNIVERSE"] += 1
+    assert isinstance(runner.errors_by_symbol, Counter)
+    assert runner.errors_by_symbol["NOT_IN_UNIVERSE"] == 1
+
+    runner.strategy = MagicMock()
+    runner.strategy.get_symbols.return_value = ["R_25"]
+    runner.strategy.get_asset_config.return_value = {}
+    runner.signals_by_symbol["R_25"] += 2
+    runner._sync_strategy_scope()
+    assert isinstance(runner.signals_by_symbol, Counter)
+    assert runner.signals_by_symbol["R_25"] == 2
+    assert runner.errors_by_symbol == {"R_25": 0}
+
+
+@pytest.mark.asyncio
+async def test_trade_save_runs_in_background_and_flush_waits(runner):
+    runner.telegram_bridge = MagicMock(notify_error=AsyncMock())
+    release = asyncio.Event()
+    saved = []
+
+    async def slow_persist(*args):
+        await release.wait()
+        saved.append(args)
+
+    runner._persist_trade_result = slow_persist
+    runner._persist_in_background("R_25", "c1", "won", {"contract_id": "c1"})
+    assert len(runner._persist_tasks) == 1
+    assert saved == []
+
+    release.set()
+    await runner._flush_notifications()
+    assert saved == [("R_25", "c1", "won", {"contract_id": "c1"})]
+    assert not runner._persist_tasks
+
+
+@pytest.mark.asyncio
+async def test_notify_error_coalesces_repeats_per_key(runner):
+    runner.telegram_bridge = MagicMock(notify_error=AsyncMock())
+    runner._error_alert_window = 0.05
+
+    runner._notify_error("R_25:db", "first")
+    runner._notify_error("R_25:db", "second")
+    runner._notify_error("R_25:db", "third")
+    runner._notify_error("R_50:db", "other symbol")
+    await asyncio.sleep(0.1)
+    await runner._flush_notifications()
+
+    alerts = [c.args[0] for c in runner.telegram_bridge.notify_error.await_args_list]
+    assert alerts == [
+        "first",
+        "other symbol",
+        "third (repeated 2x in the last 0s)",
+    ]
+    assert runner._error_alerts["R_25:db"]["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_no_setup_repeat_skips_reason_formatting(runner, monkeypatch):
+    monkeypatch.setattr("app.bot.runner.event_manager", AsyncMock())
+    market_data = {tf: MagicMock(empty=False) for tf in ("1m", "5m", "1h", "4h", "1d", "1w")}
+    runner.data_fetcher = MagicMock(fetch_all_timeframes=AsyncMock(return_value=market_data))
+    runner.strategy.get_required_timeframes = MagicMock(return_value=["1m"])
+    runner.strategy.analyze = MagicMock(
+        side_effect=lambda **_k: {"can_trade": False, "details": {"reason": "No setup", "passed_checks": ["A"]}}
+    )
+    runner._cycle_step = MagicMock()
+
+    with patch.object(BotRunner, "_format_no_setup_reason", wraps=BotRunner._format_no_setup_reason) as fmt:
+        await runner._analyze_symbol("R_25")
+        await runner._analyze_symbol("R_25")
+        assert fmt.call_count == 1
+
+        runner.strategy.analyze.side_effect = lambda **_k: {
+            "can_trade": False, "details": {"reason": "No setup", "passed_checks": ["A", "B"]}
+        }
+        await runner._analyze_symbol("R_25")
+
+    assert runner.last_status_log["R_25"]["msg"] == "No setup (Checks Passed: A, B)"
+    no_setup = [c for c in runner._cycle_step.call_args_list if "No trade setup" in c.args[3]]
+    assert len(no_setup) == 2
+
+
+@pytest.mark.asyncio
+async def test_analyze_symbol_tolerates_null_signal_details(runner, monkeypatch):
+    monkeypatch.setattr("app.bot.runner.event_manager", AsyncMock())
+    market_data = {tf: MagicMock(empty=False) for tf in ("1m", "5m", "1h", "4h", "1d", "1w")}
+    runner.data_fetcher = MagicMock(fetch_all_timeframes=AsyncMock(return_value=market_data))
+    runner.strategy.get_required_timeframes = MagicMock(return_value=["1m"])
+    runner.strategy.analyze = MagicMock(return_value={"can_trade": False, "details": None})
+
+    assert await runner._analyze_symbol("R_25") is False
+    assert runner.last_status_log["R_25"]["msg"] == "Unknown"
+
+
+def test_module_bot_runner_is_built_lazily_once():
+    import app.bot.runner as runner_module
+
+    runner_module.get_bot_runner.cache_clear()
+    assert "bot_runner" not in vars(runner_module)
+    with patch.object(runner_module, "BotRunner") as runner_cls:
+        first = runner_module.bot_runner
+        second = runner_module.get_bot_runner()
+    assert first is second
+    runner_cls.assert_called_once_with()
+    runner_module.get_bot_runner.cache_clear()
+    with pytest.raises(AttributeError):
+        runner_module.not_a_runner
+
+
+@pytest.mark.asyncio
+async def test_startup_balance_fetch_overlaps_position_restore(runner):
+    restore_started = asyncio.Event()
+    balance_started = asyncio.Event()
+
+    async def check_positions(_engine):
+        restore_started.set()
+        await asyncio.wait_for(balance_started.wait(), timeout=1)
+        return False
+
+    async def get_balance():
+        balance_started.set()
+        await asyncio.wait_for(restore_started.wait(), timeout=1)
+        return 250.0
+
+    runner.risk_manager = MagicMock(check_for_existing_positions=check_positions)
+    runner._reconcile_active_trades_on_startup = AsyncMock()
+    runner.data_fetcher = MagicMock(get_balance=get_balance)
+    runner.state = MagicMock()
+
+    balance, _ = await asyncio.gather(
+        runner._fetch_initial_balance("Conservative"),
+        runner._restore_open_positions("Conservative"),
+    )
+
+    assert balance == 250.0
+    runner.state.update_balance.assert_called_once_with(250.0)
+    runner._reconcile_active_trades_on_startup.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_startup_balance_fetch_failure_returns_zero(runner):
+    runner.data_fetcher = MagicMock(get_balance=AsyncMock(side_effect=RuntimeError("down")))
+    assert await runner._fetch_initial_balance("Conservative") == 0.0
+
+
+@pytest.mark.asyncio
+async def test_broadcast_decision_skipped_without_audience(runner, monkeypatch):
+    from types import SimpleNamespace
+
+    em = SimpleNamespace(broadcast=AsyncMock(), active_connections={}, event_handlers={})
+    monkeypatch.setattr("app.bot.runner.event_manager", em)
+
+    await runner._broadcast_decision("R_25", "scan", "no_trade", throttle_key="R_25:scan")
+    em.broadcast.assert_not_awaited()
+    assert not runner._decision_log_state
+
+    em.event_handlers["bot_decision"] = [AsyncMock()]
+    await runner._broadcast_decision("R_25", "scan", "no_trade", throttle_key="R_25:scan")
+    await runner._flush_notifications()
+    em.broadcast.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_decision_does_not_wait_for_slow_clients(runner, monkeypatch):
+    release = asyncio.Event()
+
+    async def slow_broadcast(_payload):
+        await release.wait()
+
+    mock_em = MagicMock(broadcast=slow_broadcast)
+    monkeypatch.setattr("app.bot.runner.event_manager", mock_em)
+    runner._decision_backlog_max = 2
+
+    for symbol in ("R_10", "R_25", "R_50"):
+        await asyncio.wait_for(runner._broadcast_decision(symbol, "scan", "no_trade"), timeout=1)
+
+    assert len(runner._decision_tasks) == 2
+    release.set()
+    await runner._flush_notifications()
+    assert not runner._decision_tasks
+
+
+def test_runtime_recovery_throttle_uses_monotonic_clock(runner):
+    runner.account_id = "u1"
+    runner.risk_manager = MagicMock()
+    clock = [500.0]
+    with patch("app.bot.runner.time.monotonic", side_effect=lambda: clock[0]), \
+         patch("app.bot.runner.UserTradesService.get_user_active_trades", return_value=[]) as load:
+        runner._recover_runtime_active_trades()
+        clock[0] = 510.0
+        runner._recover_runtime_active_trades()
+        clock[0] = 516.0
+        runner._recover_runtime_active_trades()
+    assert load.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_with_user_context_sets_once_and_reuses_inherited_context(runner):
+    from app.bot.runner import with_user_context
+    from app.core.context import bot_type_var, user_id_var
+
+    runner.account_id = "u1"
+    runner.strategy = MagicMock()
+    runner.strategy.get_strategy_name.return_value = "Scalping"
+    seen = []
+
+    @with_user_context
+    async def probe(self):
+        seen.append((user_id_var.get(), bot_type_var.get()))
+
+    with patch("app.bot.runner.user_id_var", MagicMock(wraps=user_id_var)) as wrapped_var:
+        await probe(runner)
+        assert wrapped_var.set.call_count == 1
+        assert user_id_var.get() is None
+
+        token_user = user_id_var.set("u1")
+        token_bot = bot_type_var.set("scalping")
+        try:
+            wrapped_var.set.reset_mock()
+            await probe(runner)
+            wrapped_var.set.assert_not_called()
+        finally:
+            bot_type_var.reset(token_bot)
+            user_id_var.reset(token_user)
+
+    assert seen == [("u1", "scalping"), ("u1", "scalping")]
+
+
+@pytest.mark.asyncio
+async def test_scan_cycle_logs_gate_blocked_symbols_once(runner, monkeypatch):
+    monkeypatch.setattr("app.bot.runner.event_manager", AsyncMock())
+    runner._recover_runtime_active_trades = MagicMock()
+    runner.risk_manager = MagicMock()
+    runner.risk_manager.active_trades = []
+    # Global gate open, per-symbol re-check closed for every symbol
+    runner.risk_manager.can_trade.side_effect = lambda symbol=None: (symbol is None, "cooldown")
+    runner.symbols = ["R_10", "R_25", "R_50"]
+    runner.asset_config = {s: {"multiplier": 100} for s in runner.symbols}
+    runner._analyze_symbol = AsyncMock()
+
+    with patch("app.bot.runner.logger.debug") as debug:
+        await runner._multi_asset_scan_cycle()
+
+    runner._analyze_symbol.assert_not_called()
+    gate_logs = [c for c in debug.call_args_list if "Global state changed" in c.args[0]]
+    assert len(gate_logs) == 1
+    assert gate_logs[0].args[2:] == (3, ["R_10", "R_25", "R_50"])
+
+
+@pytest.mark.asyncio
+async def test_execute_detected_signal_uses_supplied_passed_checks(runner, monkeypatch):
+    monkeypatch.setattr("app.bot.runner.event_manager", AsyncMock())
+    runner.auto_execute_signals = True
+    runner.user_stake = 1.0
+    runner.asset_config = {"R_25": {"multiplier": 100}}
+    runner.risk_manager = MagicMock()
+    runner.risk_manager.can_open_trade.return_value = (True, "ok")
+    runner.trade_engine = MagicMock(execute_trade=AsyncMock(return_value=None))
+    signal = {"signal": "UP", "details": None}
+
+    await runner._execute_detected_signal("R_25", signal, ["trend", "retest"])
+    assert signal["execution_reason"] == "Checks passed: trend, retest"
+
+    signal = {"signal": "UP", "details": None}
+    await runner._execute_detected_signal("R_25", signal)
+    assert signal["execution_reason"] == "All strategy checks aligned and risk gate passed"
@@ -103,3 +103,33 @@ async def test_ws_logging_handler_repairs_mojibake_message():
         assert mock_broadcast.await_count == 1
         payload = mock_broadcast.await_args.args[0]
         assert payload["message"] == "✅ Trade Engine connected"
+
+
+def test_setup_api_logger_writes_console_through_queue_listener(capsys):
+    import sys
+    from logging.handlers import QueueHandler
+
+    from app.core.logging import setup_api_logger
+
+    root = logging.getLogger()
+    saved_handlers, saved_filters = list(root.handlers), list(root.filters)
+    saved_level = root.level
+    saved_flag = getattr(root, "_r50_api_configured", False)
+    root._r50_api_configured = False
+    try:
+        with patch("app.core.logging.atexit.register") as register:
+            setup_api_logger()
+        queue_handlers = [h for h in root.handlers if isinstance(h, QueueHandler)]
+        assert len(queue_handlers) == 1
+
+        listener = register.call_args.args[0].__self__
+        assert listener.handlers[0].stream is sys.stdout
+        record = logging.LogRecord("queue.test", logging.INFO, __file__, 1, "queued line", None, None)
+        queue_handlers[0].handle(record)
+        listener.stop()
+        assert "queued line" in capsys.readouterr().out
+    finally:
+        root.handlers[:] = saved_handlers
+        root.filters[:] = saved_filters
+        root.setLevel(saved_level)
+        root._r50_api_configured = saved_flag
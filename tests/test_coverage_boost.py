@@ -59,18 +59,79 @@ async def test_event_manager():
 async def test_event_manager_broadcast_ws():
     em = EventManager()
     mock_ws1 = AsyncMock()
-    mock_ws1.send_json = AsyncMock()
+    mock_ws1.send_text = AsyncMock()
     em.active_connections[mock_ws1] = "user1"
     em.active_connections[AsyncMock()] = None
     
     await em.broadcast({"type": "msg", "account_id": "user1", "text": "hello"})
-    mock_ws1.send_json.assert_called_once()
+    mock_ws1.send_text.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_event_manager_broadcast_batch_sends_one_frame_per_event():
+    em = EventManager()
+    handler = AsyncMock()
+    em.register("notification", handler)
+    ws1 = AsyncMock()
+    ws2 = AsyncMock()
+    em.active_connections[ws1] = "user1"
+    em.active_connections[ws2] = "user2"
+
+    events = [
+        {"type": "trade_closed", "account_id": "user1"},
+        {"type": "notification", "account_id": "user1"},
+        {"type": "statistics", "account_id": "user1"},
+    ]
+    await em.broadcast_batch(events)
+
+    # Clients expect one event per frame, in broadcast order
+    assert [json.loads(c.args[0]) for c in ws1.send_text.call_args_list] == events
+    ws2.send_text.assert_not_called()
+    handler.assert_awaited_once_with(events[1])
+
+@pytest.mark.asyncio
+async def test_event_manager_broadcast_encodes_shared_frames_once():
+    from datetime import datetime as dt
+
+    em = EventManager()
+    clients = [AsyncMock() for _ in range(3)]
+    for ws in clients:
+        em.active_connections[ws] = "user1"
+    message = {"type": "statistics", "account_id": "user1", "at": dt(2024, 1, 1)}
+
+    with patch.object(EventManager, "_encode", wraps=EventManager._encode) as encode:
+        await em.broadcast(message)
+
+    assert encode.call_count == 1
+    texts = {ws.send_text.call_args.args[0] for ws in clients}
+    assert len(texts) == 1
+    assert json.loads(texts.pop())["at"].startswith("2024-01-01")
+
+@pytest.mark.asyncio
+async def test_event_manager_broadcast_batch_encodes_each_event_once():
+    em = EventManager()
+    user1_clients = [AsyncMock(), AsyncMock()]
+    for ws in user1_clients:
+        em.active_connections[ws] = "user1"
+    other = AsyncMock()
+    em.active_connections[other] = "user2"
+    events = [
+        {"type": "trade_closed", "account_id": "user1"},
+        {"type": "bot_status", "status": "running"},
+    ]
+
+    with patch.object(EventManager, "_encode", wraps=EventManager._encode) as encode:
+        await em.broadcast_batch(events)
+
+    assert encode.call_count == 2
+    for ws in user1_clients:
+        assert [json.loads(c.args[0]) for c in ws.send_text.call_args_list] == events
+    assert [json.loads(c.args[0]) for c in other.send_text.call_args_list] == [events[1]]
 
 @pytest.mark.asyncio
 async def test_event_manager_errors():
     em = EventManager()
     mock_ws = AsyncMock()
-    mock_ws.send_json.side_effect = RuntimeError("Failure")
+    mock_ws.send_text.side_effect = RuntimeError("Failure")
     em.active_connections[mock_ws] = "user1"
     await em._send_message(mock_ws, {"m": 1})
     assert mock_ws not in em.active_connections
@@ -158,6 +219,28 @@ def test_bot_state_basics():
     state.update_statistics({"total_trades": 5})
     assert state.get_statistics()["total_trades"] == 5
 
+def test_bot_state_update_trade_moves_to_bounded_history():
+    state = BotState()
+    state.max_history = 2
+    history = state.trade_history
+    for cid in ("a", "b", "c"):
+        state.add_trade({"contract_id": cid})
+        state.update_trade(cid, {"status": "won", "profit": 1.5})
+    state.update_trade("missing", {"status": "lost"})
+
+    assert state.get_active_trades() == []
+    assert [t["contract_id"] for t in state.get_trade_history()] == ["c", "b"]
+    assert state.trade_history is history
+    assert state.trade_history[0]["pnl"] == 1.5 and state.trade_history[0]["status"] == "won"
+
+def test_bot_state_update_trade_moves_trade_in_one_critical_section():
+    state = BotState()
+    state.add_trade({"contract_id": "a"})
+    state._lock = MagicMock()
+    state.update_trade("a", {"status": "lost", "profit": -1.0})
+    assert state._lock.__enter__.call_count == 1
+    assert state.trade_history[0]["contract_id"] == "a"
+
 # --- app.bot.runner Tests ---
 def test_bot_runner_minimal_init():
     strategy = MagicMock()
@@ -1,4 +1,5 @@
 import asyncio
+import time
 import types
 from datetime import datetime
 from types import SimpleNamespace
@@ -35,7 +36,7 @@ async def test_runner_analyze_symbol_spam_suppression_and_trade_block(monkeypatc
         get_required_timeframes=lambda: ["1m", "5m", "1h", "4h", "1d", "1w"],
         analyze=lambda **_k: {"can_trade": False, "details": {"reason": "No setup", "passed_checks": ["A", "B"]}},
     )
-    r.last_status_log["R_25"] = {"msg": "No setup (Checks Passed: A, B)", "time": datetime.now()}
+    r.last_status_log["R_25"] = {"msg": "No setup (Checks Passed: A, B)", "time": time.monotonic()}
 
     out = await r._analyze_symbol("R_25")
     assert out is False
@@ -62,7 +63,7 @@ async def test_runner_analyze_symbol_spam_suppression_and_trade_block(monkeypatc
     r.trade_engine = SimpleNamespace(execute_trade=AsyncMock(return_value=None))
     r.user_stake = 1.0
     r.asset_config = {"R_25": {"multiplier": 100}}
-    monkeypatch.setattr("app.bot.runner.event_manager", SimpleNamespace(broadcast=AsyncMock()))
+    monkeypatch.setattr("app.bot.runner.event_manager", SimpleNamespace(broadcast=AsyncMock(), active_connections={"ws": "u1"}, event_handlers={}))
     r.telegram_bridge = SimpleNamespace(notify_signal=AsyncMock(), notify_error=AsyncMock())
     assert await r._analyze_symbol("R_25") is False
 
@@ -95,7 +96,8 @@ async def test_runner_analyze_symbol_db_save_false_and_db_exception(monkeypatch)
     )
     r.user_stake = 1.0
     r.asset_config = {"R_25": {"multiplier": 100}}
-    ev = SimpleNamespace(broadcast=AsyncMock())
+    ev = SimpleNamespace(broadcast=AsyncMock(), broadcast_batch=AsyncMock(),
+                         active_connections={"ws": "u1"}, event_handlers={})
     monkeypatch.setattr("app.bot.runner.event_manager", ev)
     r.telegram_bridge = SimpleNamespace(
         notify_signal=AsyncMock(),
@@ -105,10 +107,12 @@ async def test_runner_analyze_symbol_db_save_false_and_db_exception(monkeypatch)
 
     with patch("app.bot.runner.UserTradesService.save_trade", return_value=False):
         assert await r._analyze_symbol("R_25") is True
+        await r._flush_notifications()
         assert r.telegram_bridge.notify_error.await_count >= 1
 
     with patch("app.bot.runner.UserTradesService.save_trade", side_effect=RuntimeError("db err")):
         assert await r._analyze_symbol("R_25") is True
+        await r._flush_notifications()
         assert r.telegram_bridge.notify_error.await_count >= 2
 
 
@@ -225,3 +229,32 @@ async def test_manager_risefall_lock_denied_stop_timeout_and_stop_all(monkeypatc
     with patch("risefallbot.rf_bot.stop", new=MagicMock()):
         await bm.stop_all()
     assert "u4" not in bm._rf_tasks
+
+
+@pytest.mark.asyncio
+async def test_manager_user_strategy_cached_until_invalidated():
+    bm = BotManager(max_concurrent_bots=5)
+    query = MagicMock()
+    query.select.return_value.eq.return_value.single.return_value.execute.return_value = SimpleNamespace(
+        data={"active_strategy": "Scalping"}
+    )
+    fake_supabase = types.SimpleNamespace(table=MagicMock(return_value=query))
+    with patch("app.core.supabase.supabase", fake_supabase):
+        assert await bm._get_user_strategy("u1") == "Scalping"
+        assert await bm._get_user_strategy("u1") == "Scalping"
+        assert fake_supabase.table.call_count == 1
+
+        bm.invalidate_user_strategy("u1")
+        assert await bm._get_user_strategy("u1") == "Scalping"
+        assert fake_supabase.table.call_count == 2
+
+
+def test_manager_risefall_uptime_uses_monotonic_clock():
+    bm = BotManager(max_concurrent_bots=5)
+    bm._rf_tasks["u1"] = SimpleNamespace(done=lambda: False)
+    bm._rf_stakes["u1"] = 2.0
+    bm._rf_start_times["u1"] = 100.0
+    with patch("app.bot.manager.time.monotonic", return_value=145.5):
+        st = bm.get_status("u1")
+    assert st["is_running"] is True
+    assert st["uptime_seconds"] == 45
@@ -160,7 +160,8 @@ async def test_phase6_runner_analyze_symbol_additional_branches(monkeypatch):
     r.asset_config = {"R_25": {"multiplier": 10}}
 
     # patch globals used inside method
-    mock_em = SimpleNamespace(broadcast=AsyncMock())
+    mock_em = SimpleNamespace(broadcast=AsyncMock(), broadcast_batch=AsyncMock(),
+                              active_connections={"ws": "u1"}, event_handlers={})
     monkeypatch.setattr("app.bot.runner.event_manager", mock_em)
 
     class _UTS:
@@ -197,4 +198,5 @@ async def test_phase6_runner_analyze_symbol_additional_branches(monkeypatch):
     )
     r.trade_engine = SimpleNamespace(execute_trade=AsyncMock(return_value={"contract_id": "c1", "profit": 0.5, "status": "won", "sell_time": 1, "current_spot": 101.0}))
     assert await r._analyze_symbol("R_25") is True
+    await r._flush_notifications()
     assert r.telegram_bridge.notify_error.await_count >= 1
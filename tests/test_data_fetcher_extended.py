@@ -1,6 +1,8 @@
 import pytest
 import asyncio
 import json
+import pandas as pd
+import config
 from unittest.mock import patch, AsyncMock, MagicMock
 from data_fetcher import DataFetcher
 
@@ -91,3 +93,107 @@ async def test_authorize_failure(fetcher):
     success = await fetcher.authorize()
     assert success is False
     assert fetcher.last_error == "Auth failed: Invalid token"
+
+
+def _candles(step, n, end=1_700_000_000):
+    ts = list(range(end - step * n, end, step))
+    df = pd.DataFrame({"timestamp": ts, "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5})
+    df["datetime"] = pd.to_datetime(df["timestamp"], unit="s")
+    return df
+
+
+_STEPS = {"1m": 60, "1h": 3600, "1d": 86400}
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_timeframes_requests_sources_concurrently(fetcher):
+    in_flight = 0
+    peak = 0
+
+    async def fake_fetch(symbol, tf, count):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if tf == "1h":
+            raise RuntimeError("boom")
+        return _candles(_STEPS[tf], count)
+
+    fetcher.fetch_timeframe = fake_fetch
+    data = await fetcher.fetch_all_timeframes("R_25")
+
+    assert peak == 3
+    assert set(data) == {"1m", "5m", "1d", "1w"}
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_timeframes_derives_5m_4h_1w_locally(fetcher):
+    requested = {}
+
+    async def fake_fetch(symbol, tf, count):
+        requested[tf] = count
+        return _candles(_STEPS[tf], count)
+
+    fetcher.fetch_timeframe = fake_fetch
+    data = await fetcher.fetch_all_timeframes("R_25")
+
+    assert set(requested) == {"1m", "1h", "1d"}
+    assert set(data) == {"1m", "5m", "1h", "4h", "1d", "1w"}
+    for tf, step in {"5m": 300, "4h": 14400}.items():
+        assert (data[tf]["timestamp"] % step == 0).all()
+        assert len(data[tf]) == getattr(config, f"CANDLES_{tf.upper()}")
+    assert len(data["1m"]) == config.CANDLES_1M
+    assert len(data["1h"]) == config.CANDLES_1H
+    assert len(data["1d"]) == config.CANDLES_1D
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_timeframes_reuses_higher_timeframes_within_bar(fetcher):
+    calls = []
+
+    async def fake_fetch(symbol, tf, count):
+        calls.append((tf, count))
+        return _candles(_STEPS[tf], count)
+
+    fetcher.fetch_timeframe = fake_fetch
+    with patch("data_fetcher.time.time", return_value=1_700_000_000):
+        await fetcher.fetch_all_timeframes("R_25")
+        calls.clear()
+        data = await fetcher.fetch_all_timeframes("R_25")
+    # Closed higher-timeframe bars are reused; only their tail is refetched
+    assert sorted(tf for tf, count in calls if count == 2) == ["1d", "1h"]
+    assert [tf for tf, count in calls if count != 2] == ["1m"]
+    assert set(data) == {"1m", "5m", "1h", "4h", "1d", "1w"}
+    assert len(data["1h"]) == config.CANDLES_1H
+    assert len(data["1d"]) == config.CANDLES_1D
+
+    calls.clear()
+    with patch("data_fetcher.time.time", return_value=1_700_000_000 + 3600):
+        await fetcher.fetch_all_timeframes("R_25")
+    assert sorted(tf for tf, count in calls if count > 2) == ["1h", "1m"]
+
+
+@pytest.mark.asyncio
+async def test_cached_higher_timeframe_keeps_forming_bar_current(fetcher):
+    now = 1_700_000_000
+    bucket_start = now // 3600 * 3600
+    closes = iter([1.5, 1.9])
+
+    async def fake_fetch(symbol, tf, count):
+        # History ends with the bar forming in the current hour
+        df = _candles(3600, count, end=bucket_start + 3600)
+        df.loc[df.index[-1], "close"] = next(closes)
+        return df
+
+    fetcher.fetch_timeframe = fake_fetch
+    with patch("data_fetcher.time.time", return_value=now):
+        first = await fetcher._fetch_timeframe_cached("R_25", "1h", 50)
+        second = await fetcher._fetch_timeframe_cached("R_25", "1h", 50)
+
+    cached_closed = fetcher._htf_cache[("R_25", "1h")][1]
+    assert (cached_closed["timestamp"] < bucket_start).all()
+    assert first["close"].iloc[-1] == 1.5
+    assert second["close"].iloc[-1] == 1.9
+    assert second["timestamp"].iloc[-1] == bucket_start
+    assert len(second) == 50 and second["timestamp"].is_unique
@@ -407,3 +407,37 @@ async def test_cleanup_removes_done_rf_tasks(bot_manager):
 
 
 
+
+
+@pytest.mark.asyncio
+async def test_stop_keeps_rf_task_registered_during_graceful_wait(bot_manager):
+    """
+    _stop_risefall_bot() must keep the task visible to get_status() until the
+    old loop has actually exited, so a concurrent start cannot launch a twin.
+    """
+    user_id = "test-graceful-visible"
+    release = asyncio.Event()
+
+    async def slow_exit():
+        # Ignores the stop signal until the in-flight lifecycle "finishes"
+        await release.wait()
+
+    task = asyncio.create_task(slow_exit())
+    bot_manager._rf_tasks[user_id] = task
+    bot_manager._rf_start_times[user_id] = 0.0
+    bot_manager._rf_stakes[user_id] = 1.0
+
+    with patch("risefallbot.rf_bot.stop"), \
+         patch("risefallbot.rf_bot._release_session_lock", new_callable=AsyncMock), \
+         patch("app.bot.events.event_manager", new_callable=AsyncMock):
+        stopper = asyncio.create_task(bot_manager._stop_risefall_bot(user_id))
+        await asyncio.sleep(0.05)
+
+        assert bot_manager._rf_tasks.get(user_id) is task
+        assert bot_manager.get_status(user_id)["is_running"] is True
+
+        release.set()
+        result = await stopper
+
+    assert result["success"] is True
+    assert user_id not in bot_manager._rf_tasks
@@ -41,6 +41,7 @@ async def test_notify_trade_close(notifier):
     }
     # Pass trade_info as both result and trade_info to satisfy signature
     await notifier.notify_trade_close(trade_info, trade_info)
+    await notifier._close_flush_task
     assert notifier.bot.send_message.called
     args, kwargs = notifier.bot.send_message.call_args
     assert "TRADE CLOSED" in kwargs['text']
@@ -151,6 +151,7 @@ async def test_notify_trade_closed_uses_clean_outcome_emoji(mock_bot):
         trade_info = {"symbol": "R_25", "direction": "UP", "entry_price": 100.0, "stake": 10.0}
 
         await notifier.notify_trade_closed(result, trade_info)
+        await notifier._close_flush_task
 
         sent = notifier.bot.send_message.call_args.kwargs["text"]
         assert "TRADE CLOSED (WON): R_25" in sent
@@ -213,6 +214,7 @@ async def test_notify_trade_closed_dedups_same_contract_across_statuses(mock_bot
         trade_info = {"symbol": "R_25", "direction": "DOWN", "entry_price": 100.0, "stake": 10.0}
         await notifier.notify_trade_closed({"status": "won", "profit": 0.85, "contract_id": "dup-1"}, trade_info)
         await notifier.notify_trade_closed({"status": "sold", "profit": 0.95, "contract_id": "dup-1"}, trade_info)
+        await notifier._close_flush_task
 
         assert notifier.bot.send_message.call_count == 1
 
@@ -227,6 +229,7 @@ async def test_notify_trade_closed_formats_missing_duration_as_na(mock_bot):
         trade_info = {"symbol": "R_25", "direction": "DOWN", "entry_price": 100.0, "stake": 10.0, "duration": None}
 
         await notifier.notify_trade_closed(result, trade_info)
+        await notifier._close_flush_task
 
         sent = notifier.bot.send_message.call_args.kwargs["text"]
         assert "Duration: N/A" in sent
@@ -255,3 +258,82 @@ async def test_notify_trade_opened_manual_import_prefers_sync_label_and_na_targe
         sent = notifier.bot.send_message.call_args.kwargs["text"]
         assert "Entry Source: <b>Manual Import (Sync)</b>" in sent
         assert "Target/Risk: N/A / N/A (N/A)" in sent
+
+@pytest.mark.asyncio
+async def test_telegram_notifier_uses_pooled_session_and_closes(mock_bot):
+    with patch.dict("os.environ", {"TELEGRAM_BOT_TOKEN": "test_token", "TELEGRAM_CHAT_ID": "test_chat"}):
+        notifier = TelegramNotifier()
+        request = mock_bot.call_args.kwargs["request"]
+        assert request is not None
+        notifier.bot.shutdown = AsyncMock()
+        await notifier.close()
+        notifier.bot.shutdown.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_notify_trade_closed_coalesces_burst_into_one_send(mock_bot):
+    import asyncio
+
+    with patch.dict("os.environ", {"TELEGRAM_BOT_TOKEN": "test_token", "TELEGRAM_CHAT_ID": "test_chat"}):
+        notifier = TelegramNotifier()
+        notifier.bot.send_message = AsyncMock()
+        notifier.close_batch_window = 0.01
+        notifier.close_batch_max = 2
+
+        trade_info = {"symbol": "R_25", "direction": "UP", "entry_price": 100.0, "stake": 10.0}
+        await asyncio.gather(*[
+            notifier.notify_trade_closed({"status": "won", "profit": 1.0, "contract_id": f"b-{i}"}, trade_info)
+            for i in range(3)
+        ])
+        await notifier._close_flush_task
+
+        sent = [c.kwargs["text"] for c in notifier.bot.send_message.call_args_list]
+        assert len(sent) == 2
+        assert sent[0].count("TRADE CLOSED") == 2
+        assert "b-2" in sent[1]
+        assert not notifier._pending_closes
+
+
+@pytest.mark.asyncio
+async def test_trade_close_batch_survives_cancelled_caller_and_logs_failures(mock_bot):
+    import asyncio
+
+    with patch.dict("os.environ", {"TELEGRAM_BOT_TOKEN": "test_token", "TELEGRAM_CHAT_ID": "test_chat"}):
+        notifier = TelegramNotifier()
+        notifier.close_batch_window = 0.01
+        notifier.send_message = AsyncMock(side_effect=[RuntimeError("down"), True])
+        notifier.close_batch_max = 1
+
+        async def caller():
+            await notifier._send_trade_close("close-1")
+            await asyncio.sleep(30)  # e.g. the runner's notify timeout fires here
+
+        first = asyncio.create_task(caller())
+        await asyncio.sleep(0)
+        await notifier._send_trade_close("close-2")
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+
+        with patch("telegram_notifier.logger") as mock_logger:
+            await asyncio.wait_for(notifier._close_flush_task, timeout=1)
+
+        sent = [c.args[0] for c in notifier.send_message.await_args_list]
+        assert sent == ["close-1", "close-2"]
+        assert mock_logger.error.call_count == 1
+        assert notifier._close_flush_task is None
+        assert not notifier._pending_closes
+
+
+@pytest.mark.asyncio
+async def test_notify_bot_stopped_sends_after_pending_trade_closes(mock_bot):
+    with patch.dict("os.environ", {"TELEGRAM_BOT_TOKEN": "test_token", "TELEGRAM_CHAT_ID": "test_chat"}):
+        notifier = TelegramNotifier()
+        notifier.bot.send_message = AsyncMock()
+        notifier.close_batch_window = 0.01
+
+        await notifier._send_trade_close("close-1")
+        await notifier.notify_bot_stopped({"total_pnl": 1.0, "total_trades": 1})
+
+        sent = [c.kwargs["text"] for c in notifier.bot.send_message.call_args_list]
+        assert sent[0] == "close-1"
+        assert "BOT STOPPED" in sent[1]
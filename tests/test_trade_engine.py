@@ -437,3 +437,31 @@ async def test_execute_trade_carries_trade_metadata_to_final_status():
     assert out["multiplier"] == 160
     assert out["entry_source"] == "system"
     assert out["symbol"] == "R_25"
+
+
+@pytest.mark.asyncio
+async def test_execute_trade_records_open_even_if_cancelled_during_open():
+    engine = TradeEngine(api_token="TEST", app_id="1089")
+    rm = DummyRiskManager()
+    release = asyncio.Event()
+    trade = {"contract_id": "c-2", "stake": 1.0, "entry_spot": 100.0}
+
+    async def slow_open(**_kwargs):
+        await release.wait()
+        return trade
+
+    engine.open_trade = slow_open
+    engine.monitor_trade = AsyncMock()
+    signal = {"signal": "UP", "symbol": "R_25", "take_profit": 101.0, "stop_loss": 99.0, "stake": 1.0}
+
+    task = asyncio.create_task(engine.execute_trade(signal, rm))
+    await asyncio.sleep(0)
+    task.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0)
+
+    assert rm.opened is trade
+    engine.monitor_trade.assert_not_awaited()
@@ -102,9 +102,7 @@ class TradeEngine:
             )
             return False
         except Exception as e:
-            logger.error(f"❌ Failed to connect Trade Engine: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.error(f"❌ Failed to connect Trade Engine: {e}", exc_info=True)
             self.is_connected = False
             return False
     
@@ -119,8 +117,8 @@ class TradeEngine:
         if self.ws:
             try:
                 await self.ws.close()
-            except:
-                pass
+            except Exception as close_error:
+                logger.debug("Ignoring error closing stale socket: %s", close_error)
         
         self.is_connected = False
         await asyncio.sleep(min(2 ** self.reconnect_attempts, 30))
@@ -249,7 +247,7 @@ class TradeEngine:
                 return getattr(config, 'MULTIPLIER', 160)
             
             multiplier = self.asset_configs[symbol]['multiplier']
-            logger.debug(f"✅ {symbol} → {multiplier}x multiplier")
+            logger.debug("✅ %s → %sx multiplier", symbol, multiplier)
             return multiplier
             
         except Exception as e:
@@ -312,7 +310,7 @@ class TradeEngine:
                 "symbol": symbol
             }
             
-            logger.debug(f"📋 Requesting proposal for {symbol} ({multiplier}x multiplier)...")
+            logger.debug("📋 Requesting proposal for %s (%sx multiplier)...", symbol, multiplier)
             response = await self.send_request(proposal_request)
             
             if "error" in response:
@@ -349,7 +347,7 @@ class TradeEngine:
                 "price": max_price
             }
             
-            logger.debug(f"💳 Buying contract (max price: {format_currency(max_price)})...")
+            logger.debug("💳 Buying contract (max price: %s)...", format_currency(max_price))
             response = await self.send_request(buy_request)
             
             if "error" in response:
@@ -445,7 +443,7 @@ class TradeEngine:
                 }
             }
             
-            logger.debug(f"📤 Sending limit order to Deriv...")
+            logger.debug("📤 Sending limit order to Deriv...")
             response = await self.send_request(limit_request)
             
             if "error" in response:
@@ -718,7 +716,7 @@ class TradeEngine:
                 
                 # Apply TP/SL limits if provided
                 if tp_price and sl_price:
-                    logger.debug(f"TP: {tp_price:.4f} | SL: {sl_price:.4f}")
+                    logger.debug("TP: %.4f | SL: %.4f", tp_price, sl_price)
                     
                     # Validate R:R ratio
                     distance_to_tp = abs(tp_price - entry_spot)
@@ -759,11 +757,13 @@ class TradeEngine:
                 
             except Exception as e:
                 self.last_execution_reason = "open_trade_exception"
-                logger.error(f"❌ Error in open_trade for {symbol} (attempt {attempt + 1}): {e}")
+                # Traceback only once retries are exhausted
+                logger.error(
+                    f"❌ Error in open_trade for {symbol} (attempt {attempt + 1}): {e}",
+                    exc_info=attempt >= max_retries - 1,
+                )
                 if attempt < max_retries - 1:
                     continue
-                import traceback
-                logger.error(traceback.format_exc())
                 return None
         
         return None
@@ -909,7 +909,7 @@ class TradeEngine:
                         if final_status.get('date_start') and final_status.get('sell_time'):
                              try:
                                  duration = int(final_status['sell_time']) - int(final_status['date_start'])
-                             except:
+                             except (TypeError, ValueError):
                                  duration = int(elapsed)
                         else:
                             duration = int(elapsed)
@@ -937,7 +937,7 @@ class TradeEngine:
                     if status.get('date_start') and status.get('sell_time'):
                          try:
                              duration = int(status['sell_time']) - int(status['date_start'])
-                         except:
+                         except (TypeError, ValueError):
                              duration = int(elapsed)
                     else:
                         duration = int(elapsed)
@@ -965,9 +965,7 @@ class TradeEngine:
                 await asyncio.sleep(monitor_interval)
                 
         except Exception as e:
-            logger.error(f"❌ Error monitoring trade: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.error(f"❌ Error monitoring trade: {e}", exc_info=True)
             return None
     
     async def close_trade(self, contract_id: str) -> Optional[Dict]:
@@ -1027,6 +1025,17 @@ class TradeEngine:
             if hasattr(risk_manager, "risk_manager") and hasattr(risk_manager.risk_manager, "active_trades"):
                 risk_manager.risk_manager.active_trades = filtered
     
+    async def _open_and_record(self, risk_manager, **open_kwargs) -> Optional[Dict]:
+        """
+        Open a trade and register it with the risk manager as one unit.
+        Run under asyncio.shield by execute_trade so both steps complete
+        even if the caller is cancelled mid-way.
+        """
+        trade_info = await self.open_trade(**open_kwargs)
+        if trade_info:
+            risk_manager.record_trade_open(trade_info)
+        return trade_info
+
     async def execute_trade(self, signal: Dict, risk_manager) -> Optional[Dict]:
         """
         Execute complete trade cycle with TP/SL only exits
@@ -1140,16 +1149,21 @@ class TradeEngine:
                 logger.error(f"❌ Missing stake amount for {symbol}")
                 return None
                 
-            trade_info = await self.open_trade(
-                direction=direction,
-                stake=trade_stake,
-                symbol=symbol,
-                tp_price=tp_price,
-                sl_price=sl_price,
-                min_rr_ratio=min_rr_ratio,
-                strategy_type=strategy_type,
-                user_id=user_id,
-                execution_reason=execution_reason,
+            # Shielded so a cancel (e.g. stop_bot) cannot land between the
+            # broker buy and the local bookkeeping; monitoring stays cancellable.
+            trade_info = await asyncio.shield(
+                self._open_and_record(
+                    risk_manager,
+                    direction=direction,
+                    stake=trade_stake,
+                    symbol=symbol,
+                    tp_price=tp_price,
+                    sl_price=sl_price,
+                    min_rr_ratio=min_rr_ratio,
+                    strategy_type=strategy_type,
+                    user_id=user_id,
+                    execution_reason=execution_reason,
+                )
             )
             
             if not trade_info:
@@ -1171,9 +1185,6 @@ class TradeEngine:
                 sl_price,
             )
             
-            # Record with risk manager
-            risk_manager.record_trade_open(trade_info)
-            
             # Monitor trade until TP/SL hit
             final_status = await self.monitor_trade(
                 trade_info['contract_id'],
@@ -1216,14 +1227,12 @@ class TradeEngine:
             
         except Exception as e:
             self.last_execution_reason = "execute_trade_exception"
-            logger.error(f"❌ Error executing trade: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.error(f"❌ Error executing trade: {e}", exc_info=True)
             
             try:
                 self._unlock_trade_slot_on_failure(risk_manager, contract_id)
                 logger.info("🔓 Trade slot unlocked after error")
-            except:
-                pass
+            except Exception as unlock_error:
+                logger.debug("Trade slot unlock failed: %s", unlock_error)
             
             return None
@@ -497,7 +497,7 @@ def get_signal_emoji(signal) -> str:
     # Convert to string and uppercase safely
     try:
         signal_str = str(signal).upper()
-    except:
+    except Exception:
         return '⚪'
     
     # Map signals to emojis
@@ -528,7 +528,7 @@ def get_status_emoji(status) -> str:
     # Convert to string and lowercase safely
     try:
         status_str = str(status).lower()
-    except:
+    except Exception:
         return '❓'
     
     # Map status to emojis